@@ -18,7 +18,6 @@ import pytest
 from base.base_class import BaseClass
 from utilities.customLogger import LoggerFactory
 from utilities.session_manager import SessionManager
-from utilities.readProperties import ReadConfig
 
 
 logger = LoggerFactory.get_logger(__name__)
@@ -64,10 +63,13 @@ def driver(request):
     
     Session Cookie Strategy:
     1. Initialize fresh WebDriver
-    2. If valid cookies exist, load them
-    3. If cookies loaded, refresh browser to activate session
+    2. If valid cookies exist for (base URL, user, browser), load them
+       with their real expiry from the session vault. The user comes from
+       @pytest.mark.session_user("email"); unmarked tests share an
+       anonymous entry (Cloudflare / preference cookies, no login)
+    3. If cookies loaded, open the base URL with the session active
     4. If no cookies or load failed, let test open page normally
-    5. After test, save cookies for next run
+    5. After test, save cookies for next run (the auth cookie only for a marked user)
     
     This approach:
     - Reduces Cloudflare Turnstile challenges (not bypassing, just reusing)
@@ -101,7 +103,9 @@ def driver(request):
     driver_instance = base_class.initialize_driver()
     
     # ===== SESSION COOKIE REUSE =====
-    session_mgr = SessionManager(driver=driver_instance)
+    user_marker = request.node.get_closest_marker("session_user")
+    session_user = user_marker.args[0] if user_marker else None
+    session_mgr = SessionManager(driver=driver_instance, user=session_user, browser=browser_name)
     cookies_reused = False
     
     try:
@@ -112,7 +116,7 @@ def driver(request):
             # Step 2: Load cookies into driver
             if session_mgr.load_cookies(driver_instance):
                 # Step 3: Navigate to base URL to activate loaded session
-                base_url = ReadConfig.get("APPLICATION", "base_url")
+                base_url = session_mgr.base_url
                 logger.info(f"Refreshing session by navigating to {base_url}")
                 driver_instance.get(base_url)
                 
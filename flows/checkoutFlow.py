@@ -1,13 +1,16 @@
 from pages.checkoutPage import CheckoutPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class CheckoutFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    checkout_page = LazyPage(CheckoutPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.checkout_page = CheckoutPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_checkout_page_to_load(self):
         self.logger.info("Waiting for Checkout page to load")
@@ -17,10 +20,17 @@ class CheckoutFlow:
             raise Exception("Checkout page failed to load")
         self.logger.info("Checkout page loaded successfully")
 
-    def enter_billing_address(self, billing_details):
+    def enter_billing_address(self, billing_details, keystrokes=False):
         self.logger.info("Entering billing address details")
         self.wait_for_checkout_page_to_load()
         self.checkout_page.select_new_billing_address()
+        if not keystrokes:
+            result = self.checkout_page.fill_billing_address(billing_details)
+            if not result['success']:
+                self.logger.error(f"Billing address form fill incomplete: {result}")
+                raise Exception("Billing address form fill incomplete")
+            self.logger.info("Billing address details entered successfully")
+            return
         if 'first_name' in billing_details:
             self.checkout_page.enter_billing_first_name(billing_details['first_name'])
         if 'last_name' in billing_details:
@@ -67,10 +77,17 @@ class CheckoutFlow:
         self.checkout_page.check_shipping_same_as_billing()
         self.logger.info("Shipping address set to same as billing")
 
-    def enter_different_shipping_address(self, shipping_details):
+    def enter_different_shipping_address(self, shipping_details, keystrokes=False):
         self.logger.info("Entering different shipping address")
         self.wait_for_checkout_page_to_load()
         self.checkout_page.uncheck_shipping_same_as_billing()
+        if not keystrokes:
+            result = self.checkout_page.fill_shipping_address(shipping_details)
+            if not result['success']:
+                self.logger.error(f"Shipping address form fill incomplete: {result}")
+                raise Exception("Shipping address form fill incomplete")
+            self.logger.info("Shipping address details entered successfully")
+            return
         if 'first_name' in shipping_details:
             self.checkout_page.enter_shipping_first_name(shipping_details['first_name'])
         if 'last_name' in shipping_details:
@@ -1,13 +1,17 @@
 from pages.downloadsPage import DownloadsPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
+from utilities.routes import navigate_to
 
 
 class DownloadsFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    downloads_page = LazyPage(DownloadsPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.downloads_page = DownloadsPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_downloads_page_to_load(self):
         self.logger.info("Waiting for Downloads page to load")
@@ -19,6 +23,7 @@ class DownloadsFlow:
 
     def navigate_to_downloads(self):
         self.logger.info("Navigating to Downloads page")
+        navigate_to(self.driver, "DownloadsPage")
         self.wait_for_downloads_page_to_load()
         self.logger.info("Downloads page ready")
 
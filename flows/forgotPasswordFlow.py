@@ -3,6 +3,7 @@ from pages.loginPage import LoginPage
 from pages.homePage import HomePage
 from pages.resetPasswordPage import ResetPasswordPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class ForgotPasswordFlow:
@@ -28,6 +29,11 @@ class ForgotPasswordFlow:
     
     logger = LoggerFactory.get_logger(__name__)
 
+    home_page = LazyPage(HomePage)
+    login_page = LazyPage(LoginPage)
+    forgot_password_page = LazyPage(ForgotPasswordPage)
+    reset_password_page = LazyPage(ResetPasswordPage)
+
     def __init__(self, driver):
         """
         Initialize the forgot password flow with page objects.
@@ -36,10 +42,7 @@ class ForgotPasswordFlow:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.home_page = HomePage(driver)
-        self.login_page = LoginPage(driver)
-        self.forgot_password_page = ForgotPasswordPage(driver)
-        self.reset_password_page = ResetPasswordPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     # ===== Page Load Verification Methods =====
     def wait_for_forgot_password_page_to_load(self):
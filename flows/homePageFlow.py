@@ -1,13 +1,17 @@
 from pages.homePage import HomePage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
+from utilities.routes import navigate_to
 
 
 class HomePageFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    home_page = LazyPage(HomePage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.home_page = HomePage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_home_page_to_load(self):
         self.logger.info("Waiting for Home page to load")
@@ -77,30 +81,50 @@ class HomePageFlow:
         return categories
 
     def navigate_to_login(self):
+        self.logger.info("Navigating directly to login page")
+        navigate_to(self.driver, "LoginPage")
+
+    def navigate_to_login_via_menu(self):
         self.logger.info("Navigating to login page from home")
         self.wait_for_home_page_to_load()
         self.home_page.click_login_link()
         self.logger.info("Login link clicked")
 
     def navigate_to_register(self):
+        self.logger.info("Navigating directly to registration page")
+        navigate_to(self.driver, "RegisterPage")
+
+    def navigate_to_register_via_menu(self):
         self.logger.info("Navigating to registration page from home")
         self.wait_for_home_page_to_load()
         self.home_page.click_register_link()
         self.logger.info("Register link clicked")
 
     def navigate_to_cart(self):
+        self.logger.info("Navigating directly to cart")
+        navigate_to(self.driver, "ShoppingCartReviewPage")
+
+    def navigate_to_cart_via_menu(self):
         self.logger.info("Navigating to cart from home")
         self.wait_for_home_page_to_load()
         self.home_page.click_cart_icon()
         self.logger.info("Cart icon clicked")
 
     def navigate_to_wishlist(self):
+        self.logger.info("Navigating directly to wishlist")
+        navigate_to(self.driver, "WishListPage")
+
+    def navigate_to_wishlist_via_menu(self):
         self.logger.info("Navigating to wishlist from home")
         self.wait_for_home_page_to_load()
         self.home_page.click_wishlist_icon()
         self.logger.info("Wishlist icon clicked")
 
     def navigate_to_account(self):
+        self.logger.info("Navigating directly to account")
+        navigate_to(self.driver, "MyAccountPage")
+
+    def navigate_to_account_via_menu(self):
         self.logger.info("Navigating to account from home")
         self.wait_for_home_page_to_load()
         self.home_page.click_account_icon()
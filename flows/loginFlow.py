@@ -1,6 +1,7 @@
 from pages.loginPage import LoginPage
 from pages.homePage import HomePage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 import time
 
 
@@ -18,6 +19,9 @@ class LoginFlow:
     
     logger = LoggerFactory.get_logger(__name__)
 
+    login_page = LazyPage(LoginPage)
+    home_page = LazyPage(HomePage)
+
     def __init__(self, driver):
         """
         Initialize the login flow with page objects.
@@ -26,8 +30,7 @@ class LoginFlow:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.login_page = LoginPage(driver)
-        self.home_page = HomePage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_login_page_to_load(self):
         """
@@ -558,23 +561,27 @@ class LoginFlow:
             # Step 2: Wait for login page to load
             self.wait_for_login_page_to_load()
             
-            # Step 3: Enter email and use Tab to move to password field
-            self.login_page.enter_email(email)
-            self.logger.info("Email entered")
-            self.driver.find_element(*self.login_page._email_input).send_keys("\t")
-            self.logger.info("Tab key pressed to move to password field")
-            
-            # Step 4: Enter password and use Tab to move to login button
-            self.login_page.enter_password(password)
-            self.logger.info("Password entered")
-            self.driver.find_element(*self.login_page._password_input).send_keys("\t")
-            self.logger.info("Tab key pressed to move to login button")
-            
-            # Step 5: Press Enter to submit the form
-            self.driver.find_element(*self.login_page._login_button).send_keys("\n")
-            self.logger.info("Enter key pressed to submit login form via keyboard")
+            # Steps 3-5: Email, Tab, password, Enter - sent as one batched action
+            # sequence, with a checkpoint confirming Tab moved focus to the password
+            sequence = (
+                self.login_page.actions()
+                .click(self.login_page._email_input)
+                .type(email)
+                .tab()
+                .checkpoint("focused_after_tab")
+                .type(password)
+                .enter()
+                .perform()
+            )
+            if not sequence['success']:
+                raise Exception(sequence['error'])
             
-            keyboard_navigation_success = True
+            focused = sequence['checkpoints'].get('focused_after_tab') or {}
+            keyboard_navigation_success = focused.get('type') == 'password'
+            self.logger.info(
+                f"Keyboard login sequence sent in {sequence['round_trips']} round-trips; "
+                f"focus after Tab: {focused}"
+            )
             
         except Exception as e:
             self.logger.error(f"Keyboard navigation login workflow failed: {str(e)}")
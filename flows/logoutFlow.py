@@ -1,13 +1,16 @@
 from pages.logoutPage import LogoutPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class LogoutFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    logout_page = LazyPage(LogoutPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.logout_page = LogoutPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def logout_user(self):
         self.logger.info("Initiating user logout")
@@ -1,13 +1,17 @@
 from pages.orderHistoryPage import OrderHistoryPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
+from utilities.routes import navigate_to
 
 
 class OrderHistoryFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    order_history_page = LazyPage(OrderHistoryPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.order_history_page = OrderHistoryPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_order_history_page_to_load(self):
         self.logger.info("Waiting for Order History page to load")
@@ -19,6 +23,7 @@ class OrderHistoryFlow:
 
     def navigate_to_order_history(self):
         self.logger.info("Navigating to Order History page")
+        navigate_to(self.driver, "OrderHistoryPage")
         self.wait_for_order_history_page_to_load()
         self.logger.info("Order History page ready")
 
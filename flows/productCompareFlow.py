@@ -1,13 +1,16 @@
 from pages.productComparePage import ProductComparePage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class ProductCompareFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    compare_page = LazyPage(ProductComparePage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.compare_page = ProductComparePage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_compare_page_to_load(self):
         self.logger.info("Waiting for Product Compare page to load")
@@ -1,13 +1,16 @@
 from pages.productDisplayPage import ProductDisplayPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class ProductDisplayFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    product_page = LazyPage(ProductDisplayPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.product_page = ProductDisplayPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_product_page_to_load(self):
         self.logger.info("Waiting for Product Display page to load")
@@ -17,6 +20,18 @@ class ProductDisplayFlow:
             raise Exception("Product Display page failed to load")
         self.logger.info("Product Display page loaded successfully")
 
+    def open_product(self, product_name):
+        """Open a product page directly by name, resolved through the product index."""
+        from utilities.productIndex import ProductIndex
+
+        self.logger.info(f"Opening product page for: {product_name}")
+        url = ProductIndex.shared().url_for(product_name)
+        if url is None:
+            self.logger.error(f"Product not found in catalog index: {product_name}")
+            raise Exception(f"Product not found in catalog index: {product_name}")
+        self.driver.get(url)
+        self.wait_for_product_page_to_load()
+
     def get_product_details(self):
         self.logger.info("Retrieving all product details")
         self.wait_for_product_page_to_load()
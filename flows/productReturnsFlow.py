@@ -2,16 +2,19 @@ from pages.productReturnsPage import ProductReturnsPage
 from pages.returnRequestPage import ReturnRequestPage
 from pages.returnDetailsPage import ReturnDetailsPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class ProductReturnsFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    returns_page = LazyPage(ProductReturnsPage)
+    return_request_page = LazyPage(ReturnRequestPage)
+    return_details_page = LazyPage(ReturnDetailsPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.returns_page = ProductReturnsPage(driver)
-        self.return_request_page = ReturnRequestPage(driver)
-        self.return_details_page = ReturnDetailsPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_returns_page_to_load(self):
         self.logger.info("Waiting for Product Returns page to load")
@@ -1,13 +1,16 @@
 from pages.recurringPaymentsPage import RecurringPaymentsPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class RecurringPaymentsFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    recurring_payments_page = LazyPage(RecurringPaymentsPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.recurring_payments_page = RecurringPaymentsPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_recurring_payments_page_to_load(self):
         self.logger.info("Waiting for Recurring Payments page to load")
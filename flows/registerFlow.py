@@ -1,6 +1,7 @@
 from pages.registerPage import RegisterPage
 from pages.homePage import HomePage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 from utilities.readProperties import ReadConfig
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -14,10 +15,12 @@ class RegisterFlow:
     """
     logger = LoggerFactory.get_logger(__name__)
 
+    home_page = LazyPage(HomePage)
+    register_page = LazyPage(RegisterPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.home_page = HomePage(driver)
-        self.register_page = RegisterPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
         if driver:
             self.driver.maximize_window()
 
@@ -297,26 +300,21 @@ class RegisterFlow:
         self.navigate_to_home_page()
         self.click_register_link_from_home()
         
-        # Step 2-6: Fill form fields with keyboard navigation
-        self.logger.info("Step 2: Entering First Name")
-        self.register_page.enter_first_name(first_name)
-        
-        self.logger.info("Step 3: Entering Last Name")
-        self.register_page.enter_last_name(last_name)
-        
-        self.logger.info("Step 4: Entering Email")
-        self.register_page.enter_email(email)
-        
-        self.logger.info("Step 5: Entering Password")
-        self.register_page.enter_password(password)
-        
-        self.logger.info("Step 6: Entering Confirm Password")
-        self.register_page.enter_confirm_password(password)
-        
-        # Step 7: Submit form using keyboard ENTER key
-        self.logger.info("Step 7: Submitting registration form using ENTER key")
-        self.register_page.submit_registration_form_with_keyboard()
-        self.logger.info("Registration form submitted via keyboard")
+        # Steps 2-7: Fill every field and submit with ENTER in one batched action sequence
+        self.logger.info("Steps 2-7: Entering registration details and submitting with ENTER key")
+        sequence = (
+            self.register_page.actions()
+            .click(self.register_page._first_name_input).type(first_name)
+            .click(self.register_page._last_name_input).type(last_name)
+            .click(self.register_page._email_input).type(email)
+            .click(self.register_page._password_input).type(password)
+            .click(self.register_page._confirm_password_input).type(password)
+            .enter()
+            .perform()
+        )
+        if not sequence['success']:
+            raise Exception(f"Keyboard registration sequence failed: {sequence['error']}")
+        self.logger.info(f"Registration form submitted via keyboard in {sequence['round_trips']} round-trips")
         
         # Step 8: Verify success message
         self.logger.info("Step 8: Verifying success message")
@@ -1,12 +1,16 @@
 from pages.searchPage import SearchPage
 from pages.homePage import HomePage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class SearchFlow:
    
     logger = LoggerFactory.get_logger(__name__)
 
+    home_page = LazyPage(HomePage)
+    search_page = LazyPage(SearchPage)
+
     def __init__(self, driver):
         """
         Initialize the search flow with page objects.
@@ -15,8 +19,7 @@ class SearchFlow:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.home_page = HomePage(driver)
-        self.search_page = SearchPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     # ===== Core Search Workflow =====
     def search_product_by_keyword(self, keyword):
@@ -1,13 +1,16 @@
 from pages.shoppingCartReviewPage import ShoppingCartReviewPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class ShoppingCartFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    cart_review_page = LazyPage(ShoppingCartReviewPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.cart_review_page = ShoppingCartReviewPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_cart_review_page_to_load(self):
         self.logger.info("Waiting for Shopping Cart Review page to load")
@@ -1,13 +1,16 @@
 from pages.transactionsPage import TransactionsPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class TransactionsFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    transactions_page = LazyPage(TransactionsPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.transactions_page = TransactionsPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_transactions_page_to_load(self):
         self.logger.info("Waiting for Transactions page to load")
@@ -1,15 +1,18 @@
 from pages.wishListPage import WishListPage
 from pages.searchPage import SearchPage
 from utilities.customLogger import LoggerFactory
+from utilities.pageRegistry import LazyPage, PageRegistry
 
 
 class WishListFlow:
     logger = LoggerFactory.get_logger(__name__)
 
+    wishlist_page = LazyPage(WishListPage)
+    search_page = LazyPage(SearchPage)
+
     def __init__(self, driver):
         self.driver = driver
-        self.wishlist_page = WishListPage(driver)
-        self.search_page = SearchPage(driver)
+        PageRegistry.for_driver(driver).register_flow(self)
 
     def wait_for_wishlist_page_to_load(self):
         self.logger.info("Waiting for WishList page to load")
@@ -135,6 +135,26 @@ class CheckoutPage(BasePage):
         self.logger.info(f"Entering billing postal code: {postal_code}")
         self.type(self._postal_code_input, postal_code)
 
+    def fill_billing_address(self, billing_details):
+        """Fill the new billing address form in one script call (country before state)."""
+        self.logger.info("Filling billing address form")
+        field_locators = [
+            ('first_name', self._first_name_input),
+            ('last_name', self._last_name_input),
+            ('email', self._email_input),
+            ('phone', self._phone_input),
+            ('company', self._company_input),
+            ('country', self._country_dropdown),
+            ('state', self._state_dropdown),
+            ('city', self._city_input),
+            ('address1', self._address1_input),
+            ('address2', self._address2_input),
+            ('postal_code', self._postal_code_input),
+        ]
+        return self.fill_form({
+            locator: billing_details[key] for key, locator in field_locators if key in billing_details
+        })
+
     def continue_from_billing_address(self):
         self.logger.info("Continuing from billing address section")
         self.click(self._continue_billing_button)
@@ -151,6 +171,26 @@ class CheckoutPage(BasePage):
             self.click(self._shipping_address_same_checkbox)
             self.logger.info("Shipping address same as billing checkbox unchecked")
 
+    def fill_shipping_address(self, shipping_details):
+        """Fill the new shipping address form in one script call (country before state)."""
+        self.logger.info("Filling shipping address form")
+        field_locators = [
+            ('first_name', self._shipping_first_name_input),
+            ('last_name', self._shipping_last_name_input),
+            ('email', self._shipping_email_input),
+            ('phone', self._shipping_phone_input),
+            ('company', self._shipping_company_input),
+            ('country', self._shipping_country_dropdown),
+            ('state', self._shipping_state_dropdown),
+            ('city', self._shipping_city_input),
+            ('address1', self._shipping_address1_input),
+            ('address2', self._shipping_address2_input),
+            ('postal_code', self._shipping_postal_code_input),
+        ]
+        return self.fill_form({
+            locator: shipping_details[key] for key, locator in field_locators if key in shipping_details
+        })
+
     def enter_shipping_first_name(self, first_name):
         self.logger.info(f"Entering shipping first name: {first_name}")
         self.type(self._shipping_first_name_input, first_name)
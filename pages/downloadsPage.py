@@ -1,13 +1,17 @@
 from selenium.webdriver.common.by import By
 from utilities.basePage import BasePage
 from utilities.customLogger import LoggerFactory
+from utilities.fallbackLocator import FallbackLocator
 
 
 class DownloadsPage(BasePage):
     logger = LoggerFactory.get_logger(__name__)
 
 
-    _downloads_page_title = (By.XPATH, "//h1[contains(text(), 'Download')] | //h1[contains(text(), 'Downloads')]")
+    _downloads_page_title = FallbackLocator(
+        (By.XPATH, "//h1[contains(text(), 'Download')]"),
+        (By.XPATH, "//h1[contains(text(), 'Downloads')]"),
+    )
     _downloads_container = (By.CLASS_NAME, "downloads-container")
     _downloads_table = (By.XPATH, "//table[contains(@class, 'download')]")
     _download_rows = (By.XPATH, "//table[contains(@class, 'download')]//tbody//tr | //div[contains(@class, 'download-item')]")
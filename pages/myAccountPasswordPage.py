@@ -1,12 +1,16 @@
 from selenium.webdriver.common.by import By
 from utilities.basePage import BasePage
 from utilities.customLogger import LoggerFactory
+from utilities.fallbackLocator import FallbackLocator
 
 
 class MyAccountPasswordPage(BasePage):
     logger = LoggerFactory.get_logger(__name__)
    
-    _password_page_title = (By.XPATH, "//h1[contains(text(), 'Password')] | //h1[contains(text(), 'Change')]")
+    _password_page_title = FallbackLocator(
+        (By.XPATH, "//h1[contains(text(), 'Password')]"),
+        (By.XPATH, "//h1[contains(text(), 'Change')]"),
+    )
     _old_password_input = (By.ID, "OldPassword")
     _new_password_input = (By.ID, "NewPassword")
     _confirm_password_input = (By.ID, "ConfirmNewPassword")
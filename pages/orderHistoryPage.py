@@ -1,12 +1,16 @@
 from selenium.webdriver.common.by import By
 from utilities.basePage import BasePage
 from utilities.customLogger import LoggerFactory
+from utilities.fallbackLocator import FallbackLocator
 
 
 class OrderHistoryPage(BasePage):
     logger = LoggerFactory.get_logger(__name__)
 
-    _order_history_page_title = (By.XPATH, "//h1[contains(text(), 'Order')] | //h1[contains(text(), 'History')]")
+    _order_history_page_title = FallbackLocator(
+        (By.XPATH, "//h1[contains(text(), 'Order')]"),
+        (By.XPATH, "//h1[contains(text(), 'History')]"),
+    )
     _orders_container = (By.CLASS_NAME, "orders-container")
     _order_rows = (By.XPATH, "//table[contains(@class, 'order')]//tbody//tr | //div[contains(@class, 'order-item')]")
     _order_number_cell = (By.XPATH, ".//td[1]//a | .//span[contains(@class, 'order-number')]")
@@ -48,6 +48,275 @@ def driver():
     driver.quit()
 
 
+@pytest.fixture(scope="function")
+def authenticated_driver(state_reset):
+    """
+    Fixture providing a WebDriver already logged in as the [USER_CREDENTIALS] user.
+
+    Scope: Function
+    - Logs in over HTTP (cached per user) instead of through the login UI
+    - Injects auth cookies before the first navigation
+    - Resets the user's cart, wishlist and addresses at teardown (see reset_default_user)
+    - Tests that verify login itself must use the driver fixture and LoginFlow
+    """
+    logger.info("Setting up authenticated WebDriver fixture")
+    from utilities.antiDetectionDriver import StableWebDriver
+    from utilities.httpAuthenticator import HttpAuthenticator
+    from utilities.readProperties import ReadProperties
+
+    email = ReadProperties.get("USER_CREDENTIALS", "valid_email")
+    password = ReadProperties.get("USER_CREDENTIALS", "valid_password")
+
+    driver = StableWebDriver.create_driver()
+    authenticator = HttpAuthenticator()
+    if not authenticator.authenticate_driver(driver, email, password):
+        driver.quit()
+        pytest.fail(f"HTTP login failed for {email}")
+
+    driver.get(authenticator.base_url)
+
+    yield driver
+
+    logger.info("Tearing down authenticated WebDriver fixture")
+    cookies = driver.get_cookies()
+    driver.quit()
+    reset_default_user(state_reset, cookies)
+
+
+@pytest.fixture(scope="session")
+def state_reset():
+    """
+    Fixture providing the background account state reset service.
+
+    Scope: Session
+    - Clears cart, wishlist and extra addresses over HTTP (compare list only with a driver)
+    - reset() runs now; schedule()/wait() only for accounts this process owns exclusively
+    - Logs reset times when the session ends
+    """
+    logger.info("Setting up StateResetService fixture")
+    from utilities.stateReset import StateResetService
+
+    service = StateResetService()
+
+    yield service
+
+    service.shutdown()
+    report = service.report()
+    logger.info(
+        f"State resets: {report['resets']} in {report['total_time']:.2f}s "
+        f"(mean {report['mean_time']:.2f}s, failures {report['failures']}, parts {report['parts']})"
+    )
+
+
+@pytest.fixture(scope="function")
+def checkpoints(driver):
+    """
+    Fixture providing precondition checkpoints for the test's driver.
+
+    Scope: Function
+    - store.use(name, build, probe) restores a saved state or builds it once
+    - Pass account=leased_account["email"] when the test changes the cart or account
+    - Snapshots are shared across tests and xdist workers until their TTL ends
+    """
+    logger.info("Setting up CheckpointStore fixture")
+    from utilities.checkpoints import CheckpointStore
+
+    yield CheckpointStore(driver)
+
+
+@pytest.fixture(scope="session")
+def app_state_manager():
+    """
+    Fixture providing one long-lived browser moved between application states.
+
+    Scope: Session (one browser per xdist worker)
+    - Reused by every test that takes stateful_driver
+    - Quit once the worker finishes
+    """
+    logger.info("Setting up AppStateManager fixture")
+    from utilities.antiDetectionDriver import StableWebDriver
+    from utilities.appState import AppStateManager
+
+    driver = StableWebDriver.create_driver()
+    manager = AppStateManager(driver)
+
+    yield manager
+
+    logger.info(f"Tearing down AppStateManager fixture (stats: {manager.stats})")
+    driver.quit()
+
+
+@pytest.fixture(scope="function")
+def stateful_driver(request, app_state_manager):
+    """
+    Fixture providing a WebDriver already in the test's required state.
+
+    Scope: Function
+    - Reads @pytest.mark.requires_state(name) (default: anonymous)
+    - Reuses the previous test's state when it is still valid
+    - Rebuilds only the missing steps otherwise
+    """
+    from utilities.appState import AppState, StateGroupingScheduler
+
+    state = StateGroupingScheduler.required_state(request.node) or AppState.ANONYMOUS
+    app_state_manager.ensure(state)
+
+    yield app_state_manager.driver
+
+
+@pytest.fixture(scope="function")
+def cart_seeder(driver):
+    """
+    Fixture seeding the test browser's cart, wishlist and compare list.
+
+    Scope: Function
+    - cart_seeder.add_to_cart([("/apple-macbook-pro-13-inch", 2, {})]) in one round-trip
+    - Runs fetch() inside the browser, so it uses the browser's own session
+    - Tests of the add-to-cart UI itself must keep using ProductDisplayFlow
+    """
+    from utilities.browserCartSeeder import BrowserCartSeeder
+
+    yield BrowserCartSeeder(driver)
+
+
+@pytest.fixture(scope="session")
+def seed_data():
+    """
+    Fixture providing server-side test data seeded over HTTP.
+
+    Scope: Session
+    - seed_data.seed(recipe) runs a recipe from testdata/seed_recipes.py
+    - Recipes are idempotent: results are recorded in a ledger and reused
+    - Returns the seeded customers (email, password, order ids)
+    """
+    logger.info("Setting up DataSeeder fixture")
+    from utilities.dataSeeder import DataSeeder
+
+    yield DataSeeder()
+
+
+@pytest.fixture(scope="session")
+def product_index():
+    """
+    Fixture providing the crawled product catalog index.
+
+    Scope: Session (persisted with a TTL and shared by xdist workers)
+    - product_index.find("Lenovo Thinkpad X1 Carbon") -> id, sku, url, price, stock
+    - Reference data for price-change and stale-data checks
+    """
+    from utilities.productIndex import ProductIndex
+
+    yield ProductIndex.shared()
+
+
+@pytest.fixture(scope="session")
+def data_catalog():
+    """
+    Fixture providing the lazy, indexed test-data catalog.
+
+    Scope: Session
+    - data_catalog.query("transactions:VALID_TRANSACTIONS", status="completed", amount__gt=50)
+    - Datasets load on first use; for parametrization use
+      utilities.dataCatalog.catalog.parametrize(...) at module level
+    """
+    from utilities.dataCatalog import catalog
+
+    yield catalog
+
+
+@pytest.fixture(scope="session")
+def identity_factory():
+    """
+    Fixture providing unique, reproducible emails and customer identities.
+
+    Scope: Session (one counter per xdist worker)
+    - Values combine the run id, worker id and a counter, so they never collide
+    - Set TEST_RUN_ID to the logged run id to regenerate a failing run's data
+    """
+    from utilities.identityFactory import IdentityFactory
+
+    yield IdentityFactory()
+
+
+@pytest.fixture(scope="session")
+def account_pool():
+    """
+    Fixture providing the leased pool of pre-registered customer accounts.
+
+    Scope: Session (one pool handle per xdist worker, one shared ledger)
+    - Registers missing pool accounts once, in bulk
+    - Logs this worker's lease wait times at teardown
+    """
+    logger.info("Setting up AccountPool fixture")
+    from utilities.accountPool import AccountPool
+
+    pool = AccountPool()
+    pool.provision()
+
+    yield pool
+
+    stats = pool.wait_stats()
+    logger.info(
+        f"Account pool: {stats['leases']} leases, mean wait {stats['mean_wait']:.2f}s, "
+        f"p95 {stats['p95_wait']:.2f}s, max {stats['max_wait']:.2f}s"
+    )
+
+
+@pytest.fixture(scope="function")
+def leased_account(account_pool):
+    """
+    Fixture providing an exclusive pooled customer account for one test.
+
+    Scope: Function
+    - Yields {'email', 'password', 'lease_id', 'wait'}
+    - Cart and wishlist are emptied when the lease is returned
+    """
+    with account_pool.lease() as account:
+        yield account
+
+
+@pytest.fixture(scope="function")
+def browser_contexts(driver):
+    """
+    Fixture providing isolated browser contexts inside the test's Chrome.
+
+    Scope: Function
+    - Each context has its own cookie jar, storage and page objects
+    - Several users cost one browser launch instead of one per user
+    - All contexts are disposed after the test
+    """
+    logger.info("Setting up BrowserContextPool fixture")
+    from utilities.browserContexts import BrowserContextPool
+
+    pool = BrowserContextPool(driver)
+
+    yield pool
+
+    logger.info("Tearing down BrowserContextPool fixture")
+    pool.close_all()
+
+
+@pytest.fixture(scope="function")
+def session_orchestrator():
+    """
+    Fixture providing a concurrent multi-session orchestrator.
+
+    Scope: Function
+    - Runs user flows concurrently, one dedicated thread per driver
+    - Barriers line up critical clicks across users
+    - Driver threads are stopped after the test (drivers are not quit)
+    """
+    logger.info("Setting up SessionOrchestrator fixture")
+    from utilities.sessionOrchestrator import SessionOrchestrator
+
+    orchestrator = SessionOrchestrator()
+
+    yield orchestrator
+
+    logger.info("Tearing down SessionOrchestrator fixture")
+    orchestrator.shutdown()
+
+
 @pytest.fixture(scope="function")
 def login_page():
     """
@@ -148,7 +417,7 @@ def downloads_page():
 
 
 @pytest.fixture(scope="function")
-def downloads_flow(downloads_page):
+def downloads_flow(downloads_page, state_reset):
     """
     Fixture providing DownloadsFlow orchestration.
     
@@ -164,7 +433,25 @@ def downloads_flow(downloads_page):
     yield flow
     
     logger.info("Tearing down DownloadsFlow fixture")
-    flow.cleanup_downloads()
+    reset_default_user(state_reset)
+
+
+def reset_default_user(state_reset, cookies=None):
+    """Reset the [USER_CREDENTIALS] user's account state before the next test starts.
+
+    Never in the background: any later test may log in as this user through
+    the UI. Skipped when xdist runs several workers, because tests on the
+    other workers use the same account at the same time (tests that need a
+    clean account should lease one from account_pool instead).
+    """
+    import os
+    from utilities.readProperties import ReadProperties
+
+    email = ReadProperties.get("USER_CREDENTIALS", "valid_email")
+    if int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1")) > 1:
+        logger.info(f"Skipping state reset of shared user {email}: other xdist workers use it")
+        return
+    state_reset.reset(email, ReadProperties.get("USER_CREDENTIALS", "valid_password"), cookies)
 
 
 @pytest.fixture(scope="function")
@@ -188,7 +475,7 @@ def transactions_page():
 
 
 @pytest.fixture(scope="function")
-def transactions_flow(transactions_page):
+def transactions_flow(transactions_page, state_reset):
     """
     Fixture providing TransactionsFlow orchestration.
     
@@ -204,7 +491,7 @@ def transactions_flow(transactions_page):
     yield flow
     
     logger.info("Tearing down TransactionsFlow fixture")
-    flow.cleanup_transactions()
+    reset_default_user(state_reset)
 
 
 @pytest.fixture(scope="function")
@@ -253,12 +540,23 @@ def log_test_info(request):
     
     Automatically runs for every test without explicit request.
     """
+    from utilities.pageRegistry import PageRegistry
+    
     logger.info(f"{'='*60}")
     logger.info(f"Starting test: {request.node.name}")
     logger.info(f"{'='*60}")
+    page_registry_snapshot = PageRegistry.snapshot()
     
     yield
     
+    page_construction = PageRegistry.report_since(page_registry_snapshot)
+    if page_construction["flows"]:
+        logger.info(
+            f"Page objects: {page_construction['constructed']} built, {page_construction['reused']} reused, "
+            f"{page_construction['constructions_avoided']} avoided "
+            f"(~{page_construction['estimated_seconds_saved']:.2f}s saved)"
+        )
+        request.node.user_properties.append(("page_construction", page_construction))
     logger.info(f"{'='*60}")
     logger.info(f"Completed test: {request.node.name}")
     logger.info(f"{'='*60}")
@@ -275,6 +573,16 @@ def session_setup_teardown():
     
     yield
     
+    from utilities.elementCache import ElementCache
+    from utilities.fallbackLocator import FallbackLocator
+    from utilities.locatorTools import UnionBranchRecorder
+    
+    from utilities.pageRegistry import PageRegistry
+    
+    logger.info(f"Element handle cache: {ElementCache.report()}")
+    logger.info(f"Page registry: {PageRegistry.report_totals()}")
+    UnionBranchRecorder.flush()
+    FallbackLocator.flush()
     logger.info("Session ended: Cleaning up test environment")
 
 
@@ -334,12 +642,31 @@ def capture_screenshot_on_failure(request):
         logger.error(f"Test failed: {request.node.name}")
 
 
+def pytest_addoption(parser):
+    """
+    Pytest hook registering framework command-line options.
+    """
+    from utilities.durationScheduler import DurationScheduler
+    from utilities.pacing import PacingPlugin
+
+    DurationScheduler.add_options(parser)
+    PacingPlugin.add_options(parser)
+
+
 def pytest_configure(config):
     """
     Pytest hook for initial configuration.
     
     Registers custom markers and initializes framework.
     """
+    from utilities.durationScheduler import DurationScheduler
+
+    from utilities.appState import StateGroupingScheduler
+    from utilities.pacing import PacingPlugin
+
+    config.pluginmanager.register(DurationScheduler(config), "duration_scheduler")
+    config.pluginmanager.register(StateGroupingScheduler(), "state_grouping_scheduler")
+    config.pluginmanager.register(PacingPlugin(config), "pacing")
     config.addinivalue_line(
         "markers", "smoke: mark test as smoke test"
     )
@@ -352,6 +679,16 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "performance: mark test as performance test"
     )
+    config.addinivalue_line(
+        "markers", "requires_state(name): application state the test needs "
+        "(anonymous, logged_in, cart_with_product, order_placed)"
+    )
+    config.addinivalue_line(
+        "markers", "pacing(profile): human-like delay profile for this test (human, brisk, turbo)"
+    )
+    config.addinivalue_line(
+        "markers", "session_user(email): account whose saved browser session the driver reuses"
+    )
 
 
 @pytest.fixture(scope="function")
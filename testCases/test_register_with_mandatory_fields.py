@@ -16,14 +16,13 @@ import pytest
 from flows.registerFlow import RegisterFlow
 from utilities.customLogger import LoggerFactory
 from utilities.readProperties import ReadConfig
-import uuid
 
 logger = LoggerFactory.get_logger(__name__)
 
 
 @pytest.mark.ui
 @pytest.mark.regression
-def test_user_registers_successfully_with_mandatory_fields(driver):
+def test_user_registers_successfully_with_mandatory_fields(driver, identity_factory):
     """
     Test: User registration with mandatory fields only.
 
@@ -49,8 +48,8 @@ def test_user_registers_successfully_with_mandatory_fields(driver):
     last_name = ReadConfig.get("TEST_DATA", "registration_last_name")
     password = ReadConfig.get("TEST_DATA", "registration_password")
 
-    # Generate unique email using UUID to avoid conflicts
-    unique_email = f"user.{uuid.uuid4().hex[:8]}@example.com"
+    # Unique per run/worker; reproducible with TEST_RUN_ID
+    unique_email = identity_factory.email("register")
 
     logger.info(f"Using test data from config.ini: first_name={first_name}, last_name={last_name}")
     logger.info(f"Generated unique email: {unique_email}")
@@ -80,7 +79,7 @@ def test_user_registers_successfully_with_mandatory_fields(driver):
 
 @pytest.mark.ui
 @pytest.mark.regression
-def test_user_registration_with_valid_mandatory_data(driver):
+def test_user_registration_with_valid_mandatory_data(driver, identity_factory):
     """
     Alternative test case: Registration with different valid data.
 
@@ -94,8 +93,8 @@ def test_user_registration_with_valid_mandatory_data(driver):
     last_name = ReadConfig.get("TEST_DATA", "registration_last_name_alt")
     password = ReadConfig.get("TEST_DATA", "registration_password_alt")
 
-    # Generate unique email using UUID to avoid conflicts
-    unique_email = f"user.{uuid.uuid4().hex[:8]}@example.com"
+    # Unique per run/worker; reproducible with TEST_RUN_ID
+    unique_email = identity_factory.email("register")
 
     logger.info(f"Using alternative test data from config.ini: first_name={first_name}, last_name={last_name}")
     logger.info(f"Generated unique email: {unique_email}")
@@ -0,0 +1,64 @@
+"""Server-side seed recipes for utilities/dataSeeder.py.
+
+Each recipe describes data created directly over HTTP instead of through
+the UI. Recipes are idempotent: customers get deterministic emails
+(seed.<recipe>.<n>@example.test) and results are recorded in a local
+ledger, so seeding the same recipe twice returns the existing data.
+
+Products are referenced by their SEO path so recipes keep working when
+product ids differ between installations.
+
+Orders are placed with CheckMoneyOrder and stay Pending unless the recipe
+sets "complete_orders" (requires [ADMIN_CREDENTIALS]).
+"""
+
+SEED_PASSWORD = "SeedPassword123!"
+
+# nopCommerce one-page-checkout form values used for seeded orders
+DEFAULT_BILLING_ADDRESS = {
+    "BillingNewAddress.FirstName": "Seed",
+    "BillingNewAddress.LastName": "Customer",
+    "BillingNewAddress.CountryId": "1",
+    "BillingNewAddress.StateProvinceId": "0",
+    "BillingNewAddress.City": "New York",
+    "BillingNewAddress.Address1": "1 Seed Street",
+    "BillingNewAddress.ZipPostalCode": "10001",
+    "BillingNewAddress.PhoneNumber": "5555555555",
+}
+
+DEFAULT_SHIPPING_OPTION = "Ground___Shipping.FixedByWeightByTotal"
+DEFAULT_PAYMENT_METHOD = "Payments.CheckMoneyOrder"
+
+SEED_RECIPES = {
+    # test_verify_order_history_pagination_works_correctly_when_many_orders_exist
+    # One customer's orders share its server-side cart, so these 200 checkouts
+    # run one after another (minutes, not seconds); the ledger makes it one-off
+    "customer_with_many_orders": {
+        "customers": 1,
+        "orders_per_customer": 200,
+        "order_items": [{"product_path": "/apple-macbook-pro-13-inch", "quantity": 1}],
+    },
+    # test_verify_downloadable_items_are_visible_only_after_successful_purchase
+    "customer_with_downloadable_purchase": {
+        "customers": 1,
+        "orders_per_customer": 1,
+        "order_items": [{"product_path": "/night-visions", "quantity": 1}],
+    },
+    # Product returns tests (return requests are only allowed on Complete orders)
+    "customers_with_completed_orders": {
+        "customers": 5,
+        "orders_per_customer": 2,
+        "complete_orders": True,
+        "order_items": [{"product_path": "/lenovo-thinkpad-x1-carbon-laptop", "quantity": 2}],
+    },
+    # Customer with a pre-filled cart and wishlist
+    "customer_with_cart_and_wishlist": {
+        "customers": 1,
+        "cart_items": [{"product_path": "/apple-macbook-pro-13-inch", "quantity": 1}],
+        "wishlist_items": [{"product_path": "/lenovo-thinkpad-x1-carbon-laptop", "quantity": 1}],
+    },
+    # Newsletter re-subscription tests
+    "newsletter_subscribers": {
+        "subscribers": 20,
+    },
+}
@@ -0,0 +1,56 @@
+"""
+Unit tests for DataCatalog.query (utilities/dataCatalog.py).
+
+Test Scope: Unit - runs against a JSON dataset written to a temporary directory
+"""
+
+import json
+import pytest
+from utilities.dataCatalog import DataCatalog
+
+
+TRANSACTIONS = [
+    {"id": 1, "status": "completed", "type": "payment", "currency": "USD", "amount": 20},
+    {"id": 2, "status": "completed", "type": "refund", "currency": "USD", "amount": 75},
+    {"id": 3, "status": "pending", "type": "payment", "currency": "EUR", "amount": 120},
+    {"id": 4, "status": "failed", "type": "refund", "currency": "USD", "amount": 60, "tags": ["retry"]},
+    {"id": 5, "status": "completed", "type": "payment", "currency": "EUR", "amount": 50},
+]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    (tmp_path / "transactions.json").write_text(json.dumps(TRANSACTIONS))
+    return DataCatalog(testdata_dir=tmp_path)
+
+
+class TestDataCatalogQuery:
+    """Lookups answered from indexes and from scans must agree with a plain filter."""
+
+    @pytest.mark.parametrize("lookups, expected_ids", [
+        ({}, [1, 2, 3, 4, 5]),
+        ({"status": "completed"}, [1, 2, 5]),
+        ({"status__eq": "completed", "currency": "USD"}, [1, 2]),
+        ({"status": "completed", "type": "refund", "amount__gt": 50}, [2]),
+        ({"status__ne": "completed"}, [3, 4]),
+        ({"amount__gte": 60, "amount__lt": 120}, [2, 4]),
+        ({"amount__lte": 50}, [1, 5]),
+        ({"status__in": ["pending", "failed"]}, [3, 4]),
+        ({"status__in": ("completed",), "currency__in": {"EUR"}}, [5]),
+        ({"status__in": "completed"}, [1, 2, 5]),
+        ({"tags__contains": "retry"}, [4]),
+        ({"status": "archived"}, []),
+        ({"missing_field": "x"}, []),
+    ])
+    def test_query(self, catalog, lookups, expected_ids):
+        rows = catalog.query("transactions", **lookups)
+        assert [row["id"] for row in rows] == expected_ids
+
+    def test_in_needs_a_collection(self, catalog):
+        with pytest.raises(TypeError):
+            catalog.query("transactions", amount__in=50)
+
+    def test_rows_load_once(self, catalog, tmp_path):
+        first = catalog.rows("transactions")
+        (tmp_path / "transactions.json").write_text("[]")
+        assert catalog.rows("transactions") is first
@@ -0,0 +1,30 @@
+"""
+Unit tests for predict_makespan (utilities/durationScheduler.py).
+
+Test Scope: Unit - pure function
+"""
+
+import pytest
+from utilities.durationScheduler import predict_makespan
+
+
+class TestPredictMakespan:
+    """Greedy LPT: longest duration first, each onto the least loaded worker."""
+
+    @pytest.mark.parametrize("durations, workers, makespan", [
+        ([], 4, 0.0),
+        ([7.0], 4, 7.0),
+        ([3, 1, 2], 1, 6.0),
+        ([3, 1, 2], 0, 6.0),
+        ([5, 4, 3, 3, 3], 2, 10.0),
+        ([3, 3, 2, 2, 2], 2, 7.0),
+        ([1, 1, 1, 1], 4, 1.0),
+        ([10, 1, 1, 1], 3, 10.0),
+        ([2, 2, 2, 2, 2, 2], 3, 4.0),
+    ])
+    def test_makespan(self, durations, workers, makespan):
+        assert predict_makespan(durations, workers) == makespan
+
+    def test_input_order_does_not_matter(self):
+        durations = [1, 9, 4, 6, 2, 8]
+        assert predict_makespan(durations, 3) == predict_makespan(sorted(durations), 3)
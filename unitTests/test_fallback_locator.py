@@ -0,0 +1,95 @@
+"""
+Unit tests for FallbackLocator candidate ordering (utilities/fallbackLocator.py).
+
+Test Scope: Unit - no browser (a fake search context stands in for the driver)
+"""
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from utilities.fallbackLocator import FallbackLocator
+
+
+FIRST = (By.CSS_SELECTOR, "div.page-title h1")
+SECOND = (By.CSS_SELECTOR, "h1.title")
+THIRD = (By.ID, "title")
+
+
+class FakeContext:
+    """Answers find_elements from a {(by, value): [elements]} table and records the queries."""
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.queries = []
+
+    def find_elements(self, by, value):
+        self.queries.append((by, value))
+        return self.matches.get((by, value), [])
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    """Start every test with empty hit-rate statistics instead of the persisted file."""
+    monkeypatch.setattr(FallbackLocator, "_stats", {})
+    monkeypatch.setattr(FallbackLocator, "_baseline", {})
+    monkeypatch.setattr(FallbackLocator, "_dirty", False)
+
+
+class TestFallbackLocator:
+    """Candidate ordering, hit/miss recording and the union tuple."""
+
+    def test_union_of_css_candidates(self):
+        locator = FallbackLocator(FIRST, SECOND)
+        assert tuple(locator) == (By.CSS_SELECTOR, "div.page-title h1, h1.title")
+
+    def test_union_of_mixed_candidates_is_first_candidate(self):
+        locator = FallbackLocator(FIRST, THIRD)
+        assert tuple(locator) == FIRST
+
+    def test_requires_a_candidate(self):
+        with pytest.raises(ValueError):
+            FallbackLocator()
+
+    def test_untried_candidates_keep_declaration_order(self):
+        locator = FallbackLocator(FIRST, SECOND, THIRD, name="title")
+        assert locator.ordered() == [FIRST, SECOND, THIRD]
+
+    def test_candidates_ordered_by_hit_rate(self):
+        locator = FallbackLocator(FIRST, SECOND, THIRD, name="title")
+        FallbackLocator._stats["title"] = {
+            locator._key(FIRST): {"hits": 0, "misses": 4},
+            locator._key(SECOND): {"hits": 1, "misses": 1},
+            locator._key(THIRD): {"hits": 6, "misses": 0},
+        }
+        assert locator.ordered() == [THIRD, SECOND, FIRST]
+
+    def test_find_all_records_misses_before_the_hit(self):
+        locator = FallbackLocator(FIRST, SECOND, THIRD, name="title")
+        context = FakeContext({SECOND: ["element"], THIRD: ["other"]})
+
+        assert locator.find_all(context) == ["element"]
+        assert context.queries == [FIRST, SECOND]
+        assert locator._candidate_stats(FIRST) == {"hits": 0, "misses": 1}
+        assert locator._candidate_stats(SECOND) == {"hits": 1, "misses": 0}
+        assert locator._candidate_stats(THIRD) == {"hits": 0, "misses": 0}
+
+    def test_matching_candidate_moves_to_the_front(self):
+        locator = FallbackLocator(FIRST, SECOND, name="title")
+        context = FakeContext({SECOND: ["element"]})
+
+        locator.find_all(context)
+        assert locator.ordered() == [SECOND, FIRST]
+
+    def test_find_returns_first_element_of_best_candidate(self):
+        locator = FallbackLocator(FIRST, SECOND, name="title")
+        context = FakeContext({FIRST: ["a", "b"], SECOND: ["c"]})
+        assert locator.find(context, timeout=0) == "a"
+
+    def test_find_times_out_when_nothing_matches(self, monkeypatch):
+        monkeypatch.setattr(FallbackLocator, "CANDIDATE_BUDGET", 0)
+        locator = FallbackLocator(FIRST, SECOND, name="title")
+
+        with pytest.raises(TimeoutException):
+            locator.find(FakeContext({}), timeout=0)
+        assert locator._candidate_stats(FIRST)["misses"] == 1
+        assert locator._candidate_stats(SECOND)["misses"] == 1
@@ -0,0 +1,51 @@
+"""
+Unit tests for IdentityFactory (utilities/identityFactory.py).
+
+Test Scope: Unit - no browser, no network
+"""
+
+import pytest
+from utilities.identityFactory import IdentityFactory
+
+
+class TestIdentityFactory:
+    """Identities are unique per (run, worker, counter) and reproducible from it."""
+
+    def test_email_format(self):
+        factory = IdentityFactory(run_id="run1", worker_id="gw3")
+        assert factory.email() == "user.run1.gw3.0@example.test"
+        assert factory.email(prefix="Buyer") == "buyer.run1.gw3.1@example.test"
+
+    def test_batch_is_unique_and_continues_the_counter(self):
+        factory = IdentityFactory(run_id="run1", worker_id="gw0")
+        batch = factory.batch(50)
+        emails = [identity["email"] for identity in batch]
+
+        assert len(set(emails)) == 50
+        assert [identity["index"] for identity in batch] == list(range(50))
+        assert factory.identity()["index"] == 50
+
+    def test_workers_never_collide(self):
+        emails = set()
+        for worker_id in ("gw0", "gw1", "gw2"):
+            emails.update(IdentityFactory(run_id="run1", worker_id=worker_id).email_batch(20))
+        assert len(emails) == 60
+
+    def test_reproduce_rebuilds_the_same_identity(self):
+        generated = IdentityFactory(run_id="run1", worker_id="gw1").batch(5)
+        replay = IdentityFactory(run_id="run1", worker_id="gw1")
+        assert [replay.reproduce(index) for index in range(5)] == generated
+
+    def test_password_shape(self):
+        password = IdentityFactory(run_id="run1", worker_id="gw0").identity()["password"]
+        assert len(password) == 11
+        assert password[0].isupper() and password[1:7].islower() and password[7:10].isdigit()
+        assert password.endswith("!")
+
+    @pytest.mark.parametrize("index, letters", [(0, "A"), (25, "Z"), (26, "BA"), (27, "BB"), (676, "BAA")])
+    def test_alpha_counter(self, index, letters):
+        assert IdentityFactory._alpha(index) == letters
+
+    def test_run_id_from_environment(self, monkeypatch):
+        monkeypatch.setenv("TEST_RUN_ID", "Reproduce-Me-Please")
+        assert IdentityFactory.resolve_run_id() == "reproduce-me"
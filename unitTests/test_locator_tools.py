@@ -0,0 +1,81 @@
+"""
+Unit tests for XPathToCss (utilities/locatorTools.py).
+
+Each XPath in the rewrite table must compile to a CSS selector matching the
+same elements; everything outside the supported subset must compile to None
+so BasePage keeps the original XPath.
+
+Test Scope: Unit - no browser
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+from utilities.locatorTools import XPathToCss
+
+
+REWRITES = [
+    ("//div", "div"),
+    ("//*", "*"),
+    (".//span", "span"),
+    ("//div//span", "div span"),
+    ("//ul/li", "ul > li"),
+    ("//form[@id='register']", 'form[id="register"]'),
+    ('//input[@name="Email"]', 'input[name="Email"]'),
+    (".//input[@type='submit' ]", 'input[type="submit"]'),
+    ("//a[@href]", "a[href]"),
+    ("//a[contains(@href, 'customer')]", 'a[href*="customer"]'),
+    ("//div[starts-with(@class, 'product')]", 'div[class^="product"]'),
+    ("//div[not(@hidden)]", "div:not([hidden])"),
+    ("//ul/li[2]", "ul > li:nth-of-type(2)"),
+    ("//li[last()]", "li:last-of-type"),
+    ("//div[@class='a'][@id='b']", 'div[class="a"][id="b"]'),
+    ("//div[@id='a']//button[@type='submit']", 'div[id="a"] button[type="submit"]'),
+    ("//h1 | //h2", "h1, h2"),
+    ("//a[@title='a | b']", 'a[title="a | b"]'),
+]
+
+UNSUPPORTED = [
+    "./a",
+    "a",
+    "/html/body",
+    "//a[text()='Log in']",
+    "//a[contains(text(), 'Log in')]",
+    "//a[contains(@class, '')]",
+    "//*[2]",
+    "//div[@class='a'][1]",
+    "//div/..",
+    "//div/following-sibling::span",
+    "//a[@id='x'] | //a[text()='y']",
+    "//div[@id='unterminated'",
+]
+
+
+class TestXPathToCss:
+    """Table-driven checks of the XPath -> CSS rewrite."""
+
+    @pytest.mark.parametrize("xpath, css", REWRITES)
+    def test_compiles_supported_xpath(self, xpath, css):
+        assert XPathToCss.compile(xpath) == css
+
+    @pytest.mark.parametrize("xpath", UNSUPPORTED)
+    def test_unsupported_xpath_compiles_to_none(self, xpath):
+        assert XPathToCss.compile(xpath) is None
+
+    def test_compile_locator_rewrites_xpath_locator(self, monkeypatch):
+        monkeypatch.setattr(XPathToCss, "enabled", True)
+        locator = (By.XPATH, "//input[@id='Email']")
+        assert XPathToCss.compile_locator(locator) == (By.CSS_SELECTOR, 'input[id="Email"]')
+
+    @pytest.mark.parametrize("locator", [
+        (By.XPATH, "//a[text()='Log in']"),
+        (By.ID, "Email"),
+        (By.CSS_SELECTOR, "div.page-title"),
+    ])
+    def test_compile_locator_keeps_other_locators(self, monkeypatch, locator):
+        monkeypatch.setattr(XPathToCss, "enabled", True)
+        assert XPathToCss.compile_locator(locator) == locator
+
+    def test_compile_locator_disabled(self, monkeypatch):
+        monkeypatch.setattr(XPathToCss, "enabled", False)
+        locator = (By.XPATH, "//div")
+        assert XPathToCss.compile_locator(locator) == locator
@@ -0,0 +1,289 @@
+"""Leased pool of pre-registered customer accounts.
+
+Responsibility:
+- Pre-register N customers in bulk over HTTP (once per base URL)
+- Hand out exclusive leases to tests through a SQLite ledger shared by
+  every xdist worker, so no two tests use the same account at once
+- Reset each account's cart and wishlist when its lease is returned
+- Reclaim leases left behind by crashed workers after stale_lease_seconds
+- Verify a leased account can log in (once per account and process): the
+  ledger outlives the application database, so an account that no longer
+  exists is registered again, or dropped from the pool if that fails
+- Record lease wait times and report them per run
+
+Tests that verify registration itself must keep using RegisterFlow;
+tests that only need "some logged-in customer" should lease one here
+instead of sharing the single [USER_CREDENTIALS] user.
+
+This utility does NOT:
+- Perform assertions
+- Drive a browser (see HttpAuthenticator.authenticate_driver)
+"""
+
+import os
+import sqlite3
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from utilities.customLogger import LoggerFactory
+from utilities.dataSeeder import DataSeeder
+from utilities.readProperties import ReadProperties
+from utilities.sessionVault import SessionVault, file_lock
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class AccountPool:
+    """Exclusive leases on pre-registered customer accounts."""
+
+    DB_PATH = SessionVault.VAULT_DIR.parent / "account_pool.sqlite3"
+
+    # Seconds between attempts while every account is leased
+    POLL_INTERVAL = 0.2
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS accounts (
+            base_url TEXT NOT NULL,
+            email TEXT NOT NULL,
+            password TEXT NOT NULL,
+            leased_by TEXT,
+            leased_at REAL,
+            PRIMARY KEY (base_url, email)
+        );
+        CREATE TABLE IF NOT EXISTS leases (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            base_url TEXT NOT NULL,
+            email TEXT NOT NULL,
+            worker TEXT NOT NULL,
+            run_started REAL NOT NULL,
+            requested_at REAL NOT NULL,
+            acquired_at REAL NOT NULL,
+            released_at REAL,
+            reset_items INTEGER
+        );
+    """
+
+    def __init__(self, size=None, base_url=None, db_path=None):
+        """Initialize AccountPool.
+
+        Args:
+            size (int): Number of pooled accounts (default: [ACCOUNT_POOL] size)
+            base_url (str): Application URL (default: configured base URL)
+            db_path (Path): Ledger location (default: DB_PATH)
+        """
+        self.base_url = (base_url or ReadProperties().get_base_url()).rstrip("/")
+        self.size = size or int(ReadProperties.get("ACCOUNT_POOL", "size"))
+        self.password = ReadProperties.get("ACCOUNT_POOL", "password")
+        self.lease_timeout = float(ReadProperties.get("ACCOUNT_POOL", "lease_timeout_seconds"))
+        self.stale_lease = float(ReadProperties.get("ACCOUNT_POOL", "stale_lease_seconds"))
+        self.db_path = db_path or self.DB_PATH
+        self.worker = f"{os.getenv('PYTEST_XDIST_WORKER', 'master')}:{os.getpid()}"
+        self.run_started = time.time()
+        self.seeder = DataSeeder(self.base_url)
+        self._verified = set()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # isolation_level=None: autocommit, claims open BEGIN IMMEDIATE explicitly
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def email(self, index):
+        return f"pool.customer.{index}@example.test"
+
+    def provision(self):
+        """Register any missing pool accounts in bulk.
+
+        Runs under a file lock so only one xdist worker registers;
+        the others wait and then see the finished pool.
+
+        Returns:
+            int: Number of accounts registered by this call
+        """
+        with file_lock(self.db_path):
+            with self._connect() as conn:
+                existing = {
+                    row[0] for row in conn.execute(
+                        "SELECT email FROM accounts WHERE base_url = ?", (self.base_url,)
+                    )
+                }
+            missing = [self.email(i) for i in range(self.size) if self.email(i) not in existing]
+            if not missing:
+                return 0
+
+            logger.info(f"Registering {len(missing)} pool accounts")
+            with ThreadPoolExecutor(max_workers=self.seeder.max_workers) as executor:
+                registered = list(executor.map(self._register, missing))
+
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO accounts (base_url, email, password) VALUES (?, ?, ?)",
+                    [(self.base_url, email, self.password) for email, ok in zip(missing, registered) if ok],
+                )
+            count = sum(registered)
+            logger.info(f"Registered {count}/{len(missing)} pool accounts")
+            return count
+
+    def _register(self, email):
+        try:
+            return self.seeder.new_client().register(email, self.password)
+        except Exception as e:
+            logger.error(f"Could not register pool account {email}: {str(e)}")
+            return False
+
+    def acquire(self, timeout=None):
+        """Lease a free account, waiting until one is returned if necessary.
+
+        Args:
+            timeout (float): Seconds to wait (default: [ACCOUNT_POOL] lease_timeout_seconds)
+
+        Returns:
+            dict: {'email', 'password', 'lease_id', 'wait'}
+
+        Raises:
+            TimeoutError: If no account became free in time
+        """
+        timeout = self.lease_timeout if timeout is None else timeout
+        requested_at = time.time()
+        deadline = requested_at + timeout
+
+        while True:
+            lease = self._try_acquire(requested_at)
+            if lease and not self._verify(lease):
+                # Dropped from the pool: try the next free account straight away
+                continue
+            if lease:
+                if lease["wait"] > 1:
+                    logger.info(f"Leased {lease['email']} after waiting {lease['wait']:.1f}s")
+                return lease
+            if time.time() >= deadline:
+                raise TimeoutError(f"No pooled account became free within {timeout:.1f}s")
+            time.sleep(self.POLL_INTERVAL)
+
+    def _try_acquire(self, requested_at):
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            row = conn.execute(
+                "SELECT email, password FROM accounts WHERE base_url = ? "
+                "AND (leased_by IS NULL OR leased_at < ?) ORDER BY leased_at LIMIT 1",
+                (self.base_url, now - self.stale_lease),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+
+            email, password = row
+            conn.execute(
+                "UPDATE accounts SET leased_by = ?, leased_at = ? WHERE base_url = ? AND email = ?",
+                (self.worker, now, self.base_url, email),
+            )
+            cursor = conn.execute(
+                "INSERT INTO leases (base_url, email, worker, run_started, requested_at, acquired_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.base_url, email, self.worker, self.run_started, requested_at, now),
+            )
+            conn.execute("COMMIT")
+            return {
+                "email": email,
+                "password": password,
+                "lease_id": cursor.lastrowid,
+                "wait": now - requested_at,
+            }
+
+    def _verify(self, lease):
+        """True if the leased account can log in on this server; drops it from the pool otherwise."""
+        email, password = lease["email"], lease["password"]
+        if email in self._verified:
+            return True
+        if self.seeder.authenticator.login_session(email, password) is None:
+            logger.warning(f"Pool account {email} cannot log in - registering it again")
+            if self.seeder.customer_client(email, password, register=True) is None:
+                self._drop(lease)
+                return False
+        self._verified.add(email)
+        return True
+
+    def _drop(self, lease):
+        logger.error(f"Dropping pool account {lease['email']}: it cannot log in on {self.base_url}")
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM accounts WHERE base_url = ? AND email = ?",
+                (self.base_url, lease["email"]),
+            )
+            conn.execute("UPDATE leases SET released_at = ? WHERE id = ?", (time.time(), lease["lease_id"]))
+
+    def reset_account(self, email, password):
+        """Empty an account's cart and wishlist over HTTP.
+
+        Returns:
+            int: Number of items removed
+        """
+        client = self.seeder.customer_client(email, password, register=False)
+        if client is None:
+            logger.warning(f"Could not log in {email} to reset it")
+            return 0
+        return client.clear_cart() + client.clear_wishlist()
+
+    def release(self, lease, reset=True):
+        """Return a lease, resetting the account's cart and wishlist first."""
+        reset_items = None
+        if reset:
+            try:
+                reset_items = self.reset_account(lease["email"], lease["password"])
+            except Exception as e:
+                logger.warning(f"Reset of {lease['email']} failed: {str(e)}")
+
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE accounts SET leased_by = NULL, leased_at = NULL "
+                "WHERE base_url = ? AND email = ? AND leased_by = ?",
+                (self.base_url, lease["email"], self.worker),
+            )
+            conn.execute(
+                "UPDATE leases SET released_at = ?, reset_items = ? WHERE id = ?",
+                (time.time(), reset_items, lease["lease_id"]),
+            )
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Context manager leasing an account for the duration of the block."""
+        account = self.acquire(timeout)
+        try:
+            yield account
+        finally:
+            self.release(account)
+
+    def wait_stats(self, since=None):
+        """This worker's lease wait times since a timestamp (default: this pool's start).
+
+        Returns:
+            dict: {'leases', 'mean_wait', 'p95_wait', 'max_wait', 'total_wait'}
+        """
+        since = self.run_started if since is None else since
+        with self._connect() as conn:
+            waits = sorted(
+                row[0] for row in conn.execute(
+                    "SELECT acquired_at - requested_at FROM leases "
+                    "WHERE base_url = ? AND worker = ? AND requested_at >= ?",
+                    (self.base_url, self.worker, since),
+                )
+            )
+        if not waits:
+            return {"leases": 0, "mean_wait": 0.0, "p95_wait": 0.0, "max_wait": 0.0, "total_wait": 0.0}
+        return {
+            "leases": len(waits),
+            "mean_wait": statistics.mean(waits),
+            "p95_wait": waits[min(len(waits) - 1, int(len(waits) * 0.95))],
+            "max_wait": waits[-1],
+            "total_wait": sum(waits),
+        }
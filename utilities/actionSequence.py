@@ -0,0 +1,197 @@
+"""Fluent keyboard / mouse sequences sent as batched W3C Actions.
+
+Responsibility:
+- Collect a whole keyboard and mouse script (clicks, hovers, typing,
+  TAB / ENTER presses, chords, pauses) and send it in ONE W3C Actions
+  perform() request instead of one WebDriver call per key or click
+- Split the script only at checkpoints, where a state read (focused
+  element, field value, URL...) is needed before continuing
+- Report how many round-trips the sequence took
+
+Usage (from a page object or flow):
+
+    result = (page.actions()
+              .click(page._email_input).type(email)
+              .tab()
+              .checkpoint("focused", ActionSequence.active_element)
+              .type(password).enter()
+              .perform())
+    result["checkpoints"]["focused"]   # e.g. {'id': 'Password', ...}
+
+Locators are resolved when the step is added, so each locator costs one
+find_element call; keys, text, pauses and mouse moves cost nothing until
+perform().
+
+This utility does NOT:
+- Wait for elements to become clickable (resolve them through BasePage
+  waits first if the page is still loading)
+- Perform assertions
+"""
+
+import time
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webelement import WebElement
+from utilities.customLogger import LoggerFactory
+from utilities.pacing import Pacing
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class ActionSequence:
+    """Builder compiling chained steps into as few W3C Actions requests as possible."""
+
+    ACTIVE_ELEMENT_SCRIPT = """
+        var el = document.activeElement;
+        if (!el || el === document.body) { return null; }
+        return {tag: el.tagName.toLowerCase(), id: el.id || null, name: el.getAttribute('name'),
+                type: el.getAttribute('type'), value: 'value' in el ? el.value : null};
+    """
+
+    def __init__(self, driver):
+        """Initialize ActionSequence.
+
+        Args:
+            driver: Selenium WebDriver
+        """
+        self.driver = driver
+        self._segments = []
+        self._chain = None
+        self._step_count = 0
+
+    # ===== Built-in checkpoint readers =====
+
+    @staticmethod
+    def active_element(driver):
+        """{'tag', 'id', 'name', 'type', 'value'} of the focused element, or None."""
+        return driver.execute_script(ActionSequence.ACTIVE_ELEMENT_SCRIPT)
+
+    @staticmethod
+    def current_url(driver):
+        return driver.current_url
+
+    # ===== Building =====
+
+    def _element(self, target):
+        if target is None or isinstance(target, WebElement):
+            return target
+        return self.driver.find_element(*target)
+
+    def _add(self, build):
+        if self._chain is None:
+            self._chain = ActionChains(self.driver)
+            self._segments.append(("actions", self._chain))
+        build(self._chain)
+        self._step_count += 1
+        return self
+
+    def click(self, target=None):
+        """Click a locator / element, or the current pointer position."""
+        element = self._element(target)
+        return self._add(lambda chain: chain.click(element))
+
+    def double_click(self, target=None):
+        element = self._element(target)
+        return self._add(lambda chain: chain.double_click(element))
+
+    def right_click(self, target=None):
+        element = self._element(target)
+        return self._add(lambda chain: chain.context_click(element))
+
+    def hover(self, target):
+        element = self._element(target)
+        return self._add(lambda chain: chain.move_to_element(element))
+
+    def type(self, text):
+        """Type text into the focused element, one key event per character."""
+        return self._add(lambda chain: chain.send_keys(text))
+
+    def press(self, key, times=1):
+        return self._add(lambda chain: chain.send_keys(*([key] * times)))
+
+    def tab(self, times=1):
+        return self.press(Keys.TAB, times)
+
+    def shift_tab(self, times=1):
+        def build(chain):
+            chain.key_down(Keys.SHIFT)
+            chain.send_keys(*([Keys.TAB] * times))
+            chain.key_up(Keys.SHIFT)
+        return self._add(build)
+
+    def enter(self):
+        return self.press(Keys.ENTER)
+
+    def space(self):
+        return self.press(Keys.SPACE)
+
+    def chord(self, modifier, key):
+        """Press key while holding modifier, e.g. chord(Keys.CONTROL, "a")."""
+        def build(chain):
+            chain.key_down(modifier)
+            chain.send_keys(key)
+            chain.key_up(modifier)
+        return self._add(build)
+
+    def pause(self, seconds):
+        """Pause inside the action sequence (no round-trip), scaled by the pacing profile."""
+        scaled = Pacing.scale(seconds)
+        if scaled <= 0:
+            return self
+        return self._add(lambda chain: chain.pause(scaled))
+
+    def checkpoint(self, name, reader=None):
+        """Flush the pending actions here and record reader(driver) under name.
+
+        Args:
+            name (str): Key in the result's 'checkpoints' dict
+            reader (callable): Function of the driver (default: active_element)
+        """
+        self._segments.append(("checkpoint", (name, reader or ActionSequence.active_element)))
+        self._chain = None
+        return self
+
+    # ===== Execution =====
+
+    def perform(self, raise_errors=False):
+        """Send the sequence, one Actions request per run between checkpoints.
+
+        Args:
+            raise_errors (bool): Re-raise a failed command instead of reporting
+                it in the result (for callers that handle WebDriver exceptions,
+                e.g. BasePage's stale-element retry)
+
+        Returns:
+            dict: {'success': bool, 'steps': int, 'round_trips': int,
+                   'checkpoints': {name: value}, 'error': str|None}
+        """
+        started = time.perf_counter()
+        checkpoints = {}
+        round_trips = 0
+        error = None
+        try:
+            for kind, payload in self._segments:
+                if kind == "actions":
+                    payload.perform()
+                else:
+                    name, reader = payload
+                    checkpoints[name] = reader(self.driver)
+                round_trips += 1
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Action sequence failed after {round_trips} round-trips: {error}")
+            if raise_errors:
+                raise
+
+        logger.info(
+            f"Action sequence: {self._step_count} steps in {round_trips} round-trips "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+        return {
+            "success": error is None,
+            "steps": self._step_count,
+            "round_trips": round_trips,
+            "checkpoints": checkpoints,
+            "error": error,
+        }
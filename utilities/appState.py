@@ -0,0 +1,252 @@
+"""State-aware test preconditions and grouping.
+
+Responsibility:
+- Name the application states tests depend on (anonymous, logged in,
+  cart containing a product, order placed)
+- Build a state on a long-lived browser only when it is not already there,
+  reusing the previous test's state after a cheap validity check
+- Group tests requiring the same state onto the same xdist worker so one
+  browser moves through as few state transitions as possible
+
+Tests declare their precondition with a marker and take the
+`stateful_driver` fixture:
+
+    @pytest.mark.requires_state("cart_with_product")
+    def test_checkout_page_opens(stateful_driver):
+        ...
+
+Grouping onto workers needs xdist's group-aware distribution:
+    pytest testCases -n 4 --dist loadgroup
+
+This utility does NOT:
+- Perform assertions
+- Undo what a test did (the next validity check notices and rebuilds)
+"""
+
+import pytest
+from utilities.customLogger import LoggerFactory
+from utilities.readProperties import ReadProperties
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class AppState:
+    """Known application states, ordered from cheapest to most expensive."""
+
+    ANONYMOUS = "anonymous"
+    LOGGED_IN = "logged_in"
+    CART_WITH_PRODUCT = "cart_with_product"
+    ORDER_PLACED = "order_placed"
+
+    # Each state is built on top of its parent
+    PARENTS = {
+        LOGGED_IN: ANONYMOUS,
+        CART_WITH_PRODUCT: LOGGED_IN,
+        ORDER_PLACED: CART_WITH_PRODUCT,
+    }
+
+    ORDER = [ANONYMOUS, LOGGED_IN, CART_WITH_PRODUCT, ORDER_PLACED]
+
+    AUTH_COOKIE = ".Nop.Authentication"
+
+    @classmethod
+    def chain(cls, state):
+        """States from the root down to (and including) the given state."""
+        if state not in cls.ORDER:
+            raise ValueError(f"Unknown application state: {state}. Use one of {cls.ORDER}")
+        chain = [state]
+        while chain[-1] in cls.PARENTS:
+            chain.append(cls.PARENTS[chain[-1]])
+        return list(reversed(chain))
+
+
+class AppStateManager:
+    """Moves one long-lived browser between application states.
+
+    Every state has a builder (expensive, goes through flows) and a
+    validity check (cheap, one or two WebDriver commands). ensure() walks
+    up from the requested state to the deepest state that is still valid
+    and only builds the missing steps.
+    """
+
+    CART_QUANTITY_SCRIPT = """
+        var qty = document.querySelector('.header-links .cart-qty');
+        if (!qty) { return -1; }
+        return parseInt(qty.textContent.replace(/[^0-9]/g, ''), 10) || 0;
+    """
+
+    def __init__(self, driver):
+        """Initialize AppStateManager.
+
+        Args:
+            driver: Selenium WebDriver kept alive across tests
+        """
+        self.driver = driver
+        self.base_url = ReadProperties().get_base_url().rstrip("/")
+        self.current = None
+        self.order_confirmation_url = None
+        self.stats = {"reused": 0, "built": 0, "transitions": 0}
+        self._builders = {
+            AppState.ANONYMOUS: self._build_anonymous,
+            AppState.LOGGED_IN: self._build_logged_in,
+            AppState.CART_WITH_PRODUCT: self._build_cart_with_product,
+            AppState.ORDER_PLACED: self._build_order_placed,
+        }
+        self._checks = {
+            AppState.ANONYMOUS: self._is_anonymous,
+            AppState.LOGGED_IN: self._is_logged_in,
+            AppState.CART_WITH_PRODUCT: self._has_product_in_cart,
+            AppState.ORDER_PLACED: self._has_placed_order,
+        }
+
+    def ensure(self, state):
+        """Bring the browser into the requested state.
+
+        Args:
+            state (str): One of AppState.ORDER
+
+        Returns:
+            bool: True if the existing state was reused without rebuilding
+        """
+        chain = AppState.chain(state)
+
+        start = 0
+        for index in range(len(chain) - 1, -1, -1):
+            if self.is_valid(chain[index]):
+                start = index + 1
+                break
+
+        steps = chain[start:]
+        if not steps:
+            self.current = state
+            self.stats["reused"] += 1
+            logger.info(f"Reusing application state '{state}'")
+            return True
+
+        logger.info(f"Building application state '{state}' via {steps}")
+        for step in steps:
+            self._builders[step]()
+            self.stats["transitions"] += 1
+        self.current = state
+        self.stats["built"] += 1
+        return False
+
+    def is_valid(self, state):
+        """Cheap check whether the browser is currently in the given state."""
+        try:
+            return self._checks[state]()
+        except Exception as e:
+            logger.warning(f"Validity check for '{state}' failed: {str(e)}")
+            return False
+
+    # ===== Validity checks =====
+
+    def _auth_cookie(self):
+        return self.driver.get_cookie(AppState.AUTH_COOKIE)
+
+    def _is_anonymous(self):
+        return self._auth_cookie() is None
+
+    def _is_logged_in(self):
+        return self._auth_cookie() is not None
+
+    def _has_product_in_cart(self):
+        if not self._is_logged_in():
+            return False
+        return self.driver.execute_script(self.CART_QUANTITY_SCRIPT) > 0
+
+    def _has_placed_order(self):
+        return self.order_confirmation_url is not None and self._is_logged_in()
+
+    # ===== Builders =====
+
+    def _build_anonymous(self):
+        self.driver.delete_all_cookies()
+        self.order_confirmation_url = None
+        self.driver.get(self.base_url)
+
+    def _build_logged_in(self):
+        from utilities.httpAuthenticator import HttpAuthenticator
+
+        email = ReadProperties.get("USER_CREDENTIALS", "valid_email")
+        password = ReadProperties.get("USER_CREDENTIALS", "valid_password")
+        if HttpAuthenticator(self.base_url).authenticate_driver(self.driver, email, password):
+            self.driver.get(self.base_url)
+            return
+
+        from flows.loginFlow import LoginFlow
+
+        logger.warning("HTTP login unavailable - falling back to UI login")
+        LoginFlow(self.driver).login_user(email, password)
+
+    def _build_cart_with_product(self):
+        from utilities.browserCartSeeder import BrowserCartSeeder
+
+        product_path = ReadProperties.get("APP_STATE", "cart_product_path")
+        seeded = BrowserCartSeeder(self.driver, self.base_url).add_to_cart([product_path])
+        if seeded["success"] or seeded["cart_count_after"] > 0:
+            return
+
+        from flows.productDisplayFlow import ProductDisplayFlow
+
+        logger.warning("In-browser cart seeding failed - falling back to the product page")
+        self.driver.get(f"{self.base_url}{product_path}")
+        ProductDisplayFlow(self.driver).add_product_to_cart()
+
+    def _build_order_placed(self):
+        from flows.checkoutFlow import CheckoutFlow
+
+        billing_details = {
+            "first_name": ReadProperties.get("APP_STATE", "billing_first_name"),
+            "last_name": ReadProperties.get("APP_STATE", "billing_last_name"),
+            "email": ReadProperties.get("USER_CREDENTIALS", "valid_email"),
+            "country": ReadProperties.get("APP_STATE", "billing_country"),
+            "city": ReadProperties.get("APP_STATE", "billing_city"),
+            "address1": ReadProperties.get("APP_STATE", "billing_address1"),
+            "postal_code": ReadProperties.get("APP_STATE", "billing_postal_code"),
+            "phone": ReadProperties.get("APP_STATE", "billing_phone"),
+        }
+        self.driver.get(f"{self.base_url}/onepagecheckout")
+        checkout_flow = CheckoutFlow(self.driver)
+        checkout_flow.complete_checkout_with_same_shipping_address(
+            billing_details,
+            ReadProperties.get("APP_STATE", "shipping_method"),
+            ReadProperties.get("APP_STATE", "payment_method"),
+        )
+        checkout_flow.place_order()
+        self.order_confirmation_url = self.driver.current_url
+
+
+class StateGroupingScheduler:
+    """Pytest plugin grouping tests by their required application state.
+
+    Tests keep their relative order inside a group (so a duration-based
+    ordering applied earlier is preserved). Each group is tagged with an
+    xdist_group so `--dist loadgroup` keeps it on one worker and browser.
+    """
+
+    MARKER = "requires_state"
+
+    @staticmethod
+    def required_state(item):
+        marker = item.get_closest_marker(StateGroupingScheduler.MARKER)
+        return marker.args[0] if marker else None
+
+    def __init__(self):
+        self.grouped = 0
+
+    def pytest_itemcollected(self, item):
+        # Tagged at collection time: xdist's own pytest_collection_modifyitems
+        # reads xdist_group to build the @group node ids, so a later hook is too late
+        state = self.required_state(item)
+        if state is not None:
+            item.add_marker(pytest.mark.xdist_group(name=f"state-{state}"))
+            self.grouped += 1
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        rank = {state: index for index, state in enumerate(AppState.ORDER)}
+        items.sort(key=lambda item: rank.get(self.required_state(item), -1))
+        if self.grouped:
+            logger.info(f"Grouped {self.grouped} tests by required application state")
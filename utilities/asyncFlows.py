@@ -0,0 +1,249 @@
+"""Asyncio façade over blocking flows and page objects.
+
+Responsibility:
+- Let one asyncio event loop coordinate many browsers at once
+- Own each WebDriver by exactly one worker thread (an actor), reusing
+  DriverThread from utilities.sessionOrchestrator
+- Turn flow and page methods into awaitables marshalled to that thread
+- Apply per-call timeouts, cancellation and a global concurrency bound
+
+Flows stay blocking and unchanged. Only the calling side becomes async,
+and no driver is ever touched from two threads.
+
+Cancellation: a call that is still queued on its actor is dropped. A call
+that already started cannot interrupt the browser mid-command; it finishes
+on the actor thread and its result is discarded. It keeps its concurrency
+slot until it has finished, so a timed-out call never overlaps the next one.
+
+Usage:
+    async def search_everywhere(drivers):
+        async with AsyncFlowController(max_concurrency=8) as controller:
+            flows = [await controller.actor(d).flow(SearchFlow) for d in drivers]
+            return await asyncio.gather(
+                *(f.perform_product_search("Lenovo", call_timeout=30) for f in flows)
+            )
+
+Attributes that are not methods (including lazily built page objects) are
+resolved on the actor thread too, so they are awaited:
+
+    home_page = await flow.home_page    # AsyncProxy of the flow's HomePage
+"""
+
+import asyncio
+import functools
+import itertools
+from utilities.customLogger import LoggerFactory
+from utilities.sessionOrchestrator import DriverThread
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class AsyncProxy:
+    """Wraps a flow or page object so its methods return awaitables.
+
+    Every method call runs on the owning actor's thread and accepts an
+    extra `call_timeout` keyword (seconds) overriding the controller's
+    default timeout. Any other attribute access returns an awaitable that
+    reads the attribute on the actor thread; page and flow objects bound
+    to the actor's driver come back wrapped in an AsyncProxy.
+    """
+
+    def __init__(self, actor, target):
+        self._actor = actor
+        self._target = target
+
+    @property
+    def target(self):
+        """Underlying blocking object (only safe to use from the actor thread)."""
+        return self._target
+
+    def __getattr__(self, name):
+        # Decided from the class only: touching the instance here could build a
+        # LazyPage (and drive the browser) on the event-loop thread
+        declared = getattr(type(self._target), name, None)
+        if callable(declared):
+            return self._method(name, declared)
+        return self._resolve(name)
+
+    def _method(self, name, declared):
+        target = self._target
+
+        @functools.wraps(declared)
+        async def method(*args, call_timeout=None, **kwargs):
+            def invoke():
+                return getattr(target, name)(*args, **kwargs)
+
+            invoke.__name__ = name
+            return await self._actor.call(invoke, timeout=call_timeout)
+
+        return method
+
+    async def _resolve(self, name):
+        value = await self._actor.call(getattr, self._target, name)
+        if getattr(value, "driver", None) is self._actor.driver:
+            return self._actor.wrap(value)
+        return value
+
+    def __repr__(self):
+        return f"AsyncProxy({type(self._target).__name__} on {self._actor.name})"
+
+
+def _release_slot(loop, semaphore):
+    """Give a concurrency slot back from the actor thread once its call has finished."""
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        # Event loop already closed: nobody is waiting for the slot any more
+        pass
+
+
+class DriverActor:
+    """Owns one WebDriver and executes every call for it on one thread."""
+
+    def __init__(self, controller, driver, name):
+        """Initialize DriverActor.
+
+        Args:
+            controller (AsyncFlowController): Controller providing limits/timeouts
+            driver: Selenium WebDriver owned by this actor
+            name (str): Actor name used for the thread and logs
+        """
+        self.controller = controller
+        self.driver = driver
+        self.name = name
+        self._thread = DriverThread(driver, name)
+        self._pending = set()
+
+    async def call(self, fn, *args, timeout=None, **kwargs):
+        """Run a blocking callable on the actor thread and await its result.
+
+        Args:
+            fn: Callable that uses this actor's driver
+            timeout (float): Seconds before the call is abandoned
+                (default: controller.default_timeout)
+
+        Returns:
+            Any: fn's return value
+
+        Raises:
+            asyncio.TimeoutError: If the call did not finish in time
+            asyncio.CancelledError: If the awaiting task was cancelled
+        """
+        timeout = self.controller.default_timeout if timeout is None else timeout
+        semaphore = self.controller.semaphore
+        await semaphore.acquire()
+        try:
+            future = self._thread.submit(fn, *args, **kwargs)
+        except BaseException:
+            semaphore.release()
+            raise
+        # The slot is released when the call has finished on the actor thread
+        # (or was dropped from its queue), not when the awaiting task gives up
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: _release_slot(loop, semaphore))
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            logger.error(f"Actor '{self.name}': {getattr(fn, '__name__', fn)} timed out after {timeout}s")
+            raise
+        except asyncio.CancelledError:
+            future.cancel()
+            logger.warning(f"Actor '{self.name}': {getattr(fn, '__name__', fn)} cancelled")
+            raise
+
+    async def flow(self, flow_class):
+        """Construct a flow on the actor thread and return its async proxy."""
+        instance = await self.call(flow_class, self.driver)
+        return AsyncProxy(self, instance)
+
+    async def page(self, page_class):
+        """Construct a page object on the actor thread and return its async proxy."""
+        instance = await self.call(page_class, self.driver)
+        return AsyncProxy(self, instance)
+
+    def wrap(self, target):
+        """Wrap an object already bound to this actor's driver."""
+        return AsyncProxy(self, target)
+
+    def cancel_pending(self):
+        """Drop every call still queued on this actor.
+
+        Returns:
+            int: Number of queued calls that were cancelled
+        """
+        cancelled = sum(1 for future in list(self._pending) if future.cancel())
+        if cancelled:
+            logger.info(f"Actor '{self.name}': cancelled {cancelled} queued calls")
+        return cancelled
+
+    async def close(self, quit_driver=False):
+        """Stop the actor thread, optionally quitting its driver first."""
+        self.cancel_pending()
+        if quit_driver:
+            try:
+                await self.call(self.driver.quit)
+            except Exception as e:
+                logger.warning(f"Actor '{self.name}': error quitting driver: {str(e)}")
+        await asyncio.get_running_loop().run_in_executor(None, self._thread.shutdown)
+
+
+class AsyncFlowController:
+    """Coordinates many driver actors from one event loop.
+
+    The semaphore bounds how many blocking calls run at once across all
+    actors, so dozens of browsers do not overwhelm the machine or the
+    application under test.
+    """
+
+    def __init__(self, max_concurrency=8, default_timeout=120):
+        """Initialize AsyncFlowController.
+
+        Args:
+            max_concurrency (int): Max blocking calls in flight across all actors (default: 8)
+            default_timeout (float): Default per-call timeout in seconds (default: 120)
+        """
+        self.max_concurrency = max_concurrency
+        self.default_timeout = default_timeout
+        self.actors = []
+        self._semaphore = None
+        self._names = itertools.count(1)
+
+    @property
+    def semaphore(self):
+        # Created lazily so it binds to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def actor(self, driver, name=None):
+        """Create an actor that owns the given driver.
+
+        Args:
+            driver: Selenium WebDriver (must not be used outside the actor afterwards)
+            name (str): Optional actor name (default: 'actor-<n>')
+
+        Returns:
+            DriverActor: The new actor
+        """
+        actor = DriverActor(self, driver, name or f"actor-{next(self._names)}")
+        self.actors.append(actor)
+        logger.info(f"Created driver actor '{actor.name}'")
+        return actor
+
+    async def close(self, quit_drivers=False):
+        """Close every actor, optionally quitting their drivers."""
+        await asyncio.gather(
+            *(actor.close(quit_driver=quit_drivers) for actor in self.actors),
+            return_exceptions=True,
+        )
+        self.actors.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
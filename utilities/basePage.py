@@ -1,11 +1,16 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from utilities.customLogger import LoggerFactory
 from utilities.readProperties import ReadConfig
+from utilities.pacing import Pacing
+from utilities.actionSequence import ActionSequence
+from utilities.elementCache import ElementCache
+from utilities.locatorTools import UnionBranchRecorder, XPathToCss
+from utilities.fallbackLocator import FallbackLocator
 import time
 import random
 
@@ -13,27 +18,78 @@ import random
 class BasePage:
     logger = LoggerFactory.get_logger(__name__)
 
+    # Locator-based wait condition -> the same condition applied to an already found element
+    ELEMENT_CONDITIONS = {
+        EC.element_to_be_clickable: EC.element_to_be_clickable,
+        EC.visibility_of_element_located: EC.visibility_of,
+    }
+
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(
-            driver, int(ReadConfig.get("TIMEOUTS", "explicit_wait"))
-        )
+        self.timeout = int(ReadConfig.get("TIMEOUTS", "explicit_wait"))
+        self.wait = WebDriverWait(driver, self.timeout)
+        self.element_cache = ElementCache.for_driver(driver)
         # Ensure Cloudflare Turnstile is handled on page load
         self._handle_cloudflare_on_init()
 
+    def _find_element(self, locator, condition=EC.presence_of_element_located, reacquire=False):
+        """Element for a locator, reusing the cached handle while the page is unchanged.
+
+        A miss goes through the explicit wait. A hit (or a direct re-find after a
+        stale handle) only re-checks the condition on the element itself.
+        """
+        element = None if reacquire else self.element_cache.get(locator)
+        if element is None and isinstance(locator, FallbackLocator):
+            element = self.element_cache.put(locator, locator.find(self.driver, self.timeout))
+        elif element is None:
+            if reacquire:
+                try:
+                    element = self.driver.find_element(*locator)
+                except NoSuchElementException:
+                    element = None
+            if element is None:
+                return self.element_cache.put(locator, self.wait.until(condition(locator)))
+            self.element_cache.put(locator, element)
+
+        element_condition = self.ELEMENT_CONDITIONS.get(condition)
+        if element_condition is not None:
+            self.wait.until(element_condition(element))
+        return element
+
+    def _with_element(self, locator, action, condition=EC.presence_of_element_located):
+        """Run action(element); on a stale cached handle, re-acquire once and retry.
+
+        A cached handle from another window or browsing context can be
+        reported as "no such element" instead of stale, so that is retried the
+        same way; for a freshly found handle it is the action's own error.
+        """
+        if not isinstance(locator, FallbackLocator):
+            UnionBranchRecorder.record(self.driver, locator)
+            locator = XPathToCss.compile_locator(locator)
+        cached = locator in self.element_cache
+        try:
+            return action(self._find_element(locator, condition))
+        except (StaleElementReferenceException, NoSuchElementException) as e:
+            if isinstance(e, NoSuchElementException) and not cached:
+                raise
+            self.logger.debug(f"Cached element went stale, re-acquiring: {locator}")
+            self.element_cache.stale()
+            return action(self._find_element(locator, condition, reacquire=True))
+
     def click(self, locator):
         try:
             # CRITICAL: Handle Cloudflare Turnstile before interacting with page
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Clicking on element: {locator}")
-            element = self.wait.until(EC.element_to_be_clickable(locator))
             
-            # Scroll to element to ensure it's visible
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Brief wait after scrolling
+            def scroll_and_click(element):
+                # Scroll to element to ensure it's visible
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                self.wait_for_visual_stability(element)  # Scrolling / animations settled
+                element.click()
             
-            element.click()
+            self._with_element(locator, scroll_and_click, EC.element_to_be_clickable)
         except TimeoutException:
             self.logger.error(f"Timeout: Element not clickable: {locator}")
             raise
@@ -45,10 +101,13 @@ class BasePage:
             
             self.logger.debug(f"Typing '{text}' into element: {locator}")
             self.logger.info(f"Waiting for presence of element with 10s timeout: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            self.logger.info(f"Element found, clearing and typing...")
-            element.clear()
-            element.send_keys(text)
+            
+            def clear_and_type(element):
+                self.logger.info(f"Element found, clearing and typing...")
+                element.clear()
+                element.send_keys(text)
+            
+            self._with_element(locator, clear_and_type)
             self.logger.info(f"Successfully typed into element")
         except TimeoutException as te:
             self.logger.error(f"Timeout: Element not found: {locator}")
@@ -63,11 +122,13 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Typing '{text}' into element with delay {delay}s: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            element.clear()
-            for character in text:
-                element.send_keys(character)
-                time.sleep(delay)
+            def clear_and_type_slowly(element):
+                element.clear()
+                for character in text:
+                    element.send_keys(character)
+                    Pacing.pause(delay)
+
+            self._with_element(locator, clear_and_type_slowly)
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
             raise
@@ -78,8 +139,7 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Getting text from element: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            return element.text
+            return self._with_element(locator, lambda element: element.text)
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
             raise
@@ -89,8 +149,7 @@ class BasePage:
             # CRITICAL: Handle Cloudflare Turnstile before checking visibility
             self._ensure_cloudflare_resolved(locator)
             
-            self.wait.until(EC.visibility_of_element_located(locator))
-            return True
+            return self._with_element(locator, lambda element: True, EC.visibility_of_element_located)
         except TimeoutException:
             return False
 
@@ -101,9 +160,7 @@ class BasePage:
             from selenium.webdriver.support.select import Select
 
             self.logger.debug(f"Selecting value '{value}' from dropdown: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            dropdown = Select(element)
-            dropdown.select_by_value(value)
+            self._with_element(locator, lambda element: Select(element).select_by_value(value))
         except TimeoutException:
             self.logger.error(f"Timeout: Dropdown not found: {locator}")
             raise
@@ -113,15 +170,16 @@ class BasePage:
             # CRITICAL: Handle Cloudflare Turnstile before interacting with page
             self._ensure_cloudflare_resolved(locator)
             
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            return element.is_selected()
+            return self._with_element(locator, lambda element: element.is_selected())
         except TimeoutException:
             self.logger.error(f"Timeout: Checkbox not found: {locator}")
             raise
 
     def is_element_present(self, locator):
+        if isinstance(locator, FallbackLocator):
+            return bool(locator.find_all(self.driver))
         try:
-            self.driver.find_element(*locator)
+            self.driver.find_element(*XPathToCss.compile_locator(locator))
             return True
         except NoSuchElementException:
             return False
@@ -129,7 +187,9 @@ class BasePage:
     def find_elements(self, locator):
         try:
             self.logger.debug(f"Finding elements: {locator}")
-            return self.driver.find_elements(*locator)
+            if isinstance(locator, FallbackLocator):
+                return locator.find_all(self.driver)
+            return self.driver.find_elements(*XPathToCss.compile_locator(locator))
         except NoSuchElementException:
             self.logger.warning(f"No elements found: {locator}")
             return []
@@ -142,9 +202,7 @@ class BasePage:
             from selenium.webdriver.support.select import Select
 
             self.logger.debug(f"Selecting text '{text}' from dropdown: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            dropdown = Select(element)
-            dropdown.select_by_visible_text(text)
+            self._with_element(locator, lambda element: Select(element).select_by_visible_text(text))
         except TimeoutException:
             self.logger.error(f"Timeout: Dropdown not found: {locator}")
             raise
@@ -154,11 +212,12 @@ class BasePage:
             # CRITICAL: Handle Cloudflare Turnstile before interacting with page
             self._ensure_cloudflare_resolved(locator)
             
-            from selenium.webdriver.common.action_chains import ActionChains
-
             self.logger.debug(f"Double clicking on element: {locator}")
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            ActionChains(self.driver).double_click(element).perform()
+            self._with_element(
+                locator,
+                lambda element: self.actions().double_click(element).perform(raise_errors=True),
+                EC.element_to_be_clickable,
+            )
         except TimeoutException:
             self.logger.error(f"Timeout: Element not clickable: {locator}")
             raise
@@ -168,11 +227,12 @@ class BasePage:
             # CRITICAL: Handle Cloudflare Turnstile before interacting with page
             self._ensure_cloudflare_resolved(locator)
             
-            from selenium.webdriver.common.action_chains import ActionChains
-
             self.logger.debug(f"Right clicking on element: {locator}")
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            ActionChains(self.driver).context_click(element).perform()
+            self._with_element(
+                locator,
+                lambda element: self.actions().right_click(element).perform(raise_errors=True),
+                EC.element_to_be_clickable,
+            )
         except TimeoutException:
             self.logger.error(f"Timeout: Element not clickable: {locator}")
             raise
@@ -182,23 +242,27 @@ class BasePage:
             # CRITICAL: Handle Cloudflare Turnstile before interacting with page
             self._ensure_cloudflare_resolved(locator)
             
-            from selenium.webdriver.common.action_chains import ActionChains
-
             self.logger.debug(f"Hovering over element: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            ActionChains(self.driver).move_to_element(element).perform()
+            self._with_element(locator, lambda element: self.actions().hover(element).perform(raise_errors=True))
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
             raise
 
+    def actions(self):
+        """Start a fluent keyboard/mouse sequence sent as batched W3C Actions.
+
+        Returns:
+            ActionSequence: Builder; call perform() to send it
+        """
+        return ActionSequence(self.driver)
+
     def get_attribute(self, locator, attribute_name):
         try:
             # CRITICAL: Handle Cloudflare Turnstile before interacting with page
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Getting attribute '{attribute_name}' from element: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            return element.get_attribute(attribute_name)
+            return self._with_element(locator, lambda element: element.get_attribute(attribute_name))
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
             raise
@@ -209,8 +273,7 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Clearing field: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            element.clear()
+            self._with_element(locator, lambda element: element.clear())
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
             raise
@@ -221,8 +284,7 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Submitting form: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            element.submit()
+            self._with_element(locator, lambda element: element.submit())
         except TimeoutException:
             self.logger.error(f"Timeout: Form element not found: {locator}")
             raise
@@ -233,7 +295,7 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Waiting for element to disappear: {locator}")
-            self.wait.until(EC.invisibility_of_element_located(locator))
+            self.wait.until(EC.invisibility_of_element_located(XPathToCss.compile_locator(locator)))
             return True
         except TimeoutException:
             self.logger.error(f"Timeout: Element did not disappear: {locator}")
@@ -245,8 +307,9 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Scrolling to element: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            self._with_element(
+                locator, lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+            )
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
             raise
@@ -266,14 +329,15 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.info(f"Typing with random delay (human-like): '{text}' into {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            element.clear()
-            
-            for character in text:
-                element.send_keys(character)
-                # Random delay between each character
-                random_delay = random.uniform(min_delay, max_delay)
-                time.sleep(random_delay)
+            def clear_and_type_with_delays(element):
+                element.clear()
+                for character in text:
+                    element.send_keys(character)
+                    # Random delay between each character
+                    random_delay = random.uniform(min_delay, max_delay)
+                    Pacing.pause(random_delay)
+            
+            self._with_element(locator, clear_and_type_with_delays)
                 
             self.logger.info(f"Typing completed with human-like behavior")
         except TimeoutException:
@@ -291,11 +355,13 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Clicking with pause: {locator}")
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)
-            element.click()
-            time.sleep(pause_after)
+            def scroll_and_click(element):
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                self.wait_for_visual_stability(element)
+                element.click()
+            
+            self._with_element(locator, scroll_and_click, EC.element_to_be_clickable)
+            Pacing.pause(pause_after)
             self.logger.info(f"Clicked with {pause_after}s pause for human-like behavior")
         except TimeoutException:
             self.logger.error(f"Timeout: Element not clickable: {locator}")
@@ -313,13 +379,15 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.info(f"Typing with TAB navigation: '{text}' into {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            element.clear()
-            element.send_keys(text)
-            
+            def clear_and_type(element):
+                element.clear()
+                element.send_keys(text)
+                if use_tab:
+                    Pacing.pause(0.2)
+                    element.send_keys(Keys.TAB)
+            
+            self._with_element(locator, clear_and_type)
             if use_tab:
-                time.sleep(0.2)
-                element.send_keys(Keys.TAB)
                 self.logger.info("TAB key pressed to move to next field")
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
@@ -336,16 +404,17 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Moving to element slowly: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            
-            # Scroll element into view first
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.3)
+            def scroll_and_move(element):
+                # Scroll element into view first
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                Pacing.pause(0.3)
+                
+                # Move cursor slowly to element
+                actions = ActionChains(self.driver)
+                actions.move_to_element(element).perform()
             
-            # Move cursor slowly to element
-            actions = ActionChains(self.driver)
-            actions.move_to_element(element).perform()
-            time.sleep(duration)
+            self._with_element(locator, scroll_and_move)
+            Pacing.pause(duration)
             
             self.logger.info(f"Mouse moved to element over {duration}s")
         except TimeoutException:
@@ -363,47 +432,39 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Focusing element with delay: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            
-            # Scroll into view
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(delay)
+            def scroll_and_focus(element):
+                # Scroll into view
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                Pacing.pause(delay)
+                
+                # Click to focus
+                element.click()
             
-            # Click to focus
-            element.click()
-            time.sleep(0.2)
+            self._with_element(locator, scroll_and_focus)
+            Pacing.pause(0.2)
             
             self.logger.info(f"Element focused with {delay}s delay")
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
             raise
     
-    def wait_for_element_with_visual_stability(self, locator, wait_time=0.5):
+    def wait_for_element_with_visual_stability(self, locator, timeout=None, stable_frames=None):
         """Wait for element to be stable and not moving before interaction.
         
         Args:
             locator: Element locator tuple
-            wait_time (float): Time to wait for element stability (default: 0.5)
+            timeout (float): Max seconds to wait for stability (default: STABILITY_TIMEOUT)
+            stable_frames (int): Consecutive unchanged frames required (default: STABLE_FRAMES)
             
         Returns:
             bool: True if element is stable
         """
         try:
             self.logger.debug(f"Waiting for element stability: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            
-            # Get initial position
-            initial_rect = element.rect
-            time.sleep(wait_time)
-            
-            # Get final position
-            final_rect = element.rect
-            
-            # Check if position changed
-            is_stable = (initial_rect['x'] == final_rect['x'] and 
-                        initial_rect['y'] == final_rect['y'])
-            
-            if is_stable:
+            stable = self._with_element(
+                locator, lambda element: self.wait_for_visual_stability(element, timeout, stable_frames)
+            )
+            if stable:
                 self.logger.info("Element is stable - safe to interact")
                 return True
             else:
@@ -412,6 +473,79 @@ class BasePage:
         except TimeoutException:
             self.logger.error(f"Timeout: Element not found: {locator}")
             return False
+
+    # Consecutive animation frames with an unchanged bounding rect that count as "stable"
+    STABLE_FRAMES = 3
+
+    # Seconds to wait for stability before giving up (the action then proceeds anyway)
+    STABILITY_TIMEOUT = 2.0
+
+    # Pixels of movement still treated as unchanged (sub-pixel layout jitter)
+    STABILITY_TOLERANCE = 0.5
+
+    # Samples getBoundingClientRect once per requestAnimationFrame tick and resolves
+    # after N consecutive unchanged frames. Falls back to 16ms timers in a hidden tab,
+    # where requestAnimationFrame does not fire.
+    VISUAL_STABILITY_SCRIPT = """
+        var el = arguments[0], frames = arguments[1], timeoutMs = arguments[2],
+            tolerance = arguments[3], done = arguments[arguments.length - 1];
+        var started = performance.now(), last = null, stable = 0, sampled = 0;
+        var nextFrame = document.hidden
+            ? function (fn) { setTimeout(fn, 16); }
+            : function (fn) { window.requestAnimationFrame(fn); };
+
+        function finish(isStable) {
+            done({stable: isStable, frames: sampled, ms: performance.now() - started,
+                  detached: !el.isConnected});
+        }
+
+        function tick() {
+            if (!el.isConnected) { finish(false); return; }
+            var r = el.getBoundingClientRect();
+            var current = [r.left, r.top, r.width, r.height];
+            var unchanged = last !== null && current.every(function (value, i) {
+                return Math.abs(value - last[i]) <= tolerance;
+            });
+            stable = unchanged ? stable + 1 : 0;
+            last = current;
+            sampled++;
+            if (stable >= frames) { finish(true); return; }
+            if (performance.now() - started >= timeoutMs) { finish(false); return; }
+            nextFrame(tick);
+        }
+
+        nextFrame(tick);
+    """
+
+    def wait_for_visual_stability(self, element, timeout=None, stable_frames=None):
+        """Wait until an element's position and size stop changing across animation frames.
+        
+        Returns as soon as the element is stable (typically a few frames, ~50ms)
+        instead of sleeping a fixed time, and keeps waiting while a carousel,
+        flyout or notification is still animating.
+        
+        Args:
+            element: WebElement to watch
+            timeout (float): Max seconds to wait (default: STABILITY_TIMEOUT)
+            stable_frames (int): Consecutive unchanged frames required (default: STABLE_FRAMES)
+            
+        Returns:
+            bool: True if the element was stable within the timeout
+        """
+        timeout = timeout or self.STABILITY_TIMEOUT
+        result = self.driver.execute_async_script(
+            self.VISUAL_STABILITY_SCRIPT,
+            element,
+            stable_frames or self.STABLE_FRAMES,
+            timeout * 1000,
+            self.STABILITY_TOLERANCE,
+        )
+        if not result['stable']:
+            self.logger.debug(
+                f"Element not stable after {result['frames']} frames / {result['ms']:.0f}ms "
+                f"(detached={result['detached']})"
+            )
+        return result['stable']
     
     def scroll_slowly_to_element(self, locator, scroll_pause=0.2):
         """Scroll slowly to element in smooth motion.
@@ -424,15 +558,16 @@ class BasePage:
             self._ensure_cloudflare_resolved(locator)
             
             self.logger.debug(f"Scrolling slowly to element: {locator}")
-            element = self.wait.until(EC.presence_of_element_located(locator))
+            def smooth_scroll(element):
+                # Smooth scroll with multiple steps
+                location = element.location
+                self.driver.execute_script(
+                    "window.scrollBy(0, " + str(location['y']) + ");",
+                    element
+                )
             
-            # Smooth scroll with multiple steps
-            location = element.location
-            self.driver.execute_script(
-                "window.scrollBy(0, " + str(location['y']) + ");",
-                element
-            )
-            time.sleep(scroll_pause)
+            self._with_element(locator, smooth_scroll)
+            Pacing.pause(scroll_pause)
             
             self.logger.info(f"Smoothly scrolled to element")
         except TimeoutException:
@@ -455,10 +590,12 @@ class BasePage:
                 self._ensure_cloudflare_resolved(locator)
                 
                 self.logger.info(f"Click attempt {attempt + 1}/{retry_count}")
-                element = self.wait.until(EC.element_to_be_clickable(locator))
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.3)
-                element.click()
+                def scroll_and_click(element):
+                    self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+                    self.wait_for_visual_stability(element)
+                    element.click()
+                
+                self._with_element(locator, scroll_and_click, EC.element_to_be_clickable)
                 
                 self.logger.info(f"Successfully clicked after {attempt + 1} attempt(s)")
                 return True
@@ -471,3 +608,152 @@ class BasePage:
                     raise
         
         return False
+
+    # Sets a batch of fields in one async script call. Fields are filled in
+    # order; after each change the script waits for jQuery AJAX to settle, and
+    # a select waits until the requested option exists (e.g. states loaded
+    # after a country change).
+    FILL_FORM_SCRIPT = """
+        var fields = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+        var result = {filled: [], missing: [], errors: []};
+
+        function find(by, value) {
+            switch (by) {
+                case 'id': return document.getElementById(value);
+                case 'name': return document.getElementsByName(value)[0] || null;
+                case 'class name': return document.getElementsByClassName(value)[0] || null;
+                case 'css selector': return document.querySelector(value);
+                case 'xpath': return document.evaluate(value, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                default: return null;
+            }
+        }
+
+        function fire(el, type) {
+            el.dispatchEvent(new Event(type, {bubbles: true}));
+        }
+
+        function waitFor(condition) {
+            var deadline = Date.now() + timeoutMs;
+            return new Promise(function (resolve) {
+                (function poll() {
+                    var ok = false;
+                    try { ok = condition(); } catch (e) { ok = false; }
+                    if (ok || Date.now() > deadline) { resolve(ok); } else { setTimeout(poll, 50); }
+                })();
+            });
+        }
+
+        function ajaxIdle() {
+            return !window.jQuery || window.jQuery.active === 0;
+        }
+
+        function matchOption(select, value) {
+            var wanted = String(value).trim();
+            for (var i = 0; i < select.options.length; i++) {
+                var option = select.options[i];
+                if (option.value === wanted || option.text.trim() === wanted) { return option; }
+            }
+            return null;
+        }
+
+        function setValue(el, value) {
+            var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        }
+
+        function fill(field) {
+            var el = find(field.by, field.locator);
+            var type = el ? (el.type || '').toLowerCase() : '';
+
+            if (el && (type === 'radio') && el.name && typeof field.value === 'string') {
+                // A radio group: pick the radio whose value matches
+                var radios = document.getElementsByName(el.name);
+                el = null;
+                for (var i = 0; i < radios.length; i++) {
+                    if (radios[i].value === field.value) { el = radios[i]; }
+                }
+            }
+            if (!el) {
+                result.missing.push(field.locator);
+                return Promise.resolve();
+            }
+
+            var ready = el.tagName === 'SELECT'
+                ? waitFor(function () { return matchOption(el, field.value) !== null; })
+                : Promise.resolve(true);
+
+            return ready.then(function (found) {
+                if (!found) {
+                    result.errors.push(field.locator + ': option not found: ' + field.value);
+                    return;
+                }
+                if (el.tagName === 'SELECT') {
+                    el.value = matchOption(el, field.value).value;
+                    fire(el, 'input');
+                    fire(el, 'change');
+                } else if (type === 'checkbox' || type === 'radio') {
+                    var wanted = type === 'radio' ? true : Boolean(field.value);
+                    if (el.checked !== wanted) { el.click(); }
+                } else {
+                    el.focus();
+                    setValue(el, field.value === null ? '' : String(field.value));
+                    fire(el, 'input');
+                    fire(el, 'change');
+                    el.blur();
+                }
+                result.filled.push(field.locator);
+                return waitFor(ajaxIdle);
+            });
+        }
+
+        fields.reduce(function (chain, field) {
+            return chain.then(function () { return fill(field); });
+        }, Promise.resolve()).then(function () {
+            done(result);
+        }, function (error) {
+            result.errors.push(String(error));
+            done(result);
+        });
+    """
+
+    def fill_form(self, fields, timeout=None):
+        """Fill many form fields in one browser round-trip.
+
+        Text inputs and textareas get their value plus input/change events,
+        selects match an option by value or visible text (waiting for options
+        loaded by dependent AJAX), checkboxes follow the truthiness of the
+        value, and radios are picked by value within their group.
+        Use type()/type_slow() instead when a test exercises keystrokes.
+
+        Args:
+            fields (dict): {locator: value}, filled in insertion order
+            timeout (float): Seconds to wait for each dependent select / AJAX
+                (default: explicit wait)
+
+        Returns:
+            dict: {'success': bool, 'filled': [...], 'missing': [...], 'errors': [...]}
+        """
+        if not fields:
+            return {"success": True, "filled": [], "missing": [], "errors": []}
+
+        self._ensure_cloudflare_resolved(next(iter(fields)))
+        timeout = timeout or int(ReadConfig.get("TIMEOUTS", "explicit_wait"))
+        payload = [
+            {"by": by, "locator": value, "value": field_value}
+            for (by, value), field_value in fields.items()
+        ]
+        self.logger.debug(f"Filling {len(payload)} form fields in one script call")
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout * len(payload) + 5)
+        try:
+            result = self.driver.execute_async_script(self.FILL_FORM_SCRIPT, payload, int(timeout * 1000))
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        result["success"] = not result["missing"] and not result["errors"]
+        if result["missing"]:
+            self.logger.error(f"Form fields not found: {result['missing']}")
+        if result["errors"]:
+            self.logger.error(f"Form fill errors: {result['errors']}")
+        return result
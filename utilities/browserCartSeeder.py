@@ -0,0 +1,216 @@
+"""In-browser cart, wishlist and compare-list seeding.
+
+Responsibility:
+- Add a list of (product, quantity, attributes) to the cart, wishlist or
+  compare list from INSIDE the current browser session, using fetch()
+  against nopCommerce's AJAX endpoints and the page's antiforgery token
+- Do the whole list in one execute_async_script round-trip
+- Update and verify the header mini-cart count afterwards
+
+Because the requests run in the browser, they carry the browser's own
+cookies: anonymous carts, logged-in carts and the cookie-based compare
+list all end up exactly where a click on "Add to cart" would put them.
+
+Use this for preconditions. Tests that verify the add-to-cart UI itself
+must keep using ProductDisplayFlow.
+
+This utility does NOT:
+- Perform assertions
+- Place orders (see CheckoutFlow / DataSeeder)
+"""
+
+from utilities.customLogger import LoggerFactory
+from utilities.readProperties import ReadProperties
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class BrowserCartSeeder:
+    """Seeds cart, wishlist and compare list through the browser's own session."""
+
+    CART_TYPES = {"cart": 1, "wishlist": 2}
+
+    # Seconds the single async script may run
+    SCRIPT_TIMEOUT = 60
+
+    SEED_SCRIPT = """
+        var items = arguments[0], done = arguments[arguments.length - 1];
+        var headers = {'X-Requested-With': 'XMLHttpRequest'};
+
+        function readCartQty() {
+            var qty = document.querySelector('.header-links .cart-qty');
+            if (!qty) { return -1; }
+            return parseInt(qty.textContent.replace(/[^0-9]/g, ''), 10) || 0;
+        }
+
+        function tokenFrom(root) {
+            var input = root.querySelector('input[name="__RequestVerificationToken"]');
+            return input ? input.value : null;
+        }
+
+        function getToken() {
+            var token = tokenFrom(document);
+            if (token) { return Promise.resolve(token); }
+            return fetch('/cart', {credentials: 'same-origin'})
+                .then(function (r) { return r.text(); })
+                .then(function (html) {
+                    return tokenFrom(new DOMParser().parseFromString(html, 'text/html'));
+                });
+        }
+
+        var productIds = {};
+        function productId(product) {
+            if (typeof product === 'number') { return Promise.resolve(product); }
+            if (productIds[product]) { return Promise.resolve(productIds[product]); }
+            return fetch(product, {credentials: 'same-origin'})
+                .then(function (r) { return r.text(); })
+                .then(function (html) {
+                    var match = /data-productid="(\\d+)"/.exec(html);
+                    if (!match) { throw new Error('No product found at ' + product); }
+                    productIds[product] = parseInt(match[1], 10);
+                    return productIds[product];
+                });
+        }
+
+        function post(url, token, fields) {
+            var body = new URLSearchParams(fields);
+            body.append('__RequestVerificationToken', token);
+            return fetch(url, {method: 'POST', credentials: 'same-origin', headers: headers, body: body})
+                .then(function (r) {
+                    var type = r.headers.get('content-type') || '';
+                    return type.indexOf('json') >= 0 ? r.json() : {success: r.ok};
+                });
+        }
+
+        function addItem(token, item) {
+            return productId(item.product).then(function (id) {
+                if (item.target === 'compare') {
+                    return post('/compareproducts/add/' + id, token, {});
+                }
+                var fields = {};
+                fields['addtocart_' + id + '.EnteredQuantity'] = String(item.quantity);
+                Object.keys(item.attributes || {}).forEach(function (k) { fields[k] = item.attributes[k]; });
+                return post('/addproducttocart/details/' + id + '/' + item.cart_type, token, fields);
+            }).then(function (response) {
+                if (response.updatetopcartsectionhtml) {
+                    var qty = document.querySelector('.header-links .cart-qty');
+                    if (qty) { qty.innerHTML = response.updatetopcartsectionhtml; }
+                }
+                if (response.updatetopwishlistsectionhtml) {
+                    var wishlist = document.querySelector('.header-links .wishlist-qty');
+                    if (wishlist) { wishlist.innerHTML = response.updatetopwishlistsectionhtml; }
+                }
+                return {product: item.product, target: item.target,
+                        success: response.success !== false && response.success !== 0,
+                        message: response.message || null};
+            }, function (error) {
+                return {product: item.product, target: item.target, success: false, message: String(error)};
+            });
+        }
+
+        var before = readCartQty();
+        getToken().then(function (token) {
+            if (!token) { throw new Error('Antiforgery token not found'); }
+            // Sequential on purpose: every item mutates the same server-side cart
+            var results = [];
+            return items.reduce(function (chain, item) {
+                return chain.then(function () {
+                    return addItem(token, item).then(function (r) { results.push(r); });
+                });
+            }, Promise.resolve()).then(function () { return results; });
+        }).then(function (results) {
+            done({before: before, after: readCartQty(), results: results, error: null});
+        }, function (error) {
+            done({before: before, after: readCartQty(), results: [], error: String(error)});
+        });
+    """
+
+    def __init__(self, driver, base_url=None):
+        """Initialize BrowserCartSeeder.
+
+        Args:
+            driver: Selenium WebDriver whose session receives the items
+            base_url (str): Application URL (default: configured base URL)
+        """
+        self.driver = driver
+        self.base_url = (base_url or ReadProperties().get_base_url()).rstrip("/")
+
+    @staticmethod
+    def _normalize(item, target):
+        """Accept (product, qty, attributes) tuples or dicts; product is an SEO path or id."""
+        if isinstance(item, (str, int)):
+            item = {"product": item}
+        elif not isinstance(item, dict):
+            item = dict(zip(("product", "quantity", "attributes"), item))
+        target = item.get("target", target)
+        return {
+            "product": item["product"],
+            "quantity": int(item.get("quantity", 1)),
+            "attributes": item.get("attributes") or {},
+            "target": target,
+            "cart_type": BrowserCartSeeder.CART_TYPES.get(target, 1),
+        }
+
+    def _ensure_on_site(self):
+        """fetch() only carries the session cookies from a same-origin page."""
+        if not self.driver.current_url.startswith(self.base_url):
+            self.driver.get(self.base_url)
+
+    def seed(self, items, target="cart", verify=True):
+        """Add items to the cart, wishlist or compare list in one round-trip.
+
+        Args:
+            items (list): (product, quantity, attributes) tuples, product paths,
+                or dicts with 'product', 'quantity', 'attributes', 'target'
+            target (str): Default target: 'cart', 'wishlist' or 'compare'
+            verify (bool): Check that the mini-cart count grew by the cart quantity
+
+        Returns:
+            dict: {'success': bool, 'results': [...], 'cart_count_before',
+                   'cart_count_after', 'expected_cart_count', 'error'}
+        """
+        normalized = [self._normalize(item, target) for item in items]
+        self._ensure_on_site()
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        try:
+            outcome = self.driver.execute_async_script(self.SEED_SCRIPT, normalized)
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        added_to_cart = sum(
+            item["quantity"]
+            for item, result in zip(normalized, outcome["results"])
+            if item["target"] == "cart" and result["success"]
+        )
+        expected = outcome["before"] + added_to_cart if outcome["before"] >= 0 else None
+        success = outcome["error"] is None and all(result["success"] for result in outcome["results"])
+        if verify and expected is not None and outcome["after"] != expected:
+            logger.warning(f"Mini-cart shows {outcome['after']}, expected {expected}")
+            success = False
+
+        for result in outcome["results"]:
+            if not result["success"]:
+                logger.warning(f"Could not add {result['product']} to {result['target']}: {result['message']}")
+        if outcome["error"]:
+            logger.error(f"In-browser seeding failed: {outcome['error']}")
+
+        logger.info(f"Seeded {len(normalized)} items in the browser session (success={success})")
+        return {
+            "success": success,
+            "results": outcome["results"],
+            "cart_count_before": outcome["before"],
+            "cart_count_after": outcome["after"],
+            "expected_cart_count": expected,
+            "error": outcome["error"],
+        }
+
+    def add_to_cart(self, items, verify=True):
+        return self.seed(items, "cart", verify)
+
+    def add_to_wishlist(self, items):
+        return self.seed(items, "wishlist", verify=False)
+
+    def add_to_compare(self, items):
+        return self.seed(items, "compare", verify=False)
@@ -0,0 +1,276 @@
+"""Isolated CDP browser contexts for multi-user scenarios.
+
+Responsibility:
+- Create isolated browser contexts inside ONE running Chrome instance
+  via the DevTools protocol (Target.createBrowserContext)
+- Give every context its own cookie jar, storage and window
+- Keep a separate set of page objects / flows per context
+- Switch the shared WebDriver between contexts cheaply
+
+Launching a second browser for a second user costs a full Chrome start
+and a WebDriver session. A browser context costs one CDP call and
+behaves like an incognito profile: users cannot see each other's
+cookies, carts or logins.
+
+This utility does NOT:
+- Perform assertions
+- Log users in (use flows inside a context for that)
+- Run contexts concurrently (one WebDriver drives one window at a time)
+
+Usage:
+    pool = BrowserContextPool(driver)
+    buyer_one = pool.create("buyer_one", url=base_url)
+    buyer_two = pool.create("buyer_two", url=base_url)
+
+    with pool.using("buyer_one") as ctx:
+        ctx.flow(LoginFlow).login_user(email, password)
+
+    buyer_two.activate()
+    buyer_two.flow(SearchFlow).perform_product_search("Lenovo")
+
+    pool.close_all()
+"""
+
+from contextlib import contextmanager
+from utilities.customLogger import LoggerFactory
+from utilities.elementCache import ElementCache
+from utilities.pageRegistry import PageRegistry
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class IsolatedContext:
+    """One isolated user inside a shared Chrome instance.
+
+    Holds the CDP browser context id, the window handle of the context's
+    page target, the flows created for this user and a page registry of
+    its own, so no page object is shared with another context.
+    """
+
+    def __init__(self, pool, name, browser_context_id, window_handle):
+        """Initialize IsolatedContext.
+
+        Args:
+            pool (BrowserContextPool): Pool that owns this context
+            name (str): Logical user name (e.g. 'buyer_one')
+            browser_context_id (str): CDP browser context id
+            window_handle (str): WebDriver handle of the context's window
+        """
+        self.pool = pool
+        self.name = name
+        self.browser_context_id = browser_context_id
+        self.window_handle = window_handle
+        self.page_registry = PageRegistry(pool.driver)
+        self._objects = {}
+
+    @property
+    def driver(self):
+        """WebDriver shared by every context of the pool."""
+        return self.pool.driver
+
+    @property
+    def is_active(self):
+        """True if the shared driver currently points at this context."""
+        return self.pool.active_context is self
+
+    def activate(self):
+        """Point the shared WebDriver at this context's window.
+
+        Returns:
+            IsolatedContext: self, for chaining
+        """
+        self.pool.switch_to(self.name)
+        return self
+
+    def flow(self, flow_class):
+        """Get this context's instance of a flow, creating it on first use.
+
+        Flows are cached per context so each user keeps its own flow
+        state. The context is activated before the instance is returned.
+
+        Args:
+            flow_class: Flow class taking the driver as only argument
+
+        Returns:
+            object: Flow instance bound to the shared driver
+        """
+        return self._get_or_create(flow_class)
+
+    def page(self, page_class):
+        """Get this context's instance of a page object, creating it on first use.
+
+        Args:
+            page_class: Page object class (BasePage subclass)
+
+        Returns:
+            BasePage: This context's page object (the same instance its flows use)
+        """
+        self.activate()
+        return self.page_registry.get(page_class)
+
+    def _get_or_create(self, cls):
+        self.activate()
+        if cls not in self._objects:
+            logger.debug(f"Creating {cls.__name__} for context '{self.name}'")
+            self._objects[cls] = cls(self.driver)
+        return self._objects[cls]
+
+    def get_cookies(self):
+        """Return the cookies visible to this context only.
+
+        Returns:
+            list: Cookie dicts as returned by WebDriver
+        """
+        self.activate()
+        return self.driver.get_cookies()
+
+    def open(self, url):
+        """Navigate this context's window to a URL."""
+        self.activate()
+        logger.info(f"Context '{self.name}' navigating to {url}")
+        self.driver.get(url)
+        ElementCache.invalidate_driver(self.driver)
+
+    def __repr__(self):
+        return f"IsolatedContext(name={self.name!r}, window={self.window_handle!r})"
+
+
+class BrowserContextPool:
+    """Creates and switches between isolated browser contexts on one driver.
+
+    Every context is created with Target.createBrowserContext and gets a
+    page target of its own. ChromeDriver exposes each page target as a
+    window handle, so switching users is a single switch_to.window call.
+    """
+
+    def __init__(self, driver):
+        """Initialize BrowserContextPool.
+
+        Args:
+            driver: Chromium-based Selenium WebDriver (must support execute_cdp_cmd)
+
+        Raises:
+            ValueError: If the driver cannot issue DevTools commands
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            raise ValueError(
+                "Isolated browser contexts require a Chromium-based driver "
+                f"(got {type(driver).__name__})"
+            )
+        self.driver = driver
+        self.default_handle = driver.current_window_handle
+        self.default_registry = PageRegistry.for_driver(driver)
+        self.contexts = {}
+        self.active_context = None
+
+    def create(self, name, url="about:blank"):
+        """Create a new isolated context with its own window.
+
+        Args:
+            name (str): Logical user name, unique within the pool
+            url (str): Initial URL of the context's window (default: about:blank)
+
+        Returns:
+            IsolatedContext: The new, activated context
+
+        Raises:
+            ValueError: If a context with the same name already exists
+        """
+        if name in self.contexts:
+            raise ValueError(f"Browser context '{name}' already exists")
+
+        logger.info(f"Creating isolated browser context '{name}'")
+        context_id = self.driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {"disposeOnDetach": True}
+        )["browserContextId"]
+        target_id = self.driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": url, "browserContextId": context_id}
+        )["targetId"]
+
+        context = IsolatedContext(self, name, context_id, target_id)
+        self.contexts[name] = context
+        self.switch_to(name)
+        logger.info(f"Browser context '{name}' ready (window={target_id})")
+        return context
+
+    def get(self, name):
+        """Return an existing context by name.
+
+        Raises:
+            KeyError: If no context with that name exists
+        """
+        if name not in self.contexts:
+            raise KeyError(f"Unknown browser context '{name}'")
+        return self.contexts[name]
+
+    def switch_to(self, name):
+        """Point the shared driver at the named context.
+
+        No WebDriver command is sent if the context is already active.
+        Cached element handles belong to the previous window and are dropped;
+        flows created from now on use the context's page registry.
+
+        Returns:
+            IsolatedContext: The activated context
+        """
+        context = self.get(name)
+        if self.active_context is not context:
+            logger.debug(f"Switching driver to browser context '{name}'")
+            self.driver.switch_to.window(context.window_handle)
+            ElementCache.invalidate_driver(self.driver)
+            PageRegistry.activate(self.driver, context.page_registry)
+            self.active_context = context
+        return context
+
+    @contextmanager
+    def using(self, name):
+        """Temporarily activate a context, restoring the previous one afterwards.
+
+        Usage:
+            with pool.using("buyer_two") as ctx:
+                ctx.flow(ProductDisplayFlow).add_product_to_cart()
+        """
+        previous = self.active_context
+        context = self.switch_to(name)
+        try:
+            yield context
+        finally:
+            if previous is not None and previous.name in self.contexts:
+                self.switch_to(previous.name)
+
+    def close(self, name):
+        """Close a context's window and dispose its cookie jar and storage."""
+        context = self.contexts.pop(name, None)
+        if context is None:
+            return
+
+        logger.info(f"Disposing browser context '{name}'")
+        try:
+            self.driver.execute_cdp_cmd(
+                "Target.closeTarget", {"targetId": context.window_handle}
+            )
+            self.driver.execute_cdp_cmd(
+                "Target.disposeBrowserContext",
+                {"browserContextId": context.browser_context_id},
+            )
+        except Exception as e:
+            logger.warning(f"Error disposing browser context '{name}': {str(e)}")
+
+        if self.active_context is context:
+            self.active_context = None
+            self.driver.switch_to.window(self.default_handle)
+            ElementCache.invalidate_driver(self.driver)
+            PageRegistry.activate(self.driver, self.default_registry)
+
+    def close_all(self):
+        """Dispose every context and return the driver to its original window."""
+        for name in list(self.contexts):
+            self.close(name)
+        try:
+            self.driver.switch_to.window(self.default_handle)
+        except Exception as e:
+            logger.warning(f"Could not return to default window: {str(e)}")
+        ElementCache.invalidate_driver(self.driver)
+        PageRegistry.activate(self.driver, self.default_registry)
+        self.active_context = None
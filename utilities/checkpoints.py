@@ -0,0 +1,254 @@
+"""Precondition checkpoints: snapshot browser state and fan tests out from it.
+
+Responsibility:
+- Capture cookies, localStorage, sessionStorage and the current URL once an
+  expensive precondition chain has run (e.g. "cart_with_laptop":
+  login -> search -> add to cart -> cart review)
+- Store the snapshot with a TTL (JSON, atomic writes under a file lock)
+- Restore it into another test's browser instead of replaying the chain
+- Validate the restored state with a probe and recompute automatically when
+  the server rejects it (expired session, emptied cart, redirect to /login).
+  The default probe checks the URL, that a captured login is still
+  recognised by the server and that the header cart count is unchanged
+
+A restored checkpoint is the SAME server-side customer and cart as the one
+captured: every test restoring it shares them. Tests that change the cart
+or account must pass account= (e.g. their leased_account email) so each
+account gets its own checkpoint; unkeyed checkpoints are for tests that
+only read the state.
+
+This utility does NOT:
+- Perform assertions
+- Know how to build a precondition (the caller passes a build function)
+
+Usage:
+    def build_cart_with_laptop(driver):
+        LoginFlow(driver).login_user(email, password)
+        ...
+        ProductDisplayFlow(driver).add_product_to_cart()
+        driver.get(f"{base_url}/cart")
+
+    store = CheckpointStore(driver)
+    store.use("cart_with_laptop", build_cart_with_laptop, ttl=900,
+              account=leased_account["email"])
+"""
+
+import hashlib
+import time
+from urllib.parse import urlparse
+from utilities.customLogger import LoggerFactory
+from utilities.elementCache import ElementCache
+from utilities.readProperties import ReadProperties
+from utilities.sessionVault import SessionVault, atomic_write_json, file_lock, inject_cookies, read_json
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class CheckpointStore:
+    """Captures and restores named browser-state checkpoints."""
+
+    CHECKPOINT_DIR = SessionVault.VAULT_DIR.parent / "checkpoints"
+
+    # Default lifetime of a checkpoint in seconds
+    DEFAULT_TTL = 15 * 60
+
+    # Same-origin page used to write storage before opening the real URL
+    STORAGE_BOOTSTRAP_PATH = "/robots.txt"
+
+    CAPTURE_STORAGE_SCRIPT = """
+        function dump(storage) {
+            var items = {};
+            for (var i = 0; i < storage.length; i++) {
+                var key = storage.key(i);
+                items[key] = storage.getItem(key);
+            }
+            return items;
+        }
+        return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+    """
+
+    # What the default probe compares between capture and restore
+    PAGE_STATE_SCRIPT = """
+        var qty = document.querySelector('.cart-qty');
+        return {logged_in: !!document.querySelector('.ico-logout'),
+                cart_qty: qty ? qty.textContent.trim() : null};
+    """
+
+    AUTH_COOKIE = ".Nop.Authentication"
+
+    RESTORE_STORAGE_SCRIPT = """
+        var local = arguments[0], session = arguments[1];
+        Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });
+        Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });
+    """
+
+    _cache = {}
+
+    def __init__(self, driver, base_url=None):
+        """Initialize CheckpointStore.
+
+        Args:
+            driver: Selenium WebDriver to capture from / restore into
+            base_url (str): Application URL (default: configured base URL)
+        """
+        self.driver = driver
+        self.base_url = (base_url or ReadProperties().get_base_url()).rstrip("/")
+
+    @staticmethod
+    def key(name, account=None):
+        """Checkpoint key: one checkpoint per account when an account is given."""
+        return f"{name}@{account}" if account else name
+
+    def _path(self, name):
+        digest = hashlib.sha1(f"{self.base_url}|{name}".encode("utf-8")).hexdigest()[:20]
+        return self.CHECKPOINT_DIR / f"{digest}.json"
+
+    def capture(self, name, ttl=None):
+        """Snapshot the driver's current state under a name.
+
+        Args:
+            name (str): Checkpoint name (e.g. 'cart_with_laptop')
+            ttl (float): Seconds the checkpoint stays valid (default: DEFAULT_TTL)
+
+        Returns:
+            dict: The stored checkpoint
+        """
+        storage = self.driver.execute_script(self.CAPTURE_STORAGE_SCRIPT)
+        page_state = self.driver.execute_script(self.PAGE_STATE_SCRIPT)
+        now = time.time()
+        checkpoint = {
+            "name": name,
+            "base_url": self.base_url,
+            "url": self.driver.current_url,
+            "cookies": self.driver.get_cookies(),
+            "local_storage": storage["local"],
+            "session_storage": storage["session"],
+            "page_state": page_state,
+            "saved_at": now,
+            "expires_at": now + (ttl or self.DEFAULT_TTL),
+        }
+        path = self._path(name)
+        with file_lock(path):
+            atomic_write_json(path, checkpoint)
+        self._cache[path] = checkpoint
+        logger.info(f"Captured checkpoint '{name}' at {checkpoint['url']}")
+        return checkpoint
+
+    def load(self, name):
+        """Return a stored, unexpired checkpoint, or None."""
+        path = self._path(name)
+        checkpoint = self._cache.get(path)
+        if checkpoint is None:
+            with file_lock(path, shared=True):
+                checkpoint = read_json(path)
+        if checkpoint is None:
+            return None
+        if checkpoint["expires_at"] <= time.time():
+            logger.info(f"Checkpoint '{name}' has expired")
+            self.invalidate(name)
+            return None
+        self._cache[path] = checkpoint
+        return checkpoint
+
+    def restore(self, name):
+        """Restore a checkpoint into the driver.
+
+        Returns:
+            bool: True if a checkpoint was found and applied
+        """
+        checkpoint = self.load(name)
+        if checkpoint is None:
+            return False
+
+        self.reset_browser_state()
+        inject_cookies(self.driver, self.base_url, checkpoint["cookies"])
+        if checkpoint["local_storage"] or checkpoint["session_storage"]:
+            self.driver.get(f"{self.base_url}{self.STORAGE_BOOTSTRAP_PATH}")
+            self.driver.execute_script(
+                self.RESTORE_STORAGE_SCRIPT,
+                checkpoint["local_storage"],
+                checkpoint["session_storage"],
+            )
+        self.driver.get(checkpoint["url"])
+        ElementCache.invalidate_driver(self.driver)
+        logger.info(f"Restored checkpoint '{name}' at {checkpoint['url']}")
+        return True
+
+    def invalidate(self, name):
+        """Delete a checkpoint so the next use() recomputes it."""
+        path = self._path(name)
+        self._cache.pop(path, None)
+        with file_lock(path):
+            if path.exists():
+                path.unlink()
+
+    def reset_browser_state(self):
+        """Clear cookies and the current origin's storage before restoring."""
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            self.driver.delete_all_cookies()
+        try:
+            self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            # about:blank / data: pages have no storage to clear
+            pass
+
+    def default_probe(self, checkpoint):
+        """Probe accepting the restore when the page matches what was captured.
+
+        Rejects a redirect away from the captured URL, a login the server no
+        longer accepts (auth cookie dropped or the header shows no logout
+        link) and a changed header cart count (e.g. emptied cart).
+        """
+        expected = checkpoint.get("page_state") or {}
+
+        def probe(driver):
+            if urlparse(driver.current_url).path != urlparse(checkpoint["url"]).path:
+                return False
+            current = driver.execute_script(self.PAGE_STATE_SCRIPT)
+            if expected.get("logged_in"):
+                if not current["logged_in"] or driver.get_cookie(self.AUTH_COOKIE) is None:
+                    return False
+            return current["cart_qty"] == expected.get("cart_qty")
+        return probe
+
+    def use(self, name, build, probe=None, ttl=None, account=None):
+        """Restore a checkpoint, or build and capture it if missing or rejected.
+
+        Args:
+            name (str): Checkpoint name
+            build: callable(driver) running the expensive precondition chain
+            probe: callable(driver) -> bool validating a restored state
+                (default: default_probe - same URL, login and cart count)
+            ttl (float): Lifetime of a newly captured checkpoint in seconds
+            account (str): Account the build logs in as (e.g. a leased account's
+                email); keeps a separate checkpoint per account
+
+        Returns:
+            dict: {'name', 'restored': bool, 'rebuilt': bool, 'elapsed': seconds}
+        """
+        name = self.key(name, account)
+        started = time.perf_counter()
+        restored = False
+        checkpoint = self.load(name)
+        if checkpoint is not None and self.restore(name):
+            probe = probe or self.default_probe(checkpoint)
+            try:
+                restored = bool(probe(self.driver))
+            except Exception as e:
+                logger.warning(f"Probe for checkpoint '{name}' raised: {str(e)}")
+            if not restored:
+                logger.warning(f"Server rejected checkpoint '{name}' - recomputing")
+                self.invalidate(name)
+
+        if not restored:
+            logger.info(f"Building checkpoint '{name}' from scratch")
+            self.reset_browser_state()
+            build(self.driver)
+            self.capture(name, ttl)
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Checkpoint '{name}' ready in {elapsed:.2f}s (restored={restored})")
+        return {"name": name, "restored": restored, "rebuilt": not restored, "elapsed": elapsed}
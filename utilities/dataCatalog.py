@@ -0,0 +1,237 @@
+"""Lazy, indexed catalog over the testdata modules.
+
+Responsibility:
+- Resolve dataset names such as "transactions:VALID_TRANSACTIONS" or
+  "affiliate:AffiliateTestData.VALID_COMMISSION_AMOUNTS" and import the
+  backing testdata module only when a dataset is first used
+- Load large datasets from testdata/<name>.json files, also on first use
+- Build secondary indexes per field (status, type, currency, ...) on the
+  first equality query and answer later queries from the indexes
+- Turn a query into pytest parametrization
+
+Loading granularity: a testdata module is imported as a whole, so the
+first dataset used from it evaluates every dataset the module declares
+(rows and indexes are still built per dataset). Only JSON datasets load
+one at a time; move a dataset to JSON when its size matters.
+
+Query lookups use the field__operator form:
+    catalog.query("transactions:VALID_TRANSACTIONS",
+                  status="completed", currency="USD", type="refund", amount__gt=50)
+
+Operators: eq (default), ne, gt, gte, lt, lte, in, contains.
+An "in" value must be a collection; a single string counts as one value.
+Equality and "in" lookups are answered from indexes; range lookups scan
+only the rows the indexed lookups left.
+
+This utility does NOT:
+- Perform assertions
+- Modify the testdata modules
+"""
+
+import importlib
+import json
+import operator
+import threading
+from pathlib import Path
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class DataCatalog:
+    """Lazily loaded, indexed access to test data sets."""
+
+    TESTDATA_DIR = Path(__file__).parent.parent / "testdata"
+    MODULE_SUFFIX = "_testdata"
+
+    # Fields indexed up front when a dataset is loaded
+    DEFAULT_INDEXES = ("status", "type", "currency")
+
+    OPERATORS = {
+        "eq": operator.eq,
+        "ne": operator.ne,
+        "gt": operator.gt,
+        "gte": operator.ge,
+        "lt": operator.lt,
+        "lte": operator.le,
+        "in": lambda value, options: value in options,
+        "contains": lambda value, part: value is not None and part in value,
+    }
+    INDEXED_OPERATORS = ("eq", "in")
+
+    _MISSING = object()
+
+    def __init__(self, testdata_dir=None):
+        """Initialize DataCatalog.
+
+        Args:
+            testdata_dir (Path): Directory holding the testdata modules and JSON files
+        """
+        self.testdata_dir = Path(testdata_dir) if testdata_dir else self.TESTDATA_DIR
+        self._rows = {}
+        self._indexes = {}
+        self._lock = threading.RLock()
+
+    # ===== Dataset loading =====
+
+    def sources(self):
+        """Names usable before ':' in dataset names, without importing anything."""
+        modules = [
+            path.stem[: -len(self.MODULE_SUFFIX)]
+            for path in self.testdata_dir.glob(f"*{self.MODULE_SUFFIX}.py")
+        ]
+        files = [path.stem for path in self.testdata_dir.glob("*.json")]
+        return sorted(modules + files)
+
+    def _load(self, dataset):
+        source, _, attribute_path = dataset.partition(":")
+        json_path = self.testdata_dir / f"{source}.json"
+
+        if not attribute_path and json_path.exists():
+            with open(json_path, "r") as f:
+                return json.load(f)
+
+        module = importlib.import_module(f"{self.testdata_dir.name}.{source}{self.MODULE_SUFFIX}")
+        value = module
+        for attribute in attribute_path.split("."):
+            value = getattr(value, attribute)
+        return value
+
+    def rows(self, dataset):
+        """All rows of a dataset, loading it on first use.
+
+        Args:
+            dataset (str): "<source>:<NAME>", "<source>:<Class>.<NAME>" or "<json file stem>"
+
+        Returns:
+            list: The dataset's rows (a dict dataset becomes a one-row list)
+        """
+        with self._lock:
+            if dataset not in self._rows:
+                value = self._load(dataset)
+                rows = list(value) if isinstance(value, (list, tuple)) else [value]
+                self._rows[dataset] = rows
+                self._indexes[dataset] = {}
+                for field in self.DEFAULT_INDEXES:
+                    if rows and isinstance(rows[0], dict) and field in rows[0]:
+                        self._index(dataset, field)
+                logger.debug(f"Loaded dataset {dataset} ({len(rows)} rows)")
+            return self._rows[dataset]
+
+    def _index(self, dataset, field):
+        """Index of field value -> row positions, built on first use."""
+        indexes = self._indexes[dataset]
+        if field not in indexes:
+            index = {}
+            for position, row in enumerate(self._rows[dataset]):
+                value = row.get(field, self._MISSING) if isinstance(row, dict) else self._MISSING
+                try:
+                    index.setdefault(value, []).append(position)
+                except TypeError:
+                    # Unhashable values (lists, dicts) cannot be indexed
+                    indexes[field] = None
+                    return None
+            indexes[field] = index
+        return indexes[field]
+
+    # ===== Queries =====
+
+    def _parse_lookup(self, lookup):
+        field, _, op = lookup.rpartition("__")
+        if field and op in self.OPERATORS:
+            return field, op
+        return lookup, "eq"
+
+    def query(self, dataset, **lookups):
+        """Rows matching every lookup.
+
+        Args:
+            dataset (str): Dataset name (see rows())
+            **lookups: field=value or field__op=value filters
+
+        Returns:
+            list: Matching rows, in dataset order
+        """
+        with self._lock:
+            rows = self.rows(dataset)
+            candidates = None
+            scans = []
+
+            for lookup, expected in lookups.items():
+                field, op = self._parse_lookup(lookup)
+                if op == "in":
+                    expected = self._in_values(lookup, expected)
+                index = self._index(dataset, field) if op in self.INDEXED_OPERATORS else None
+                if index is None:
+                    scans.append((field, self.OPERATORS[op], expected))
+                    continue
+                keys = expected if op == "in" else [expected]
+                positions = set()
+                for key in keys:
+                    positions.update(index.get(key, ()))
+                candidates = positions if candidates is None else candidates & positions
+
+        positions = range(len(rows)) if candidates is None else sorted(candidates)
+        matches = []
+        for position in positions:
+            row = rows[position]
+            if all(self._matches(row, field, compare, expected) for field, compare, expected in scans):
+                matches.append(row)
+        return matches
+
+    @staticmethod
+    def _in_values(lookup, expected):
+        # A bare string would otherwise be matched character by character
+        if isinstance(expected, (str, bytes)):
+            return [expected]
+        if not hasattr(expected, "__iter__"):
+            raise TypeError(f"{lookup} needs a collection of values, got {type(expected).__name__}")
+        return list(expected)
+
+    def _matches(self, row, field, compare, expected):
+        if not isinstance(row, dict) or field not in row:
+            return False
+        try:
+            return bool(compare(row[field], expected))
+        except TypeError:
+            return False
+
+    def first(self, dataset, **lookups):
+        """First row matching the lookups, or None."""
+        matches = self.query(dataset, **lookups)
+        return matches[0] if matches else None
+
+    def count(self, dataset, **lookups):
+        return len(self.query(dataset, **lookups))
+
+    # ===== Pytest integration =====
+
+    def parametrize(self, argname, dataset, id_field="id", **lookups):
+        """pytest.mark.parametrize over the rows matching a query.
+
+        Usage:
+            @catalog.parametrize("refund", "transactions:VALID_TRANSACTIONS",
+                                 type="refund", currency="USD", amount__gt=50)
+            def test_refund(refund): ...
+
+        Args:
+            argname (str): Test argument receiving each row
+            dataset (str): Dataset name
+            id_field (str): Row field used as the test id (falls back to the row position)
+            **lookups: Query filters
+
+        Returns:
+            MarkDecorator: The parametrize mark
+        """
+        import pytest
+
+        params = []
+        for position, row in enumerate(self.query(dataset, **lookups)):
+            test_id = row.get(id_field) if isinstance(row, dict) else None
+            params.append(pytest.param(row, id=str(test_id if test_id is not None else position)))
+        return pytest.mark.parametrize(argname, params)
+
+
+# Shared catalog, so parametrize decorators and fixtures reuse loaded datasets
+catalog = DataCatalog()
@@ -0,0 +1,471 @@
+"""Server-side test data seeding over HTTP.
+
+Responsibility:
+- Create customers, carts, wishlists, orders and newsletter subscriptions
+  directly against the application's HTTP endpoints
+- Share one pooled connection adapter and run independent customers
+  concurrently on a thread pool
+- Execute idempotent recipes declared in testdata/seed_recipes.py and
+  record their results in a ledger, so reruns return existing data.
+  Only fully successful runs are recorded; entries expire after
+  LEDGER_TTL and are re-checked (first customer can still log in, first
+  order still opens) before they are reused, so a reset database is
+  seeded again
+
+A customer's cart is server-side state, so orders for ONE customer are
+placed one after another (every session of that customer shares the
+cart); recipes spread large volumes over several customers when they
+need more parallelism.
+
+Orders paid with CheckMoneyOrder stay Pending. Recipes with
+"complete_orders" have them set to Complete afterwards through the admin
+order page, logged in as [ADMIN_CREDENTIALS].
+
+This utility does NOT:
+- Perform assertions
+- Drive a browser
+"""
+
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from utilities.customLogger import LoggerFactory
+from utilities.httpAuthenticator import HttpAuthenticator
+from utilities.readProperties import ReadProperties
+from utilities.sessionVault import SessionVault, atomic_write_json, file_lock, read_json
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class StoreClient:
+    """HTTP operations on the storefront for one customer session."""
+
+    PRODUCT_ID_PATTERN = re.compile(r'data-productid="(\d+)"')
+    ORDER_ID_PATTERN = re.compile(r'/orderdetails/(\d+)')
+    CART_ITEM_PATTERN = re.compile(
+        r'name="removefromcart"[^>]*value="(\d+)"'
+        r'|value="(\d+)"[^>]*name="removefromcart"'
+    )
+    ADDRESS_ID_PATTERN = re.compile(r'deletecustomeraddress\((\d+)\)')
+
+    # nopCommerce OrderStatus.Complete
+    ORDER_STATUS_COMPLETE = 30
+
+    # Product ids resolved from SEO paths, shared by every client
+    _product_ids = {}
+
+    def __init__(self, session, base_url, timeout=15):
+        """Initialize StoreClient.
+
+        Args:
+            session (requests.Session): Session carrying the customer's cookies
+            base_url (str): Application URL
+            timeout (float): Per-request timeout in seconds (default: 15)
+        """
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._token = None
+
+    def _url(self, path):
+        return f"{self.base_url}{path}"
+
+    def get(self, path, **kwargs):
+        return self.session.get(self._url(path), timeout=self.timeout, **kwargs)
+
+    def post(self, path, data=None, **kwargs):
+        """POST with the session's antiforgery token added to the form data."""
+        form = dict(data or {})
+        form["__RequestVerificationToken"] = self.token()
+        return self.session.post(self._url(path), data=form, timeout=self.timeout, **kwargs)
+
+    def token(self, refresh=False):
+        """Antiforgery token bound to this session's antiforgery cookie."""
+        if self._token is None or refresh:
+            self._token = HttpAuthenticator.extract_token(self.get("/cart").text)
+        return self._token
+
+    def product_id(self, product_path):
+        """Resolve a product's SEO path (e.g. '/night-visions') to its id."""
+        if product_path not in self._product_ids:
+            match = self.PRODUCT_ID_PATTERN.search(self.get(product_path).text)
+            if not match:
+                raise ValueError(f"No product found at {product_path}")
+            self._product_ids[product_path] = int(match.group(1))
+        return self._product_ids[product_path]
+
+    # ===== Customers =====
+
+    def register(self, email, password, first_name="Seed", last_name="Customer"):
+        """Register a customer. Returns True if the account now exists."""
+        token = HttpAuthenticator.extract_token(self.get("/register").text)
+        response = self.session.post(
+            self._url("/register"),
+            data={
+                "FirstName": first_name,
+                "LastName": last_name,
+                "Email": email,
+                "Password": password,
+                "ConfirmPassword": password,
+                "__RequestVerificationToken": token,
+            },
+            allow_redirects=False,
+            timeout=self.timeout,
+        )
+        self._token = None
+        if response.status_code in (301, 302) and "registerresult" in response.headers.get("Location", ""):
+            return True
+        return "already exists" in response.text
+
+    def subscribe_newsletter(self, email):
+        """Subscribe an email to the newsletter. Returns True on success."""
+        response = self.post("/subscribenewsletter", {"email": email, "subscribe": "true"})
+        return response.ok and response.json().get("Success", False)
+
+    # ===== Cart and wishlist =====
+
+    def add_to_cart(self, product_path, quantity=1, attributes=None, cart_type=1):
+        """Add a product to the cart (cart_type=1) or wishlist (cart_type=2).
+
+        Args:
+            product_path (str): Product SEO path
+            quantity (int): Quantity to add (default: 1)
+            attributes (dict): Extra form fields such as product_attribute_<pid>_<aid>
+            cart_type (int): 1 for shopping cart, 2 for wishlist
+
+        Returns:
+            dict: JSON response from nopCommerce ({'success': bool, 'message': ...})
+        """
+        product_id = self.product_id(product_path)
+        form = {f"addtocart_{product_id}.EnteredQuantity": str(quantity)}
+        form.update(attributes or {})
+        response = self.post(f"/addproducttocart/details/{product_id}/{cart_type}", form)
+        return response.json()
+
+    def add_to_wishlist(self, product_path, quantity=1, attributes=None):
+        return self.add_to_cart(product_path, quantity, attributes, cart_type=2)
+
+    def clear_cart(self, cart_type=1):
+        """Remove every item from the cart (cart_type=1) or wishlist (cart_type=2).
+
+        Returns:
+            int: Number of items removed
+        """
+        path = "/cart" if cart_type == 1 else "/wishlist"
+        html = self.get(path).text
+        item_ids = [a or b for a, b in self.CART_ITEM_PATTERN.findall(html)]
+        if not item_ids:
+            return 0
+        token = HttpAuthenticator.extract_token(html)
+        form = [("removefromcart", item_id) for item_id in item_ids]
+        form += [("updatecart", ""), ("__RequestVerificationToken", token)]
+        self.session.post(self._url(path), data=form, timeout=self.timeout)
+        return len(item_ids)
+
+    def clear_wishlist(self):
+        return self.clear_cart(cart_type=2)
+
+    def clear_compare_list(self):
+        """Empty the compare list held by this session's compare-products cookie."""
+        self.get("/clearcomparelist/")
+
+    def delete_addresses(self, keep=1):
+        """Delete the customer's saved addresses beyond the first `keep`.
+
+        Returns:
+            int: Number of addresses deleted
+        """
+        address_ids = self.ADDRESS_ID_PATTERN.findall(self.get("/customer/addresses").text)
+        extra = list(dict.fromkeys(address_ids))[keep:]
+        for address_id in extra:
+            self.post("/customer/addressdelete", {"addressId": address_id})
+        return len(extra)
+
+    # ===== Checkout =====
+
+    def place_order(self, billing_address, shipping_option, payment_method):
+        """Check out the current cart through the one-page-checkout endpoints.
+
+        Returns:
+            int: Order id, or None if the order could not be placed
+        """
+        self.get("/onepagecheckout")
+        billing = dict(billing_address)
+        billing["ShipToSameAddress"] = "true"
+        steps = [
+            ("/checkout/OpcSaveBilling/", billing, "billing"),
+            ("/checkout/OpcSaveShippingMethod/", {"shippingoption": shipping_option}, "shipping-method"),
+            ("/checkout/OpcSavePaymentMethod/", {"paymentmethod": payment_method}, "payment-method"),
+            ("/checkout/OpcSavePaymentInfo/", {}, "payment-info"),
+            ("/checkout/OpcConfirmOrder/", {}, "confirm-order"),
+        ]
+        for path, form, section in steps:
+            response = self.post(path, form)
+            error = self._checkout_step_error(response, section)
+            if error:
+                logger.error(f"Checkout step {path} failed: {error}")
+                return None
+
+        match = self.ORDER_ID_PATTERN.search(self.get("/checkout/completed").text)
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def _checkout_step_error(response, section):
+        """Error message of a one-page-checkout step, or None if it succeeded.
+
+        The endpoints answer HTTP 200 with JSON either way: failures carry
+        'error' / 'message', or re-render the step's own section (validation
+        errors) instead of moving on to the next one.
+        """
+        if not response.ok:
+            return f"HTTP {response.status_code}"
+        try:
+            payload = response.json()
+        except ValueError:
+            return "response is not JSON (session lost?)"
+        if payload.get("error"):
+            message = payload.get("message")
+            return "; ".join(message) if isinstance(message, list) else str(message)
+        if (payload.get("update_section") or {}).get("name") == section:
+            return f"'{section}' section returned with validation errors"
+        return None
+
+    def order_exists(self, order_id):
+        """True if the order details page opens for this session's customer."""
+        response = self.get(f"/orderdetails/{order_id}", allow_redirects=False)
+        return response.status_code == 200
+
+    # ===== Administration (session logged in as a store administrator) =====
+
+    def complete_order(self, order_id):
+        """Set an order's status to Complete through the admin order edit page.
+
+        Returns:
+            bool: True if the admin page accepted the change
+        """
+        path = f"/Admin/Order/Edit/{order_id}"
+        token = HttpAuthenticator.extract_token(self.get(path).text)
+        response = self.session.post(
+            self._url(path),
+            data={
+                "OrderStatusId": str(self.ORDER_STATUS_COMPLETE),
+                "btnChangeOrderStatus": "",
+                "__RequestVerificationToken": token,
+            },
+            timeout=self.timeout,
+        )
+        if not response.ok:
+            logger.error(f"Could not complete order {order_id}: HTTP {response.status_code}")
+        return response.ok
+
+
+class DataSeeder:
+    """Runs seed recipes against the application with a pooled HTTP client."""
+
+    LEDGER_FILE = SessionVault.VAULT_DIR.parent / "seed_ledger.json"
+
+    # Seconds a recorded recipe result is reused before the recipe runs again
+    LEDGER_TTL = 24 * 60 * 60
+
+    # Connection pool shared by every seeder in this process
+    _adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=2)
+
+    def __init__(self, base_url=None, max_workers=8, timeout=15):
+        """Initialize DataSeeder.
+
+        Args:
+            base_url (str): Application URL (default: configured base URL)
+            max_workers (int): Customers seeded concurrently (default: 8)
+            timeout (float): Per-request timeout in seconds (default: 15)
+        """
+        self.base_url = (base_url or ReadProperties().get_base_url()).rstrip("/")
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.authenticator = HttpAuthenticator(self.base_url, timeout)
+
+    def new_client(self, session=None):
+        """A StoreClient on the shared connection pool (anonymous unless a session is given)."""
+        if session is None:
+            session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return StoreClient(session, self.base_url, self.timeout)
+
+    def customer_client(self, email, password, register=True):
+        """A StoreClient logged in as the customer, registering the account if needed.
+
+        Returns:
+            StoreClient: Authenticated client, or None if login failed
+        """
+        if register:
+            self.new_client().register(email, password)
+        session = self.authenticator.login_session(email, password)
+        if session is None:
+            return None
+        return self.new_client(session)
+
+    def admin_client(self):
+        """A StoreClient logged in as the configured store administrator.
+
+        Raises:
+            RuntimeError: If the administrator login fails
+        """
+        email = ReadProperties.get("ADMIN_CREDENTIALS", "email")
+        client = self.customer_client(email, ReadProperties.get("ADMIN_CREDENTIALS", "password"), register=False)
+        if client is None:
+            raise RuntimeError(f"Could not log in store administrator {email}")
+        return client
+
+    # ===== Recipes =====
+
+    @staticmethod
+    def load_recipes():
+        from testdata.seed_recipes import SEED_RECIPES
+
+        return SEED_RECIPES
+
+    def seed(self, recipe_name, force=False):
+        """Run a recipe, or return its recorded result if it already ran.
+
+        Args:
+            recipe_name (str): Key of testdata.seed_recipes.SEED_RECIPES
+            force (bool): Re-run even if the ledger already has a result
+
+        Returns:
+            dict: {'recipe', 'customers': [{'email', 'password', 'orders': [ids], 'completed': [ids],
+                   'complete': bool}], 'subscribers': [emails], 'complete': bool,
+                   'recorded_at': epoch seconds, 'elapsed': seconds, 'from_ledger': bool}
+        """
+        recipe = self.load_recipes()[recipe_name]
+        ledger_key = self._ledger_key(recipe_name, recipe)
+
+        if not force:
+            with file_lock(self.LEDGER_FILE, shared=True):
+                recorded = (read_json(self.LEDGER_FILE) or {}).get(ledger_key)
+            if recorded and self._ledger_entry_valid(recipe_name, recorded):
+                logger.info(f"Seed recipe '{recipe_name}' already applied - using ledger")
+                return dict(recorded, from_ledger=True)
+
+        started = time.perf_counter()
+        result = self._run_recipe(recipe_name, recipe)
+        result["elapsed"] = time.perf_counter() - started
+        result["recorded_at"] = time.time()
+        logger.info(f"Seed recipe '{recipe_name}' applied in {result['elapsed']:.1f}s (complete={result['complete']})")
+
+        # A partial result would be reused as if it were complete: leave it out of the ledger
+        if result["complete"]:
+            with file_lock(self.LEDGER_FILE):
+                ledger = read_json(self.LEDGER_FILE) or {}
+                ledger[ledger_key] = result
+                atomic_write_json(self.LEDGER_FILE, ledger)
+        else:
+            logger.warning(f"Seed recipe '{recipe_name}' only partly applied - not recorded in the ledger")
+        return dict(result, from_ledger=False)
+
+    def _ledger_entry_valid(self, recipe_name, recorded):
+        """Unexpired, and its first customer / order still exist on the server."""
+        if recorded.get("recorded_at", 0) + self.LEDGER_TTL <= time.time():
+            logger.info(f"Ledger entry for '{recipe_name}' expired")
+            return False
+        if not recorded.get("customers"):
+            return True
+
+        customer = recorded["customers"][0]
+        client = self.customer_client(customer["email"], customer["password"], register=False)
+        if client is None:
+            logger.warning(f"Ledger entry for '{recipe_name}' is stale: {customer['email']} cannot log in")
+            return False
+        if customer["orders"] and not client.order_exists(customer["orders"][0]):
+            logger.warning(f"Ledger entry for '{recipe_name}' is stale: order {customer['orders'][0]} is gone")
+            return False
+        return True
+
+    def _ledger_key(self, recipe_name, recipe):
+        digest = hashlib.sha1(json.dumps(recipe, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        return f"{self.base_url}|{recipe_name}|{digest}"
+
+    def _run_recipe(self, recipe_name, recipe):
+        from testdata.seed_recipes import SEED_PASSWORD
+
+        customers = [
+            (f"seed.{recipe_name}.{index}@example.test", SEED_PASSWORD)
+            for index in range(recipe.get("customers", 0))
+        ]
+        subscribers = [
+            f"seed.{recipe_name}.subscriber.{index}@example.test"
+            for index in range(recipe.get("subscribers", 0))
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            customer_futures = [
+                executor.submit(self._seed_customer, email, password, recipe)
+                for email, password in customers
+            ]
+            # requests.Session is not thread-safe: one anonymous client per subscriber
+            subscriber_futures = [
+                executor.submit(self.new_client().subscribe_newsletter, email) for email in subscribers
+            ]
+            seeded_customers = [future.result() for future in customer_futures]
+            subscribed = [
+                email for email, future in zip(subscribers, subscriber_futures) if future.result()
+            ]
+
+        if recipe.get("complete_orders"):
+            self._complete_orders(seeded_customers)
+
+        complete = len(subscribed) == len(subscribers) and all(
+            customer["complete"]
+            and (not recipe.get("complete_orders") or len(customer["completed"]) == len(customer["orders"]))
+            for customer in seeded_customers
+        )
+        return {
+            "recipe": recipe_name,
+            "customers": seeded_customers,
+            "subscribers": subscribed,
+            "complete": complete,
+        }
+
+    def _complete_orders(self, seeded_customers):
+        # One admin session, used from this thread only (requests.Session is not thread-safe)
+        admin = self.admin_client()
+        for customer in seeded_customers:
+            customer["completed"] = [order_id for order_id in customer["orders"] if admin.complete_order(order_id)]
+        completed = sum(len(customer["completed"]) for customer in seeded_customers)
+        logger.info(f"Marked {completed} seeded orders Complete")
+
+    def _seed_customer(self, email, password, recipe):
+        from testdata.seed_recipes import (
+            DEFAULT_BILLING_ADDRESS,
+            DEFAULT_PAYMENT_METHOD,
+            DEFAULT_SHIPPING_OPTION,
+        )
+
+        client = self.customer_client(email, password)
+        if client is None:
+            raise RuntimeError(f"Could not log in seeded customer {email}")
+
+        billing = dict(DEFAULT_BILLING_ADDRESS, **{"BillingNewAddress.Email": email})
+        orders = []
+        failed_items = 0
+        for _ in range(recipe.get("orders_per_customer", 0)):
+            for item in recipe.get("order_items", []):
+                client.add_to_cart(item["product_path"], item.get("quantity", 1), item.get("attributes"))
+            order_id = client.place_order(billing, DEFAULT_SHIPPING_OPTION, DEFAULT_PAYMENT_METHOD)
+            if order_id is not None:
+                orders.append(order_id)
+
+        for item in recipe.get("cart_items", []):
+            added = client.add_to_cart(item["product_path"], item.get("quantity", 1), item.get("attributes"))
+            failed_items += 0 if added.get("success") else 1
+        for item in recipe.get("wishlist_items", []):
+            added = client.add_to_wishlist(item["product_path"], item.get("quantity", 1), item.get("attributes"))
+            failed_items += 0 if added.get("success") else 1
+
+        complete = len(orders) == recipe.get("orders_per_customer", 0) and not failed_items
+        logger.info(f"Seeded customer {email}: {len(orders)} orders, {failed_items} failed items")
+        return {"email": email, "password": password, "orders": orders, "completed": [], "complete": complete}
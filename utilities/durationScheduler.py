@@ -0,0 +1,179 @@
+"""Duration-aware test scheduling plugin (longest-processing-time first).
+
+Responsibility:
+- Record how long every test takes (setup + call + teardown) into a
+  local history file after each run
+- Estimate durations for the next run, falling back to the average of
+  the same test file, then to the median of all known tests
+- Order collected tests longest-first so xdist workers pick up the long
+  checkout journeys early and the short page checks fill the tail
+- Predict the makespan for the worker count and report it next to the
+  actual makespan at the end of the run
+
+xdist's load scheduler hands pending tests to whichever worker is idle,
+in collection order. With tests sorted longest-first this is greedy LPT
+list scheduling.
+
+Enable with:
+    pytest testCases -n 4 --schedule-by-duration
+
+History is recorded on every run, with or without the flag.
+"""
+
+import heapq
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+import pytest
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class DurationHistory:
+    """Per-test duration history persisted as JSON."""
+
+    HISTORY_FILE = Path(__file__).parent.parent / ".test_durations.json"
+
+    # Estimate for a test with no history and no known sibling in its file
+    DEFAULT_DURATION = 30.0
+
+    # Weight of the newest observation when updating a test's estimate
+    SMOOTHING = 0.5
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else self.HISTORY_FILE
+        self.durations = self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read duration history: {str(e)}")
+            return {}
+
+    def estimate(self, nodeid):
+        """Estimated duration in seconds for a test node id."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+
+        test_file = nodeid.split("::")[0]
+        siblings = [d for n, d in self.durations.items() if n.split("::")[0] == test_file]
+        if siblings:
+            return statistics.mean(siblings)
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return self.DEFAULT_DURATION
+
+    def update(self, observed):
+        """Merge observed durations ({nodeid: seconds}) and write the history file."""
+        for nodeid, duration in observed.items():
+            previous = self.durations.get(nodeid)
+            if previous is None:
+                self.durations[nodeid] = round(duration, 3)
+            else:
+                blended = self.SMOOTHING * duration + (1 - self.SMOOTHING) * previous
+                self.durations[nodeid] = round(blended, 3)
+
+        temp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(self.durations, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+            logger.info(f"Recorded {len(observed)} test durations to {self.path}")
+        except Exception as e:
+            logger.warning(f"Could not write duration history: {str(e)}")
+
+
+def predict_makespan(durations, workers):
+    """Makespan of greedy LPT scheduling of durations onto N workers."""
+    loads = [0.0] * max(1, workers)
+    heapq.heapify(loads)
+    for duration in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+
+class DurationScheduler:
+    """Pytest plugin object; registered from testCases/conftest.py."""
+
+    def __init__(self, config):
+        self.config = config
+        self.enabled = config.getoption("--schedule-by-duration", default=False)
+        self.history = DurationHistory()
+        self.observed = {}
+        self.worker_busy = {}
+        self.predicted_makespan = None
+        self.session_started = None
+
+    @staticmethod
+    def add_options(parser):
+        parser.addoption(
+            "--schedule-by-duration",
+            action="store_true",
+            default=False,
+            help="Order tests longest-first using recorded durations (LPT)",
+        )
+
+    def _worker_count(self):
+        count = getattr(self.config.option, "numprocesses", None)
+        if isinstance(count, int) and count > 0:
+            return count
+        return int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+    def _is_controller(self):
+        return not hasattr(self.config, "workerinput")
+
+    def pytest_sessionstart(self, session):
+        self.session_started = time.perf_counter()
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        if not self.enabled:
+            return
+        items.sort(key=lambda item: self.history.estimate(item.nodeid), reverse=True)
+        if self._is_controller():
+            self._predict([item.nodeid for item in items])
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        if self.enabled and self.predicted_makespan is None:
+            self._predict(ids)
+
+    def _predict(self, nodeids):
+        estimates = [self.history.estimate(nodeid) for nodeid in nodeids]
+        self.predicted_makespan = predict_makespan(estimates, self._worker_count())
+        logger.info(
+            f"LPT schedule: {len(nodeids)} tests on {self._worker_count()} workers, "
+            f"predicted makespan {self.predicted_makespan:.1f}s"
+        )
+
+    def pytest_runtest_logreport(self, report):
+        if not self._is_controller():
+            return
+        self.observed[report.nodeid] = self.observed.get(report.nodeid, 0.0) + report.duration
+        gateway = getattr(getattr(report, "node", None), "gateway", None)
+        worker = getattr(gateway, "id", "local")
+        self.worker_busy[worker] = self.worker_busy.get(worker, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self._is_controller() and self.observed:
+            self.history.update(self.observed)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.enabled or not self.worker_busy:
+            return
+        actual = max(self.worker_busy.values())
+        wall = time.perf_counter() - self.session_started if self.session_started else actual
+        terminalreporter.write_sep("-", "duration-aware scheduling")
+        if self.predicted_makespan is not None:
+            terminalreporter.write_line(f"Predicted makespan (LPT): {self.predicted_makespan:.1f}s")
+        terminalreporter.write_line(f"Actual makespan (busiest worker): {actual:.1f}s")
+        terminalreporter.write_line(f"Wall time: {wall:.1f}s")
+        for worker, busy in sorted(self.worker_busy.items()):
+            terminalreporter.write_line(f"  {worker}: {busy:.1f}s busy")
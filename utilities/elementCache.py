@@ -0,0 +1,102 @@
+"""Per-driver element handle cache keyed by locator.
+
+Responsibility:
+- Remember the WebElement last found for each locator, so repeated
+  BasePage calls on the same element within one page state skip the
+  findElement command
+- Drop every handle when the page changes: explicitly on navigation
+  (routes.navigate_to, IsolatedContext.open, checkpoint restore) and on
+  window / browser-context switches (BrowserContextPool), and implicitly
+  the first time a cached handle turns out to be stale
+- Count hits, misses and stale re-acquisitions so the saved findElement
+  commands can be reported
+
+The cache is shared by all page objects of one driver (they all look at
+the same document). Handles never outlive their document: WebDriver
+reports any handle from a previous page as stale, which is what
+triggers re-acquisition.
+
+This utility does NOT:
+- Wait for elements (BasePage applies its explicit waits on a miss)
+- Perform assertions
+"""
+
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class ElementCache:
+    """Locator -> WebElement handles for one driver."""
+
+    # Attribute holding the cache on the driver object; cached WebElements reference
+    # their driver, so a driver-keyed weak mapping would keep every driver alive
+    DRIVER_ATTRIBUTE = "_element_cache"
+
+    # Counters summed over every driver of this process
+    totals = {"hits": 0, "misses": 0, "stale": 0, "invalidations": 0}
+
+    def __init__(self):
+        self._handles = {}
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "invalidations": 0}
+
+    @classmethod
+    def for_driver(cls, driver):
+        """The cache shared by all page objects of this driver."""
+        cache = getattr(driver, cls.DRIVER_ATTRIBUTE, None)
+        if cache is None:
+            cache = cls()
+            if driver is not None:
+                setattr(driver, cls.DRIVER_ATTRIBUTE, cache)
+        return cache
+
+    @staticmethod
+    def _key(locator):
+        return tuple(locator)
+
+    def _count(self, name):
+        self.stats[name] += 1
+        ElementCache.totals[name] += 1
+
+    def get(self, locator):
+        """Cached handle for the locator, or None (counted as hit / miss)."""
+        element = self._handles.get(self._key(locator))
+        self._count("hits" if element is not None else "misses")
+        return element
+
+    def __contains__(self, locator):
+        """Whether a handle is cached for the locator (not counted)."""
+        return self._key(locator) in self._handles
+
+    def put(self, locator, element):
+        self._handles[self._key(locator)] = element
+        return element
+
+    def discard(self, locator):
+        self._handles.pop(self._key(locator), None)
+
+    def stale(self):
+        """A cached handle went stale: the document changed, drop everything."""
+        logger.debug(f"Stale handle - dropping {len(self._handles)} cached elements")
+        self._count("stale")
+        self.invalidate()
+
+    def invalidate(self):
+        if self._handles:
+            self._handles.clear()
+            self._count("invalidations")
+
+    @classmethod
+    def invalidate_driver(cls, driver):
+        cache = getattr(driver, cls.DRIVER_ATTRIBUTE, None)
+        if cache is not None:
+            cache.invalidate()
+
+    @classmethod
+    def report(cls):
+        """Process-wide counters; 'hits' is the number of findElement commands saved."""
+        totals = dict(cls.totals)
+        lookups = totals["hits"] + totals["misses"]
+        totals["hit_rate"] = round(totals["hits"] / lookups, 3) if lookups else 0.0
+        return totals
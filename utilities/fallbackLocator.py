@@ -0,0 +1,178 @@
+"""Self-ordering fallback locator chains.
+
+Responsibility:
+- Declare "try A, else B, else C" locators as a first-class type instead
+  of a union XPath that the browser must evaluate in full every time
+- Try candidates in order of their historically observed hit rate,
+  stopping at the first candidate that finds an element
+- Record hits and misses per candidate, persisted across runs (merged
+  from all xdist workers at session end), so the candidate that matches
+  this theme / nopCommerce version moves to the front
+
+Declaring one on a page class:
+
+    _page_title = FallbackLocator(
+        (By.CSS_SELECTOR, "div.page-title h1"),
+        (By.XPATH, "//h1[contains(text(), 'Order')]"),
+    )
+
+A FallbackLocator is still a (by, value) tuple - the union of its
+candidates - so code passing it straight to driver.find_element(*locator)
+keeps working. BasePage recognises the type and resolves it candidate by
+candidate.
+
+This utility does NOT:
+- Wait for clickability / visibility (BasePage checks that on the element found)
+- Perform assertions
+"""
+
+import copy
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from utilities.customLogger import LoggerFactory
+from utilities.locatorTools import XPathToCss
+from utilities.sessionVault import SessionVault, atomic_write_json, file_lock, read_json
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class FallbackLocator(tuple):
+    """(by, value) tuple carrying an ordered chain of candidate locators."""
+
+    STATS_FILE = SessionVault.VAULT_DIR.parent / "fallback_locators.json"
+
+    # Seconds each candidate may wait on the first pass before the next one is tried
+    CANDIDATE_BUDGET = 0.1
+
+    # Seconds between later passes over the whole chain
+    POLL_INTERVAL = 0.2
+
+    # {locator name: {candidate key: {'hits': n, 'misses': n}}}
+    _stats = None
+    _dirty = False
+
+    # Counts as loaded from disk, so flush() merges only this process's increments
+    _baseline = {}
+
+    def __new__(cls, *candidates, name=None):
+        if not candidates:
+            raise ValueError("FallbackLocator needs at least one candidate locator")
+        if all(by == By.XPATH for by, _ in candidates):
+            union = (By.XPATH, " | ".join(value for _, value in candidates))
+        elif all(by == By.CSS_SELECTOR for by, _ in candidates):
+            union = (By.CSS_SELECTOR, ", ".join(value for _, value in candidates))
+        else:
+            union = tuple(candidates[0])
+        locator = super().__new__(cls, union)
+        locator.candidates = [tuple(candidate) for candidate in candidates]
+        locator.name = name or union[1]
+        return locator
+
+    def __set_name__(self, owner, name):
+        self.name = f"{owner.__name__}.{name}"
+
+    def __repr__(self):
+        return f"FallbackLocator({self.name}: {self.candidates})"
+
+    # ===== Hit-rate statistics =====
+
+    @staticmethod
+    def _key(candidate):
+        return f"{candidate[0]}={candidate[1]}"
+
+    @classmethod
+    def _all_stats(cls):
+        if cls._stats is None:
+            cls._stats = read_json(cls.STATS_FILE) or {}
+            cls._baseline = copy.deepcopy(cls._stats)
+        return cls._stats
+
+    def _candidate_stats(self, candidate):
+        entry = self._all_stats().setdefault(self.name, {})
+        return entry.setdefault(self._key(candidate), {"hits": 0, "misses": 0})
+
+    def hit_rate(self, candidate):
+        """Smoothed hit rate; untried candidates start at 0.5."""
+        stats = self._candidate_stats(candidate)
+        return (stats["hits"] + 1) / (stats["hits"] + stats["misses"] + 2)
+
+    def ordered(self):
+        """Candidates by descending hit rate; declaration order breaks ties."""
+        return sorted(self.candidates, key=lambda candidate: -self.hit_rate(candidate))
+
+    def _record(self, missed, hit):
+        for candidate in missed:
+            self._candidate_stats(candidate)["misses"] += 1
+        if hit is not None:
+            self._candidate_stats(hit)["hits"] += 1
+        FallbackLocator._dirty = True
+
+    # ===== Resolution =====
+
+    def _query(self, context, candidate):
+        return context.find_elements(*XPathToCss.compile_locator(candidate))
+
+    def find_all(self, context):
+        """Elements of the first candidate (by hit rate) that matches anything, else []."""
+        missed = []
+        for candidate in self.ordered():
+            elements = self._query(context, candidate)
+            if elements:
+                self._record(missed, candidate)
+                return elements
+            missed.append(candidate)
+        return []
+
+    def find(self, context, timeout):
+        """First element of the best matching candidate, polling the chain until timeout.
+
+        The first pass gives each candidate CANDIDATE_BUDGET seconds; later
+        passes query every candidate once per POLL_INTERVAL. Misses are only
+        recorded for candidates tried before the one that hit.
+
+        Raises:
+            TimeoutException: If no candidate matches within timeout
+        """
+        deadline = time.monotonic() + timeout
+        first_pass = True
+        while True:
+            missed = []
+            for candidate in self.ordered():
+                budget_end = time.monotonic() + (self.CANDIDATE_BUDGET if first_pass else 0)
+                while True:
+                    elements = self._query(context, candidate)
+                    if elements or time.monotonic() >= budget_end:
+                        break
+                    time.sleep(0.02)
+                if elements:
+                    self._record(missed, candidate)
+                    if missed:
+                        logger.debug(f"{self.name}: matched {candidate} after {len(missed)} misses")
+                    return elements[0]
+                missed.append(candidate)
+            first_pass = False
+            if time.monotonic() >= deadline:
+                self._record(missed, None)
+                raise TimeoutException(f"No candidate of {self.name} matched within {timeout}s")
+            time.sleep(self.POLL_INTERVAL)
+
+    @classmethod
+    def flush(cls):
+        """Merge this process's hit/miss counts into the persisted statistics."""
+        if not cls._dirty:
+            return
+        with file_lock(cls.STATS_FILE):
+            stored = read_json(cls.STATS_FILE) or {}
+            for name, candidates in cls._stats.items():
+                for key, counts in candidates.items():
+                    already = cls._baseline.get(name, {}).get(key, {"hits": 0, "misses": 0})
+                    merged = stored.setdefault(name, {}).setdefault(key, {"hits": 0, "misses": 0})
+                    merged["hits"] += counts["hits"] - already["hits"]
+                    merged["misses"] += counts["misses"] - already["misses"]
+            atomic_write_json(cls.STATS_FILE, stored)
+        cls._stats = stored
+        cls._baseline = copy.deepcopy(stored)
+        cls._dirty = False
+        logger.info(f"Recorded fallback locator hit rates for {len(stored)} locators")
@@ -0,0 +1,180 @@
+"""HTTP-level login that hands authenticated cookies to WebDriver.
+
+Responsibility:
+- Log a customer in by posting nopCommerce's /login form directly,
+  including the __RequestVerificationToken antiforgery token
+- Reuse pooled HTTP connections across logins (one shared adapter)
+- Cache the resulting auth cookies per user, with their real expiry,
+  in the session vault so later tests skip the login entirely
+- Inject the cookies into a driver before its first navigation
+
+Use this for tests that only NEED a logged-in user. Tests that verify
+the login page itself (test_validate_login_*) must keep the UI path
+through LoginFlow.
+
+This utility does NOT:
+- Perform assertions
+- Verify anything about the login page UI
+"""
+
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from utilities.customLogger import LoggerFactory
+from utilities.readProperties import ReadProperties
+from utilities.sessionVault import SessionVault, inject_cookies
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class HttpAuthenticator:
+    """Logs customers in over HTTP and injects their cookies into drivers."""
+
+    AUTH_COOKIE = ".Nop.Authentication"
+    TOKEN_PATTERN = re.compile(
+        r'name="__RequestVerificationToken"[^>]*value="([^"]+)"'
+        r'|value="([^"]+)"[^>]*name="__RequestVerificationToken"'
+    )
+
+    # Vault "browser" key: HTTP cookies are valid for every browser
+    VAULT_BROWSER = "http"
+
+    # Connection pool shared by every authenticator in this process
+    _adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=2)
+
+    def __init__(self, base_url=None, timeout=15):
+        """Initialize HttpAuthenticator.
+
+        Args:
+            base_url (str): Application URL (default: configured base URL)
+            timeout (float): Per-request timeout in seconds (default: 15)
+        """
+        self.base_url = (base_url or ReadProperties().get_base_url()).rstrip("/")
+        self.host = urlparse(self.base_url).hostname
+        self.timeout = timeout
+        self.vault = SessionVault()
+
+    def new_session(self):
+        """A requests.Session with its own cookie jar on the shared connection pool.
+
+        Do not close() these sessions: that would close the shared adapter.
+        """
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return session
+
+    @classmethod
+    def extract_token(cls, html):
+        """Return the antiforgery token from a page's HTML, or None."""
+        match = cls.TOKEN_PATTERN.search(html)
+        if not match:
+            return None
+        return match.group(1) or match.group(2)
+
+    def login_session(self, email, password):
+        """Log in over HTTP and return the authenticated requests.Session.
+
+        Args:
+            email (str): Customer email
+            password (str): Customer password
+
+        Returns:
+            requests.Session: Session holding the auth cookies, or None if login failed
+        """
+        logger.info(f"Logging in over HTTP as {email}")
+        session = self.new_session()
+        try:
+            login_page = session.get(f"{self.base_url}/login", timeout=self.timeout)
+            token = self.extract_token(login_page.text)
+            if not token:
+                logger.error("Antiforgery token not found on /login")
+                return None
+
+            session.post(
+                f"{self.base_url}/login",
+                data={
+                    "Email": email,
+                    "Password": password,
+                    "RememberMe": "true",
+                    "__RequestVerificationToken": token,
+                },
+                allow_redirects=False,
+                timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            logger.error(f"HTTP login request failed: {str(e)}")
+            return None
+
+        if self.AUTH_COOKIE not in session.cookies:
+            logger.error(f"HTTP login rejected for {email} (no {self.AUTH_COOKIE} cookie)")
+            return None
+
+        logger.info(f"HTTP login succeeded for {email}")
+        return session
+
+    def login(self, email, password):
+        """Log in over HTTP and return the session's cookies.
+
+        Returns:
+            list: Cookie dicts in WebDriver format, or None if login failed
+        """
+        session = self.login_session(email, password)
+        if session is None:
+            return None
+        return self.to_webdriver_cookies(session.cookies)
+
+    def to_webdriver_cookies(self, jar):
+        """Convert a requests cookie jar into WebDriver cookie dicts."""
+        cookies = []
+        for cookie in jar:
+            converted = {
+                "name": cookie.name,
+                "value": cookie.value,
+                # Host-only cookies get the effective host ('localhost.local') in cookiejar
+                "domain": cookie.domain if cookie.domain_specified else self.host,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            }
+            if cookie.expires:
+                converted["expiry"] = int(cookie.expires)
+            cookies.append(converted)
+        return cookies
+
+    def get_auth_cookies(self, email, password):
+        """Return cached auth cookies for a user, logging in over HTTP if needed.
+
+        Returns:
+            list: Cookie dicts, or None if login failed
+        """
+        cookies = self.vault.get(self.base_url, email, self.VAULT_BROWSER)
+        if cookies and any(cookie["name"] == self.AUTH_COOKIE for cookie in cookies):
+            logger.debug(f"Using cached auth cookies for {email}")
+            return cookies
+
+        cookies = self.login(email, password)
+        if cookies:
+            self.vault.put(self.base_url, email, cookies, self.VAULT_BROWSER)
+        return cookies
+
+    def authenticate_driver(self, driver, email, password):
+        """Make a driver logged in as the user without going through the login UI.
+
+        Call before the driver's first navigation to the application.
+
+        Returns:
+            bool: True if auth cookies were injected
+        """
+        cookies = self.get_auth_cookies(email, password)
+        if not cookies:
+            return False
+        injected = inject_cookies(driver, self.base_url, cookies)
+        logger.info(f"Injected {injected} auth cookies for {email}")
+        return injected > 0
+
+    def invalidate(self, email):
+        """Forget a user's cached cookies (e.g. after the server rejected them)."""
+        self.vault.delete(self.base_url, email, self.VAULT_BROWSER)
@@ -0,0 +1,136 @@
+"""Deterministic, collision-free test identities.
+
+Responsibility:
+- Build unique emails and customer identities from
+  (run id, xdist worker id, counter), so parallel workers and reruns never
+  collide with "The specified email already exists"
+- Pre-generate large batches with a single counter reservation
+- Reproduce a failing run's exact data: every value is derived from its
+  (run id, worker, counter) triple, never from global random state
+
+Run id resolution:
+1. TEST_RUN_ID environment variable (set it to reproduce a run)
+2. PYTEST_XDIST_TESTRUNUID (shared by every worker of one xdist run)
+3. A new random id, logged at creation
+
+This utility does NOT:
+- Perform assertions
+- Register anything (see RegisterFlow / DataSeeder)
+"""
+
+import hashlib
+import os
+import random
+import string
+import threading
+import uuid
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class IdentityFactory:
+    """Generates unique, reproducible emails and customer identities."""
+
+    DEFAULT_DOMAIN = "example.test"
+
+    FIRST_NAMES = [
+        "John", "Jane", "Amina", "Carlos", "Mei", "Olivia", "Liam", "Fatima",
+        "Noah", "Sofia", "Ivan", "Priya", "Lucas", "Hana", "Omar", "Grace",
+    ]
+    LAST_NAMES = [
+        "Automation", "Tester", "Smith", "Garcia", "Okafor", "Chen", "Novak",
+        "Silva", "Khan", "Muller", "Rossi", "Tanaka", "Ibrahim", "Brown",
+    ]
+
+    def __init__(self, run_id=None, worker_id=None, domain=None):
+        """Initialize IdentityFactory.
+
+        Args:
+            run_id (str): Run identifier (default: TEST_RUN_ID / PYTEST_XDIST_TESTRUNUID / random)
+            worker_id (str): Worker identifier (default: PYTEST_XDIST_WORKER or 'gw0')
+            domain (str): Email domain (default: DEFAULT_DOMAIN)
+        """
+        self.run_id = run_id or self.resolve_run_id()
+        self.worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "gw0")
+        self.domain = domain or self.DEFAULT_DOMAIN
+        self._counter = 0
+        self._lock = threading.Lock()
+        logger.info(
+            f"IdentityFactory run id {self.run_id} (worker {self.worker_id}); "
+            f"set TEST_RUN_ID={self.run_id} to reproduce this data"
+        )
+
+    @staticmethod
+    def resolve_run_id():
+        run_id = os.getenv("TEST_RUN_ID") or os.getenv("PYTEST_XDIST_TESTRUNUID")
+        if run_id:
+            return run_id[:12].lower()
+        return uuid.uuid4().hex[:12]
+
+    def _reserve(self, count):
+        """Reserve `count` consecutive counter values; returns the first one."""
+        with self._lock:
+            start = self._counter
+            self._counter += count
+        return start
+
+    def _rng(self, index):
+        digest = hashlib.sha256(f"{self.run_id}|{self.worker_id}|{index}".encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    @staticmethod
+    def _alpha(index):
+        """Counter as letters (0 -> 'A', 26 -> 'BA'), for fields that reject digits."""
+        letters = ""
+        while True:
+            index, remainder = divmod(index, 26)
+            letters = string.ascii_uppercase[remainder] + letters
+            if index == 0:
+                return letters
+
+    def _email(self, prefix, index):
+        return f"{prefix}.{self.run_id}.{self.worker_id}.{index}@{self.domain}".lower()
+
+    def _identity(self, prefix, index):
+        rng = self._rng(index)
+        password = (
+            rng.choice(string.ascii_uppercase)
+            + "".join(rng.choice(string.ascii_lowercase) for _ in range(6))
+            + "".join(rng.choice(string.digits) for _ in range(3))
+            + "!"
+        )
+        return {
+            "index": index,
+            "first_name": rng.choice(self.FIRST_NAMES),
+            "last_name": f"{rng.choice(self.LAST_NAMES)}{self._alpha(index)}",
+            "email": self._email(prefix, index),
+            "password": password,
+        }
+
+    def email(self, prefix="user"):
+        """Next unique email, e.g. 'user.1a2b3c4d5e6f.gw2.17@example.test'."""
+        return self._email(prefix, self._reserve(1))
+
+    def identity(self, prefix="user"):
+        """Next unique identity.
+
+        Returns:
+            dict: {'index', 'first_name', 'last_name', 'email', 'password'}
+        """
+        return self._identity(prefix, self._reserve(1))
+
+    def batch(self, count, prefix="user"):
+        """Pre-generate `count` unique identities with one counter reservation."""
+        start = self._reserve(count)
+        return [self._identity(prefix, index) for index in range(start, start + count)]
+
+    def email_batch(self, count, prefix="user"):
+        """Pre-generate `count` unique emails with one counter reservation."""
+        start = self._reserve(count)
+        return [self._email(prefix, index) for index in range(start, start + count)]
+
+    def reproduce(self, index, prefix="user"):
+        """Rebuild the identity generated at counter `index` (with the same run and worker id)."""
+        return self._identity(prefix, index)
@@ -0,0 +1,445 @@
+"""Locator tooling: XPath-to-CSS compilation, cost benchmarks, union branch usage.
+
+Responsibility:
+- XPathToCss: rewrite XPath locators that have an exact CSS equivalent
+  (tag / attribute / contains(@attr) / starts-with(@attr) / position
+  predicates, child and descendant steps, unions) into CSS selectors.
+  BasePage applies it automatically; XPath that needs text(), axes or
+  anything else CSS cannot express is left untouched
+- LocatorBenchmark: capture page DOMs, then time every locator declared
+  on the page classes (and its CSS rewrite) against those captures in the
+  browser, reporting cost, match counts and whether the rewrite matches
+  the same elements
+- UnionBranchRecorder: for union XPaths (`A | B | C`), record which
+  branches actually match during test runs (opt-in, one extra script per
+  lookup), persisted across runs, so dead branches can be pruned
+
+Benchmark (captures are named after the page class):
+    benchmark = LocatorBenchmark(driver)
+    benchmark.capture(OrderHistoryPage)      # while the browser shows the page
+    print(LocatorBenchmark.format_report(benchmark.run()))
+
+Enable branch recording with:
+    RECORD_LOCATOR_BRANCHES=1 pytest testCases
+Disable the automatic CSS rewrite with:
+    LOCATOR_CSS_REWRITE=0 pytest testCases
+
+This utility does NOT:
+- Edit page object source files (it reports; a human prunes)
+- Perform assertions
+"""
+
+import importlib
+import inspect
+import os
+import pkgutil
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+from selenium.webdriver.common.by import By
+from utilities.customLogger import LoggerFactory
+from utilities.sessionVault import SessionVault, atomic_write_json, file_lock, read_json
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+def _split_top_level(text, separator):
+    """Split on a separator character outside brackets, parentheses and quotes."""
+    parts, depth, quote, start = [], 0, None, 0
+    for index, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+class XPathToCss:
+    """Compiles the CSS-expressible subset of XPath; returns None for the rest."""
+
+    enabled = os.getenv("LOCATOR_CSS_REWRITE", "1") != "0"
+
+    STEP_PATTERN = re.compile(r"^(\*|[A-Za-z][\w-]*)(.*)$", re.S)
+    ATTRIBUTE_EQUALS = re.compile(r"""^@([\w-]+)\s*=\s*(?:'([^'"]*)'|"([^'"]*)")$""")
+    ATTRIBUTE_EXISTS = re.compile(r"^@([\w-]+)$")
+    ATTRIBUTE_FUNCTION = re.compile(
+        r"""^(contains|starts-with)\(\s*@([\w-]+)\s*,\s*(?:'([^'"]*)'|"([^'"]*)")\s*\)$"""
+    )
+    ATTRIBUTE_ABSENT = re.compile(r"^not\(\s*@([\w-]+)\s*\)$")
+    POSITION = re.compile(r"^\d+$")
+
+    FUNCTION_OPERATORS = {"contains": "*=", "starts-with": "^="}
+
+    @staticmethod
+    def branches(xpath):
+        return [branch.strip() for branch in _split_top_level(xpath, "|")]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def compile(cls, xpath):
+        """CSS selector equivalent to the XPath, or None if there is none."""
+        selectors = []
+        for branch in cls.branches(xpath):
+            selector = cls._compile_branch(branch)
+            if selector is None:
+                return None
+            selectors.append(selector)
+        return ", ".join(selectors)
+
+    @classmethod
+    def compile_locator(cls, locator):
+        """(By.CSS_SELECTOR, css) for a compilable XPath locator; any other locator unchanged."""
+        if not cls.enabled or locator[0] != By.XPATH:
+            return locator
+        selector = cls.compile(locator[1])
+        return (By.CSS_SELECTOR, selector) if selector else locator
+
+    @classmethod
+    def _compile_branch(cls, branch):
+        if branch.startswith(".//"):
+            rest = branch[3:]
+        elif branch.startswith("//"):
+            rest = branch[2:]
+        else:
+            # Includes './x': ':scope > x' only matches it when queried from an element
+            return None
+
+        parts = []
+        separator = ""
+        depth, quote, start, index = 0, None, 0, 0
+        while index <= len(rest):
+            char = rest[index] if index < len(rest) else "/"
+            if quote:
+                quote = None if char == quote else quote
+            elif char in "'\"":
+                quote = char
+            elif char in "[(":
+                depth += 1
+            elif char in "])":
+                depth -= 1
+            elif char == "/" and depth == 0:
+                step = cls._compile_step(rest[start:index])
+                if step is None:
+                    return None
+                parts.append(separator + step)
+                if rest.startswith("//", index):
+                    separator, index = " ", index + 1
+                else:
+                    separator = " > "
+                start = index + 1
+            index += 1
+        if depth or quote or not parts:
+            # Unbalanced brackets or quotes: the final step was never closed
+            return None
+        return "".join(parts)
+
+    @classmethod
+    def _compile_step(cls, step):
+        match = cls.STEP_PATTERN.match(step.strip())
+        if not match:
+            return None
+        tag, rest = match.groups()
+
+        predicates = []
+        depth, quote, start = 0, None, None
+        for index, char in enumerate(rest):
+            if quote:
+                quote = None if char == quote else quote
+            elif char in "'\"":
+                quote = char
+            elif char == "[":
+                if depth == 0:
+                    start = index + 1
+                depth += 1
+            elif char == "]":
+                depth -= 1
+                if depth == 0:
+                    predicates.append(rest[start:index].strip())
+            elif depth == 0 and not char.isspace():
+                return None
+        if depth != 0:
+            return None
+
+        css = tag
+        for position, predicate in enumerate(predicates):
+            compiled = cls._compile_predicate(predicate, tag, position)
+            if compiled is None:
+                return None
+            css += compiled
+        return css
+
+    @classmethod
+    def _compile_predicate(cls, predicate, tag, position):
+        # A position predicate only maps to :nth-of-type when it filters the
+        # tag's siblings directly (first predicate, named tag)
+        if cls.POSITION.match(predicate):
+            return f":nth-of-type({predicate})" if position == 0 and tag != "*" else None
+        if predicate == "last()":
+            return ":last-of-type" if position == 0 and tag != "*" else None
+
+        match = cls.ATTRIBUTE_EQUALS.match(predicate)
+        if match:
+            value = match.group(2) if match.group(2) is not None else match.group(3)
+            return f'[{match.group(1)}="{value}"]'
+        match = cls.ATTRIBUTE_EXISTS.match(predicate)
+        if match:
+            return f"[{match.group(1)}]"
+        match = cls.ATTRIBUTE_FUNCTION.match(predicate)
+        if match:
+            value = match.group(3) if match.group(3) is not None else match.group(4)
+            if not value:
+                # contains(@a, '') is always true, but [a*=""] never matches
+                return None
+            return f'[{match.group(2)}{cls.FUNCTION_OPERATORS[match.group(1)]}"{value}"]'
+        match = cls.ATTRIBUTE_ABSENT.match(predicate)
+        if match:
+            return f":not([{match.group(1)}])"
+        return None
+
+
+def declared_locators(package="pages"):
+    """Locator tuples declared as class attributes on page classes.
+
+    Returns:
+        list: {'page', 'name', 'by', 'value'} for every (By.X, str) attribute
+    """
+    from utilities.basePage import BasePage
+
+    package_path = Path(__file__).parent.parent / package
+    locators = []
+    for module_info in pkgutil.iter_modules([str(package_path)]):
+        try:
+            module = importlib.import_module(f"{package}.{module_info.name}")
+        except Exception as e:
+            logger.warning(f"Skipping {package}.{module_info.name}: {str(e)}")
+            continue
+        for page_name, page_class in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(page_class, BasePage) or page_class.__module__ != module.__name__:
+                continue
+            for name, value in vars(page_class).items():
+                if (
+                    isinstance(value, tuple) and len(value) == 2
+                    and isinstance(value[1], str) and value[0] in vars(By).values()
+                ):
+                    locators.append({"page": page_name, "name": name, "by": value[0], "value": value[1]})
+    return locators
+
+
+class LocatorBenchmark:
+    """Times page-object locators against captured DOMs inside the browser."""
+
+    CAPTURE_DIR = SessionVault.VAULT_DIR.parent / "dom_captures"
+
+    DEFAULT_ITERATIONS = 50
+
+    SCRIPT_TAG_PATTERN = re.compile(r"<script\b.*?</script\s*>", re.S | re.I)
+
+    LOAD_CAPTURE_SCRIPT = """
+        document.open();
+        document.write(arguments[0]);
+        document.close();
+    """
+
+    BENCHMARK_SCRIPT = """
+        var locators = arguments[0], iterations = arguments[1];
+
+        function query(by, value) {
+            if (by === 'xpath') {
+                return document.evaluate(value, document, null,
+                                         XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+            }
+            var css = by === 'id' ? '[id="' + value + '"]'
+                    : by === 'name' ? '[name="' + value + '"]'
+                    : by === 'class name' ? '.' + value
+                    : value;
+            return document.querySelectorAll(css).length;
+        }
+
+        function time(by, value) {
+            try {
+                var matches = query(by, value);
+                var started = performance.now();
+                for (var i = 0; i < iterations; i++) { query(by, value); }
+                return {matches: matches, ms: (performance.now() - started) / iterations, error: null};
+            } catch (e) {
+                return {matches: null, ms: null, error: String(e)};
+            }
+        }
+
+        return locators.map(function (locator) {
+            var result = time(locator.by, locator.value);
+            result.css = locator.css ? time('css selector', locator.css) : null;
+            return result;
+        });
+    """
+
+    def __init__(self, driver, capture_dir=None):
+        """Initialize LocatorBenchmark.
+
+        Args:
+            driver: Selenium WebDriver used to load captures and run queries
+            capture_dir (Path): Directory of <PageClass>.html captures (default: CAPTURE_DIR)
+        """
+        self.driver = driver
+        self.capture_dir = Path(capture_dir) if capture_dir else self.CAPTURE_DIR
+
+    def capture(self, page):
+        """Save the current DOM as the capture for a page class (or class name)."""
+        name = page if isinstance(page, str) else page.__name__
+        path = self.capture_dir / f"{name}.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.driver.page_source, encoding="utf-8")
+        logger.info(f"Captured DOM for {name} ({path.stat().st_size} bytes)")
+        return path
+
+    def _load_capture(self, path):
+        # Scripts are stripped so the DOM stays exactly as captured
+        html = self.SCRIPT_TAG_PATTERN.sub("", path.read_text(encoding="utf-8"))
+        self.driver.get("about:blank")
+        self.driver.execute_script(self.LOAD_CAPTURE_SCRIPT, html)
+
+    def run(self, iterations=None, locators=None):
+        """Benchmark every declared locator whose page has a capture.
+
+        Returns:
+            list: Rows {'page', 'name', 'by', 'value', 'matches', 'ms', 'error',
+                  'css', 'css_matches', 'css_ms', 'equivalent', 'speedup'},
+                  most expensive first
+        """
+        iterations = iterations or self.DEFAULT_ITERATIONS
+        locators = locators if locators is not None else declared_locators()
+        by_page = {}
+        for locator in locators:
+            by_page.setdefault(locator["page"], []).append(locator)
+
+        rows = []
+        for page, page_locators in sorted(by_page.items()):
+            path = self.capture_dir / f"{page}.html"
+            if not path.exists():
+                logger.info(f"No DOM capture for {page} - skipped")
+                continue
+            self._load_capture(path)
+            payload = [
+                {
+                    "by": locator["by"],
+                    "value": locator["value"],
+                    "css": XPathToCss.compile(locator["value"]) if locator["by"] == By.XPATH else None,
+                }
+                for locator in page_locators
+            ]
+            started = time.perf_counter()
+            timings = self.driver.execute_script(self.BENCHMARK_SCRIPT, payload, iterations)
+            logger.info(f"Benchmarked {len(payload)} locators of {page} in {time.perf_counter() - started:.2f}s")
+            for locator, entry, timing in zip(page_locators, payload, timings):
+                css = timing["css"] or {}
+                rows.append({
+                    **locator,
+                    "matches": timing["matches"],
+                    "ms": timing["ms"],
+                    "error": timing["error"],
+                    "css": entry["css"],
+                    "css_matches": css.get("matches"),
+                    "css_ms": css.get("ms"),
+                    "equivalent": bool(css) and css.get("matches") == timing["matches"],
+                    "speedup": round(timing["ms"] / css["ms"], 1) if css.get("ms") and timing["ms"] else None,
+                })
+        rows.sort(key=lambda row: row["ms"] or 0, reverse=True)
+        return rows
+
+    @staticmethod
+    def format_report(rows, limit=25):
+        """Plain-text table of the most expensive locators."""
+        lines = [f"{'ms':>8} {'css ms':>8} {'x':>5} {'hits':>5}  locator"]
+        for row in rows[:limit]:
+            ms = f"{row['ms']:.3f}" if row["ms"] is not None else "error"
+            css_ms = f"{row['css_ms']:.3f}" if row["css_ms"] is not None else "-"
+            speedup = f"{row['speedup']}" if row["speedup"] else "-"
+            mismatch = "" if row["css"] is None or row["equivalent"] else "  (CSS MATCHES DIFFER)"
+            lines.append(
+                f"{ms:>8} {css_ms:>8} {speedup:>5} {str(row['matches']):>5}  "
+                f"{row['page']}.{row['name']}{mismatch}"
+            )
+        return "\n".join(lines)
+
+
+class UnionBranchRecorder:
+    """Counts which branches of union XPath locators match during test runs."""
+
+    RECORD_FILE = SessionVault.VAULT_DIR.parent / "locator_branches.json"
+
+    enabled = os.getenv("RECORD_LOCATOR_BRANCHES") == "1"
+
+    BRANCH_SCRIPT = """
+        return arguments[0].map(function (branch) {
+            try {
+                return document.evaluate(branch, document, null,
+                                         XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+            } catch (e) {
+                return -1;
+            }
+        });
+    """
+
+    # {xpath: {'lookups': n, 'branches': {branch: lookups_where_it_matched}}} not yet flushed
+    _pending = {}
+
+    @classmethod
+    def record(cls, driver, locator):
+        """Evaluate each branch of a union XPath locator once and count the matching ones."""
+        if not cls.enabled or locator[0] != By.XPATH:
+            return
+        branches = XPathToCss.branches(locator[1])
+        if len(branches) < 2:
+            return
+        try:
+            counts = driver.execute_script(cls.BRANCH_SCRIPT, branches)
+        except Exception as e:
+            logger.debug(f"Could not record union branches for {locator[1]}: {str(e)}")
+            return
+        entry = cls._pending.setdefault(locator[1], {"lookups": 0, "branches": {}})
+        entry["lookups"] += 1
+        for branch, count in zip(branches, counts):
+            entry["branches"][branch] = entry["branches"].get(branch, 0) + (1 if count > 0 else 0)
+
+    @classmethod
+    def flush(cls):
+        """Merge this process's counts into the persisted record."""
+        if not cls._pending:
+            return
+        with file_lock(cls.RECORD_FILE):
+            stored = read_json(cls.RECORD_FILE) or {}
+            for xpath, entry in cls._pending.items():
+                merged = stored.setdefault(xpath, {"lookups": 0, "branches": {}})
+                merged["lookups"] += entry["lookups"]
+                for branch, hits in entry["branches"].items():
+                    merged["branches"][branch] = merged["branches"].get(branch, 0) + hits
+            atomic_write_json(cls.RECORD_FILE, stored)
+        logger.info(f"Recorded union branch usage for {len(cls._pending)} locators")
+        cls._pending = {}
+
+    @classmethod
+    def dead_branches(cls, min_lookups=20):
+        """Branches that never matched across at least min_lookups recorded lookups.
+
+        Returns:
+            list: {'locator', 'branch', 'lookups'} candidates for pruning
+        """
+        stored = read_json(cls.RECORD_FILE) or {}
+        return [
+            {"locator": xpath, "branch": branch, "lookups": entry["lookups"]}
+            for xpath, entry in sorted(stored.items())
+            if entry["lookups"] >= min_lookups
+            for branch, hits in entry["branches"].items()
+            if hits == 0
+        ]
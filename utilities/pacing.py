@@ -0,0 +1,156 @@
+"""Interaction pacing profiles for the human-like BasePage methods.
+
+Responsibility:
+- Scale every human-like delay in BasePage (typing gaps, pauses after
+  clicks, slow mouse moves, focus and scroll pauses) from one place
+- Select the profile per run (--pacing / PACING_PROFILE) or per test
+  (@pytest.mark.pacing("human"))
+- Account for the sleep time each profile skipped and report it at the
+  end of the run
+
+Profiles:
+    human  - delays as written (default)
+    brisk  - delays at a quarter of their length
+    turbo  - no delays
+
+Typing stays character-by-character in every profile: turbo removes the
+sleep between keystrokes, not the keystrokes, so tests exercising
+per-key events (e.g. test_register_with_slow_typing) behave the same.
+
+Enable with:
+    pytest testCases --pacing turbo
+    PACING_PROFILE=brisk pytest testCases
+
+This utility does NOT:
+- Touch explicit waits or stability checks (those wait for the page, not
+  for a human)
+- Perform assertions
+"""
+
+import os
+import time
+import pytest
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class Pacing:
+    """Process-wide pacing profile; BasePage sleeps through pause()."""
+
+    PROFILES = {
+        "human": 1.0,
+        "brisk": 0.25,
+        "turbo": 0.0,
+    }
+
+    DEFAULT_PROFILE = "human"
+
+    ENV_VAR = "PACING_PROFILE"
+
+    profile = os.getenv(ENV_VAR, DEFAULT_PROFILE).lower()
+
+    # Seconds of sleep skipped, per profile, in this process
+    saved = {}
+
+    @classmethod
+    def validate(cls, name):
+        name = (name or cls.DEFAULT_PROFILE).lower()
+        if name not in cls.PROFILES:
+            raise ValueError(f"Unknown pacing profile: {name}. Use one of {sorted(cls.PROFILES)}")
+        return name
+
+    @classmethod
+    def use(cls, name):
+        """Switch the active profile; returns the previous one."""
+        previous = cls.profile
+        cls.profile = cls.validate(name)
+        return previous
+
+    @classmethod
+    def scale(cls, seconds):
+        return seconds * cls.PROFILES.get(cls.profile, 1.0)
+
+    @classmethod
+    def pause(cls, seconds):
+        """Sleep for a human-like delay, scaled by the active profile."""
+        scaled = cls.scale(seconds)
+        if scaled > 0:
+            time.sleep(scaled)
+        if seconds > scaled:
+            cls.saved[cls.profile] = cls.saved.get(cls.profile, 0.0) + seconds - scaled
+
+    @classmethod
+    def total_saved(cls):
+        return sum(cls.saved.values())
+
+
+class PacingPlugin:
+    """Pytest plugin object; registered from testCases/conftest.py.
+
+    Per-test savings travel to the xdist controller in the report's
+    user_properties, so the summary covers all workers.
+    """
+
+    MARKER = "pacing"
+
+    PROPERTY = "pacing_saved"
+
+    def __init__(self, config):
+        self.config = config
+        option = config.getoption("--pacing", default=None)
+        if option:
+            Pacing.use(option)
+        else:
+            Pacing.use(Pacing.profile)
+        self.run_profile = Pacing.profile
+        logger.info(f"Interaction pacing profile: {self.run_profile}")
+        self.saved = {}
+        self._saved_before = 0.0
+        self._previous_profile = None
+
+    @staticmethod
+    def add_options(parser):
+        parser.addoption(
+            "--pacing",
+            action="store",
+            default=None,
+            choices=sorted(Pacing.PROFILES),
+            help=f"Human-like delay profile (default: ${Pacing.ENV_VAR} or {Pacing.DEFAULT_PROFILE})",
+        )
+
+    def pytest_runtest_setup(self, item):
+        self._saved_before = Pacing.total_saved()
+        marker = item.get_closest_marker(self.MARKER)
+        if marker and marker.args:
+            self._previous_profile = Pacing.use(marker.args[0])
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        if call.when == "teardown":
+            item.user_properties.append(
+                (self.PROPERTY, (Pacing.profile, Pacing.total_saved() - self._saved_before))
+            )
+            if self._previous_profile is not None:
+                Pacing.use(self._previous_profile)
+                self._previous_profile = None
+        yield
+
+    def pytest_runtest_logreport(self, report):
+        if hasattr(self.config, "workerinput") or report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == self.PROPERTY:
+                profile, seconds = value
+                self.saved[profile] = self.saved.get(profile, 0.0) + seconds
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not any(self.saved.values()):
+            return
+        terminalreporter.write_sep("-", "interaction pacing")
+        terminalreporter.write_line(f"Run profile: {self.run_profile}")
+        for profile, seconds in sorted(self.saved.items()):
+            if seconds > 0:
+                terminalreporter.write_line(f"  {profile}: {seconds:.1f}s of human-like delay skipped")
+        terminalreporter.write_line(f"Total saved: {sum(self.saved.values()):.1f}s")
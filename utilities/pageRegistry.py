@@ -0,0 +1,163 @@
+"""Lazy, per-driver page object registry for flows.
+
+Responsibility:
+- Build a page object only when a flow first touches it, instead of every
+  page a flow might need in its constructor (each BasePage construction
+  reads config, builds a WebDriverWait and runs the Cloudflare check
+  against the live browser)
+- Share one instance per page class between all flows on the same
+  driver, so LoginFlow, SearchFlow and RegisterFlow do not each build
+  their own HomePage
+- Keep a separate set per isolated browser context: BrowserContextPool
+  activates a context's own registry while the driver points at it, and
+  a flow keeps the registry it was created under
+- Measure construction time and report what the eager constructors
+  would have cost, per driver (i.e. per test) and per process
+
+Declaring pages on a flow:
+
+    class SearchFlow:
+        home_page = LazyPage(HomePage)
+        search_page = LazyPage(SearchPage)
+
+        def __init__(self, driver):
+            self.driver = driver
+            PageRegistry.for_driver(driver).register_flow(self)
+
+Assigning an attribute (flow.home_page = stub) still overrides the lazy page.
+
+This utility does NOT:
+- Re-run a shared page's Cloudflare check (BasePage interaction methods
+  check before every action anyway)
+- Perform assertions
+"""
+
+import time
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class LazyPage:
+    """Flow class attribute resolving to the driver's shared page instance on first access."""
+
+    def __init__(self, page_class):
+        self.page_class = page_class
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, flow, owner=None):
+        if flow is None:
+            return self
+        registry = flow.__dict__.get(PageRegistry.FLOW_ATTRIBUTE) or PageRegistry.for_driver(flow.driver)
+        page = registry.get(self.page_class)
+        # Non-data descriptor: later accesses hit the instance attribute directly
+        flow.__dict__[self.name] = page
+        return page
+
+
+class PageRegistry:
+    """Page class -> shared page object for one driver."""
+
+    # Attribute holding the active registry on the driver object; it lives and dies with the driver
+    DRIVER_ATTRIBUTE = "_page_registry"
+
+    # Attribute binding a flow to the registry that was active when it was created
+    FLOW_ATTRIBUTE = "_page_registry"
+
+    # Per page class: [constructions, total seconds] across the process, for cost estimates
+    _construction_times = {}
+
+    # Process-wide counters
+    totals = {"flows": 0, "eager_pages": 0, "constructed": 0, "reused": 0, "construction_seconds": 0.0}
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._pages = {}
+        self.stats = {"flows": 0, "eager_pages": 0, "constructed": 0, "reused": 0, "construction_seconds": 0.0}
+
+    @classmethod
+    def for_driver(cls, driver):
+        """The registry shared by all flows of the driver's active browser context."""
+        registry = getattr(driver, cls.DRIVER_ATTRIBUTE, None)
+        if registry is None:
+            registry = cls(driver)
+            if driver is not None:
+                setattr(driver, cls.DRIVER_ATTRIBUTE, registry)
+        return registry
+
+    @classmethod
+    def activate(cls, driver, registry):
+        """Make registry the one for_driver() returns (e.g. after switching browser contexts)."""
+        setattr(driver, cls.DRIVER_ATTRIBUTE, registry)
+
+    def _count(self, name, amount=1):
+        self.stats[name] += amount
+        PageRegistry.totals[name] += amount
+
+    def register_flow(self, flow):
+        """Count the pages an eager constructor of this flow would have built."""
+        declared = sum(1 for value in vars(type(flow)).values() if isinstance(value, LazyPage))
+        flow.__dict__[self.FLOW_ATTRIBUTE] = self
+        self._count("flows")
+        self._count("eager_pages", declared)
+
+    def get(self, page_class):
+        """Shared instance of page_class, constructed on first request."""
+        page = self._pages.get(page_class)
+        if page is not None:
+            self._count("reused")
+            return page
+
+        started = time.perf_counter()
+        page = page_class(self.driver)
+        elapsed = time.perf_counter() - started
+        self._pages[page_class] = page
+        self._count("constructed")
+        self._count("construction_seconds", elapsed)
+        record = PageRegistry._construction_times.setdefault(page_class.__name__, [0, 0.0])
+        record[0] += 1
+        record[1] += elapsed
+        logger.debug(f"Constructed {page_class.__name__} in {elapsed * 1000:.0f}ms")
+        return page
+
+    @classmethod
+    def average_construction_seconds(cls):
+        count = sum(record[0] for record in cls._construction_times.values())
+        total = sum(record[1] for record in cls._construction_times.values())
+        return total / count if count else 0.0
+
+    @staticmethod
+    def _summarize(stats):
+        avoided = max(0, stats["eager_pages"] - stats["constructed"])
+        return {
+            **stats,
+            "construction_seconds": round(stats["construction_seconds"], 3),
+            "constructions_avoided": avoided,
+            "estimated_seconds_saved": round(avoided * PageRegistry.average_construction_seconds(), 3),
+        }
+
+    def report(self):
+        """This driver's counters plus the estimated construction time saved.
+
+        Returns:
+            dict: {'flows', 'eager_pages', 'constructed', 'reused', 'construction_seconds',
+                   'constructions_avoided', 'estimated_seconds_saved'}
+        """
+        return self._summarize(self.stats)
+
+    @classmethod
+    def report_totals(cls):
+        return cls._summarize(cls.totals)
+
+    @classmethod
+    def snapshot(cls):
+        return dict(cls.totals)
+
+    @classmethod
+    def report_since(cls, snapshot):
+        """Process-wide counters accumulated since snapshot() (e.g. during one test)."""
+        return cls._summarize({name: cls.totals[name] - snapshot[name] for name in cls.totals})
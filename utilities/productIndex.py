@@ -0,0 +1,262 @@
+"""Session-wide product catalog index.
+
+Responsibility:
+- Crawl the storefront once over HTTP: category pages (from the top menu,
+  plus their sub-categories) and manufacturer pages give product URLs,
+  following each listing's pager; product pages give id, SKU, price and
+  stock
+- Persist the index as JSON with a TTL, shared by every xdist worker
+  (written atomically; workers that find it stale crawl without holding
+  the file lock, and the lock only serializes the final write)
+- Resolve a product name, SKU or id to its entry in O(1), so flows can
+  open a product page directly instead of searching the UI
+
+The index is a snapshot: tests that verify catalog changes use it as the
+reference they compare the live page against.
+
+This utility does NOT:
+- Perform assertions
+- Drive a browser
+"""
+
+import html
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+from utilities.customLogger import LoggerFactory
+from utilities.dataSeeder import DataSeeder
+from utilities.sessionVault import SessionVault, atomic_write_json, file_lock, read_json
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class ProductIndex:
+    """Name / SKU / id lookups over a crawled snapshot of the product catalog."""
+
+    INDEX_FILE = SessionVault.VAULT_DIR.parent / "product_index.json"
+
+    # Seconds before the persisted index is crawled again
+    DEFAULT_TTL = 6 * 60 * 60
+
+    # Lists every manufacturer (search is not used: its minimum term length hides most products)
+    MANUFACTURERS_PATH = "/manufacturer/all"
+
+    # Characters of the home page scanned for menu links after the top menu starts
+    MENU_SCAN_LENGTH = 30000
+
+    # Pages followed per listing, in case a pager links back to itself
+    MAX_LISTING_PAGES = 100
+
+    HREF_PATTERN = re.compile(r'href="(/[^"#?]+)"')
+    SUBCATEGORY_PATTERN = re.compile(r'class="sub-category-item".*?<a href="(/[^"#?]+)"', re.S)
+    MANUFACTURER_PATTERN = re.compile(r'class="manufacturer-item".*?<a href="(/[^"#?]+)"', re.S)
+    NEXT_PAGE_PATTERN = re.compile(r'class="next-page"[^>]*>\s*<a[^>]*href="([^"]+)"')
+    PRODUCT_LINK_PATTERN = re.compile(
+        r'class="product-item"[^>]*data-productid="(\d+)".*?<h2 class="product-title">\s*<a href="([^"]+)"',
+        re.S,
+    )
+    NAME_PATTERN = re.compile(r'<div class="product-name">\s*<h1[^>]*>(.*?)</h1>', re.S)
+    SKU_PATTERN = re.compile(r'id="sku-\d+"[^>]*>(.*?)</span>', re.S)
+    PRICE_PATTERN = re.compile(r'class="price-value-\d+"[^>]*>(.*?)</span>', re.S)
+    STOCK_PATTERN = re.compile(r'id="stock-availability-value-\d+"[^>]*>(.*?)</span>', re.S)
+
+    _shared = None
+
+    def __init__(self, base_url=None, ttl=None, max_workers=8):
+        """Initialize ProductIndex.
+
+        Args:
+            base_url (str): Application URL (default: configured base URL)
+            ttl (float): Seconds a persisted index stays valid (default: DEFAULT_TTL)
+            max_workers (int): Concurrent product page fetches during a crawl
+        """
+        self.seeder = DataSeeder(base_url, max_workers=max_workers)
+        self.base_url = self.seeder.base_url
+        self.ttl = ttl or self.DEFAULT_TTL
+        self.products = []
+        self.built_at = None
+        self._by_name = {}
+        self._by_sku = {}
+        self._by_id = {}
+
+    @classmethod
+    def shared(cls):
+        """The process-wide index, loaded from disk or crawled on first use."""
+        if cls._shared is None:
+            cls._shared = cls().load_or_build()
+        return cls._shared
+
+    # ===== Persistence =====
+
+    def load_or_build(self, force=False):
+        """Load a fresh persisted index, or crawl and persist a new one.
+
+        The crawl runs without holding the lock (the file is replaced
+        atomically, so readers never need it); the lock only guards the
+        final check-and-write, where an index another worker finished in
+        the meantime wins over this one.
+        """
+        stored = None if force else read_json(self.INDEX_FILE)
+        if self._is_fresh(stored):
+            self._set(stored["products"], stored["built_at"])
+            logger.info(f"Loaded product index ({len(self.products)} products)")
+            return self
+
+        started = time.time()
+        products = self.crawl()
+        with file_lock(self.INDEX_FILE):
+            stored = read_json(self.INDEX_FILE)
+            if self._is_fresh(stored) and stored["built_at"] >= started:
+                self._set(stored["products"], stored["built_at"])
+                logger.info(f"Using product index built by another worker ({len(self.products)} products)")
+                return self
+            self._set(products, time.time())
+            atomic_write_json(self.INDEX_FILE, {
+                "base_url": self.base_url,
+                "built_at": self.built_at,
+                "products": self.products,
+            })
+        return self
+
+    def _is_fresh(self, stored):
+        return bool(
+            stored
+            and stored.get("base_url") == self.base_url
+            and stored.get("built_at", 0) + self.ttl > time.time()
+        )
+
+    def _set(self, products, built_at):
+        self.products = products
+        self.built_at = built_at
+        self._by_name = {product["name"].lower(): product for product in products if product["name"]}
+        self._by_sku = {product["sku"].lower(): product for product in products if product["sku"]}
+        self._by_id = {product["id"]: product for product in products}
+
+    # ===== Crawling =====
+
+    def crawl(self):
+        """Crawl category and manufacturer listings, then every product page found.
+
+        Returns:
+            list: Product dicts {'id', 'name', 'sku', 'url', 'price', 'stock'}
+        """
+        started = time.perf_counter()
+        client = self.seeder.new_client()
+
+        home = client.get("/").text
+        menu_start = home.find('class="top-menu')
+        menu = home[menu_start:menu_start + self.MENU_SCAN_LENGTH] if menu_start >= 0 else ""
+        listing_paths = list(dict.fromkeys(self.HREF_PATTERN.findall(menu)))
+        try:
+            manufacturers = client.get(self.MANUFACTURERS_PATH).text
+            listing_paths += self.MANUFACTURER_PATTERN.findall(manufacturers)
+        except Exception as e:
+            logger.warning(f"Could not crawl {self.MANUFACTURERS_PATH}: {str(e)}")
+
+        with ThreadPoolExecutor(max_workers=self.seeder.max_workers) as executor:
+            urls = {}
+            seen = set()
+            # Breadth-first: category pages add their sub-categories to the next round
+            pending = list(dict.fromkeys(listing_paths))
+            while pending:
+                seen.update(pending)
+                next_round = []
+                for found, subcategories in executor.map(self._product_links, pending):
+                    urls.update(found)
+                    next_round += [path for path in subcategories if path not in seen]
+                pending = list(dict.fromkeys(next_round))
+            products = [
+                product for product in executor.map(self._product_details, urls.items()) if product
+            ]
+
+        logger.info(
+            f"Crawled {len(products)} products from {len(seen)} listings "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+        return products
+
+    def _product_links(self, listing_path):
+        """Products on every page of one category or manufacturer listing.
+
+        Follows the listing's own pager, so it works whatever page sizes
+        the store allows customers to select.
+
+        Returns:
+            tuple: ({product_id: path}, [sub-category paths])
+        """
+        client = self.seeder.new_client()
+        links, subcategories = {}, []
+        path = listing_path
+        for _ in range(self.MAX_LISTING_PAGES):
+            try:
+                page = client.get(path).text
+            except Exception as e:
+                logger.warning(f"Could not crawl {path}: {str(e)}")
+                break
+            links.update(
+                (int(product_id), urlparse(urljoin(self.base_url, href)).path)
+                for product_id, href in self.PRODUCT_LINK_PATTERN.findall(page)
+            )
+            subcategories += self.SUBCATEGORY_PATTERN.findall(page)
+            next_page = self.NEXT_PAGE_PATTERN.search(page)
+            if not next_page:
+                break
+            next_url = urlparse(urljoin(self.base_url + path, html.unescape(next_page.group(1))))
+            path = f"{next_url.path}?{next_url.query}" if next_url.query else next_url.path
+        return links, subcategories
+
+    def _text(self, pattern, page):
+        match = pattern.search(page)
+        if not match:
+            return None
+        return html.unescape(re.sub(r"<[^>]+>", "", match.group(1))).strip()
+
+    def _product_details(self, entry):
+        product_id, path = entry
+        try:
+            page = self.seeder.new_client().get(path).text
+        except Exception as e:
+            logger.warning(f"Could not crawl product {path}: {str(e)}")
+            return None
+        price_text = self._text(self.PRICE_PATTERN, page)
+        price_digits = re.sub(r"[^0-9.]", "", price_text or "")
+        return {
+            "id": product_id,
+            "name": self._text(self.NAME_PATTERN, page),
+            "sku": self._text(self.SKU_PATTERN, page),
+            "url": path,
+            "price": float(price_digits) if price_digits else None,
+            "price_text": price_text,
+            "stock": self._text(self.STOCK_PATTERN, page),
+        }
+
+    # ===== Lookups =====
+
+    def by_name(self, name):
+        """Product with exactly this name (case-insensitive), or None."""
+        return self._by_name.get(name.strip().lower())
+
+    def by_sku(self, sku):
+        return self._by_sku.get(sku.strip().lower())
+
+    def by_id(self, product_id):
+        return self._by_id.get(int(product_id))
+
+    def find(self, name):
+        """Exact name match, falling back to the first product whose name contains `name`."""
+        product = self.by_name(name)
+        if product is not None:
+            return product
+        needle = name.strip().lower()
+        return next((p for key, p in self._by_name.items() if needle in key), None)
+
+    def url_for(self, name):
+        """Absolute product page URL for a product name, or None."""
+        product = self.find(name)
+        return f"{self.base_url}{product['url']}" if product else None
+
+    def product_id(self, name):
+        product = self.find(name)
+        return product["id"] if product else None
@@ -0,0 +1,86 @@
+"""Direct URL routes for page objects.
+
+Responsibility:
+- Map page classes to their nopCommerce URLs in one table
+- Open a page directly (one page load) instead of going through the home
+  page and its menus (two or more page loads)
+- Skip the load entirely when the browser is already on that route
+
+Tests that verify menu / header navigation itself must keep using the
+click path (HomePageFlow.*_via_menu).
+
+This utility does NOT:
+- Perform assertions
+- Wait for page-specific content (flows still call their wait_for_* methods)
+"""
+
+from urllib.parse import urlparse
+from utilities.customLogger import LoggerFactory
+from utilities.elementCache import ElementCache
+from utilities.readProperties import ReadProperties
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+# Page class name -> path. Keyed by name so pages are imported only when used.
+ROUTES = {
+    "HomePage": "/",
+    "LoginPage": "/login",
+    "LogoutPage": "/logout",
+    "RegisterPage": "/register",
+    "ForgotPasswordPage": "/passwordrecovery",
+    "SearchPage": "/search",
+    "ShoppingCartReviewPage": "/cart",
+    "WishListPage": "/wishlist",
+    "ProductComparePage": "/compareproducts",
+    "CheckoutPage": "/onepagecheckout",
+    "MyAccountPage": "/customer/info",
+    "MyAccountProfilePage": "/customer/info",
+    "MyAccountAddressesPage": "/customer/addresses",
+    "MyAccountPasswordPage": "/customer/changepassword",
+    "OrderHistoryPage": "/order/history",
+    "DownloadsPage": "/customer/downloadableproducts",
+    "RecurringPaymentsPage": "/order/recurringpayments",
+    "ProductReturnsPage": "/returnrequest/history",
+    "ReturnRequestPage": "/returnrequest/{order_id}",
+}
+
+
+def route_for(page, **params):
+    """Path of a page class (or class name), with {placeholders} filled from params.
+
+    Raises:
+        ValueError: If the page has no route
+    """
+    name = page if isinstance(page, str) else page.__name__
+    if name not in ROUTES:
+        raise ValueError(f"No route for page '{name}'. Known pages: {sorted(ROUTES)}")
+    return ROUTES[name].format(**params)
+
+
+def navigate_to(driver, page, base_url=None, force=False, **params):
+    """Open a page by URL, skipping the load if the browser is already there.
+
+    Args:
+        driver: Selenium WebDriver
+        page: Page class or class name (key of ROUTES)
+        base_url (str): Application URL (default: configured base URL)
+        force (bool): Reload even if already on the route
+        **params: Values for route placeholders (e.g. order_id=42)
+
+    Returns:
+        bool: True if a page load happened, False if it was skipped
+    """
+    base_url = (base_url or ReadProperties().get_base_url()).rstrip("/")
+    path = route_for(page, **params)
+    current_path = urlparse(driver.current_url).path.rstrip("/") or "/"
+
+    if not force and current_path.lower() == (path.rstrip("/") or "/").lower():
+        logger.debug(f"Already on {path} - navigation skipped")
+        return False
+
+    logger.info(f"Navigating directly to {path}")
+    driver.get(f"{base_url}{path}")
+    ElementCache.invalidate_driver(driver)
+    return True
@@ -0,0 +1,281 @@
+"""Concurrent multi-session orchestrator with barrier-synchronized actions.
+
+Responsibility:
+- Run one flow per user at the same time, each user on its own driver
+- Give every WebDriver ONE dedicated thread (WebDriver is not thread-safe)
+- Let flows meet at named barriers right before critical clicks
+  (add to cart, place order, subscribe) so the requests land together
+- Measure the real skew between users at each barrier
+- Return per-user timing, results and errors for invariant checks
+
+Users that share a driver (isolated browser contexts of one Chrome) share
+that driver's thread and run one after another. Such users cannot meet at
+a barrier, because only one of them can be running at a time.
+
+This utility does NOT:
+- Perform assertions (caller checks inventory/order invariants)
+- Create or quit drivers
+- Know about specific pages or flows
+
+Usage:
+    orchestrator = SessionOrchestrator(timeout=60)
+    orchestrator.add_user("buyer_one", driver_one)
+    orchestrator.add_user("buyer_two", driver_two)
+    orchestrator.barrier("add_to_cart")
+
+    def buy(session):
+        flow = session.flow(ProductDisplayFlow)
+        flow.wait_for_product_page_to_load()
+        session.sync("add_to_cart")
+        flow.add_product_to_cart()
+        return flow.get_product_name()
+
+    outcome = orchestrator.run({"buyer_one": buy, "buyer_two": buy})
+    outcome["barriers"]["add_to_cart"]["skew_ms"]
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class DriverThread:
+    """A single dedicated worker thread that owns one WebDriver.
+
+    Every call that touches the driver is submitted here, so the driver is
+    only ever used from one thread no matter how many callers there are.
+    """
+
+    def __init__(self, driver, name):
+        """Initialize DriverThread.
+
+        Args:
+            driver: Selenium WebDriver owned by this thread
+            name (str): Name used for the thread (visible in logs/debuggers)
+        """
+        self.driver = driver
+        self.name = name
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"driver-{name}"
+        )
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue a callable on the driver's thread.
+
+        Returns:
+            concurrent.futures.Future: Future resolving to fn's return value
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """Stop the worker thread once queued calls have finished."""
+        self._executor.shutdown(wait=wait)
+
+
+class UserSession:
+    """Handle passed to a user's step function while it runs.
+
+    Gives access to the user's driver (or browser context), cached flows
+    and the barriers the user participates in.
+    """
+
+    def __init__(self, orchestrator, name, target):
+        self.orchestrator = orchestrator
+        self.name = name
+        self.target = target
+        self.sync_points = {}
+        self._flows = {}
+
+    @property
+    def driver(self):
+        """WebDriver this user runs on."""
+        return getattr(self.target, "driver", self.target)
+
+    def flow(self, flow_class):
+        """Get this user's instance of a flow, creating it on first use."""
+        if hasattr(self.target, "flow"):
+            return self.target.flow(flow_class)
+        if flow_class not in self._flows:
+            self._flows[flow_class] = flow_class(self.driver)
+        return self._flows[flow_class]
+
+    def sync(self, barrier_name):
+        """Wait at a named barrier until every participating user arrives.
+
+        Call this immediately before the critical action. The moment the
+        barrier releases this user is recorded and used to compute skew.
+
+        Args:
+            barrier_name (str): Barrier registered via SessionOrchestrator.barrier()
+
+        Returns:
+            float: perf_counter timestamp at which this user was released
+
+        Raises:
+            threading.BrokenBarrierError: If another user failed or the barrier timed out
+        """
+        barrier = self.orchestrator.barriers[barrier_name]
+        logger.debug(f"User '{self.name}' waiting at barrier '{barrier_name}'")
+        barrier["barrier"].wait()
+        released_at = time.perf_counter()
+        self.sync_points[barrier_name] = released_at
+        with self.orchestrator.lock:
+            barrier["release_times"][self.name] = released_at
+        return released_at
+
+    def mark(self, label):
+        """Record a named timestamp (e.g. right after the critical click returns).
+
+        Returns:
+            float: perf_counter timestamp recorded under the label
+        """
+        self.sync_points[label] = time.perf_counter()
+        return self.sync_points[label]
+
+
+class SessionOrchestrator:
+    """Runs user flows concurrently, one dedicated thread per driver."""
+
+    def __init__(self, timeout=60):
+        """Initialize SessionOrchestrator.
+
+        Args:
+            timeout (float): Seconds a user may wait at a barrier and seconds
+                the whole run may take per user (default: 60)
+        """
+        self.timeout = timeout
+        self.users = {}
+        self.barriers = {}
+        self.lock = threading.Lock()
+        self._threads = {}
+
+    def add_user(self, name, target):
+        """Register a user.
+
+        Args:
+            name (str): Logical user name
+            target: WebDriver, or IsolatedContext from utilities.browserContexts
+
+        Raises:
+            ValueError: If the name is already registered
+        """
+        if name in self.users:
+            raise ValueError(f"User '{name}' is already registered")
+        driver = getattr(target, "driver", target)
+        key = id(driver)
+        if key not in self._threads:
+            self._threads[key] = DriverThread(driver, name)
+        self.users[name] = {"target": target, "thread": self._threads[key]}
+        logger.info(f"Registered user '{name}' on driver thread '{self._threads[key].name}'")
+
+    def barrier(self, name, users=None):
+        """Declare a barrier that the given users must all reach.
+
+        Args:
+            name (str): Barrier name used with UserSession.sync()
+            users (list): Participating user names (default: all registered users)
+
+        Raises:
+            ValueError: If two participants share a driver (they could never meet)
+        """
+        participants = list(users) if users else list(self.users)
+        drivers = [self.users[user]["thread"] for user in participants]
+        if len(set(map(id, drivers))) != len(drivers):
+            raise ValueError(
+                f"Barrier '{name}' needs users on separate drivers; users sharing "
+                "a driver run sequentially on its thread"
+            )
+        self.barriers[name] = {
+            "barrier": threading.Barrier(len(participants), timeout=self.timeout),
+            "users": participants,
+            "release_times": {},
+        }
+
+    def run(self, steps):
+        """Run every user's step concurrently and collect the outcome.
+
+        Args:
+            steps (dict): user name -> callable(UserSession) returning any result
+
+        Returns:
+            dict: Orchestration outcome:
+                - 'users': {name: {'result', 'error', 'started_at', 'finished_at',
+                            'duration', 'sync_points'}}
+                - 'barriers': {name: {'release_times', 'skew_ms'}}
+                - 'all_succeeded': bool
+                - 'wall_time': float seconds for the whole run
+        """
+        for barrier in self.barriers.values():
+            barrier["barrier"].reset()
+            barrier["release_times"].clear()
+
+        run_started = time.perf_counter()
+        futures = {}
+        for name, step in steps.items():
+            user = self.users[name]
+            session = UserSession(self, name, user["target"])
+            futures[name] = (user["thread"].submit(self._run_step, session, step), session)
+
+        users = {}
+        for name, (future, session) in futures.items():
+            users[name] = future.result(timeout=self.timeout * max(1, len(futures)))
+
+        barriers = {}
+        for barrier_name, barrier in self.barriers.items():
+            times = dict(barrier["release_times"])
+            skew = (max(times.values()) - min(times.values())) * 1000 if len(times) > 1 else None
+            barriers[barrier_name] = {"release_times": times, "skew_ms": skew}
+            if skew is not None:
+                logger.info(f"Barrier '{barrier_name}' release skew: {skew:.2f}ms")
+
+        outcome = {
+            "users": users,
+            "barriers": barriers,
+            "all_succeeded": all(user["error"] is None for user in users.values()),
+            "wall_time": time.perf_counter() - run_started,
+        }
+        logger.info(
+            f"Orchestrated {len(users)} users in {outcome['wall_time']:.2f}s "
+            f"(all_succeeded={outcome['all_succeeded']})"
+        )
+        return outcome
+
+    def _run_step(self, session, step):
+        """Execute one user's step on its driver thread and time it."""
+        if hasattr(session.target, "activate"):
+            session.target.activate()
+
+        started = time.perf_counter()
+        result, error = None, None
+        try:
+            result = step(session)
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)}"
+            logger.error(f"User '{session.name}' step failed: {error}")
+            self._abort_barriers_for(session.name)
+        finished = time.perf_counter()
+
+        return {
+            "result": result,
+            "error": error,
+            "started_at": started,
+            "finished_at": finished,
+            "duration": finished - started,
+            "sync_points": dict(session.sync_points),
+        }
+
+    def _abort_barriers_for(self, user_name):
+        """Break barriers a failed user would never reach so others stop waiting."""
+        for barrier in self.barriers.values():
+            if user_name in barrier["users"]:
+                barrier["barrier"].abort()
+
+    def shutdown(self):
+        """Stop every driver thread. Drivers themselves are left open."""
+        for thread in self._threads.values():
+            thread.shutdown()
+        self._threads.clear()
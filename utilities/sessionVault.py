@@ -0,0 +1,263 @@
+"""Per-user, lock-protected session vault.
+
+Responsibility:
+- Store browser session cookies keyed by (base_url, user, browser)
+- Write entries atomically (temp file + rename) under an exclusive file lock,
+  so parallel xdist workers never clobber or half-read each other's entries
+- Keep a hot in-memory copy per process so repeated restores cost no disk I/O
+- Respect each cookie's real expiry; session cookies (no expiry) are kept
+  for SESSION_COOKIE_MAX_AGE_HOURS after they were saved
+- Inject cookies into a driver before its first navigation
+
+Entries are plain JSON files under .session_cookies/vault/.
+
+This utility does NOT:
+- Perform assertions
+- Log users in (see utilities.httpAuthenticator)
+- Know about pages or flows
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path, shared=False):
+    """Hold an OS-level lock on `<path>.lock` for the duration of the block.
+
+    Args:
+        path (Path): File being protected
+        shared (bool): Take a shared (read) lock instead of an exclusive one
+            (ignored on Windows, where every lock is exclusive)
+    """
+    lock_path = Path(f"{path}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+") as handle:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def atomic_write_json(path, data):
+    """Write JSON so readers see either the old or the new file, never a partial one."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def read_json(path):
+    """Read a JSON file, returning None if it does not exist or is unreadable."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read {path}: {str(e)}")
+        return None
+
+
+def inject_cookies(driver, base_url, cookies):
+    """Add cookies to a driver without requiring a prior page load.
+
+    Chromium drivers receive all cookies in one DevTools call
+    (Network.setCookies), so no navigation is needed. Other drivers must be
+    on the cookies' domain first, so the base URL is opened once.
+
+    Args:
+        driver: Selenium WebDriver
+        base_url (str): Application URL the cookies belong to
+        cookies (list): Cookie dicts in WebDriver format
+
+    Returns:
+        int: Number of cookies injected
+    """
+    if not cookies:
+        return 0
+
+    if hasattr(driver, "execute_cdp_cmd"):
+        host = urlparse(base_url).hostname
+        cdp_cookies = []
+        for cookie in cookies:
+            cdp_cookie = {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie.get("domain", host),
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+            }
+            if "expiry" in cookie:
+                cdp_cookie["expires"] = cookie["expiry"]
+            if cookie.get("sameSite"):
+                cdp_cookie["sameSite"] = cookie["sameSite"]
+            cdp_cookies.append(cdp_cookie)
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        return len(cdp_cookies)
+
+    driver.get(base_url)
+    injected = 0
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+            injected += 1
+        except Exception as e:
+            logger.warning(f"Could not add cookie '{cookie.get('name', 'unknown')}': {str(e)[:80]}")
+    return injected
+
+
+class SessionVault:
+    """Stores and restores session cookies per (base_url, user, browser)."""
+
+    VAULT_DIR = Path(__file__).parent.parent / ".session_cookies" / "vault"
+
+    # Lifetime of cookies without an expiry (browser-session cookies)
+    SESSION_COOKIE_MAX_AGE_HOURS = 24
+
+    # Hot cache shared by every vault instance in this process
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, vault_dir=None):
+        self.vault_dir = Path(vault_dir) if vault_dir else self.VAULT_DIR
+
+    @staticmethod
+    def key(base_url, user, browser):
+        """Cache key for a (base_url, user, browser) triple."""
+        return (base_url.rstrip("/").lower(), user, browser.lower())
+
+    def _path(self, key):
+        digest = hashlib.sha1("|".join(key).encode("utf-8")).hexdigest()[:20]
+        return self.vault_dir / f"{digest}.json"
+
+    def _live_cookies(self, entry, now=None):
+        """Cookies from an entry that have not expired yet."""
+        now = now or time.time()
+        session_deadline = entry["saved_at"] + self.SESSION_COOKIE_MAX_AGE_HOURS * 3600
+        live = []
+        for cookie in entry["cookies"]:
+            expiry = cookie.get("expiry", session_deadline)
+            if expiry > now:
+                live.append(cookie)
+        return live
+
+    def get(self, base_url, user, browser="chrome"):
+        """Return the stored, still-valid cookies for a user.
+
+        Returns:
+            list: Live cookie dicts, or None if nothing valid is stored
+        """
+        key = self.key(base_url, user, browser)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+
+        if entry is None:
+            path = self._path(key)
+            with file_lock(path, shared=True):
+                entry = read_json(path)
+            if entry is None:
+                logger.debug(f"No vault entry for user '{user}' at {base_url}")
+                return None
+            with self._cache_lock:
+                self._cache[key] = entry
+
+        cookies = self._live_cookies(entry)
+        if not cookies:
+            logger.info(f"Vault entry for user '{user}' has expired")
+            self.delete(base_url, user, browser)
+            return None
+        return cookies
+
+    def put(self, base_url, user, cookies, browser="chrome"):
+        """Store cookies for a user, replacing any previous entry.
+
+        Returns:
+            bool: True if the entry was written
+        """
+        if not cookies:
+            logger.warning(f"No cookies to store for user '{user}'")
+            return False
+
+        key = self.key(base_url, user, browser)
+        entry = {
+            "base_url": key[0],
+            "user": user,
+            "browser": key[2],
+            "saved_at": time.time(),
+            "cookies": cookies,
+        }
+        path = self._path(key)
+        try:
+            with file_lock(path):
+                atomic_write_json(path, entry)
+        except Exception as e:
+            logger.error(f"Error writing vault entry for user '{user}': {str(e)}")
+            return False
+
+        with self._cache_lock:
+            self._cache[key] = entry
+        logger.info(f"Stored {len(cookies)} cookies for user '{user}' ({key[2]}, {key[0]})")
+        return True
+
+    def delete(self, base_url, user, browser="chrome"):
+        """Remove a user's entry from the vault and the in-memory cache."""
+        key = self.key(base_url, user, browser)
+        with self._cache_lock:
+            self._cache.pop(key, None)
+        path = self._path(key)
+        with file_lock(path):
+            if path.exists():
+                path.unlink()
+
+    def restore(self, driver, base_url, user, browser="chrome"):
+        """Inject a user's stored cookies into a driver.
+
+        Returns:
+            bool: True if a valid session was found and injected
+        """
+        cookies = self.get(base_url, user, browser)
+        if not cookies:
+            return False
+        injected = inject_cookies(driver, base_url, cookies)
+        logger.info(f"Restored {injected} cookies for user '{user}' from vault")
+        return injected > 0
+
+    def capture(self, driver, base_url, user, browser="chrome"):
+        """Store the driver's current cookies for a user."""
+        return self.put(base_url, user, driver.get_cookies(), browser)
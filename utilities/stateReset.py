@@ -0,0 +1,191 @@
+"""Per-test account state reset over HTTP.
+
+Responsibility:
+- Clear a customer's cart, wishlist, compare list and extra saved
+  addresses with concurrent HTTP calls that reuse the customer's session
+  cookies (from the test's driver, or the vault via HttpAuthenticator)
+- Run resets in the background between tests: teardown schedules the
+  reset and returns immediately; the next test that needs the same
+  customer waits only for whatever is still running. Only for accounts
+  this process uses exclusively: wait() cannot see resets scheduled by
+  other xdist workers, and nothing waits for users logging in via the UI
+- Report how long resets took, overall and per part
+
+The compare list lives in a browser cookie, not on the server, so it is
+only cleared by reset() with a driver (deleting that cookie). Scheduled
+resets run without a driver and cover the server-side parts only.
+
+This utility does NOT:
+- Perform assertions
+- Replace UI tests of the cart / wishlist / address pages
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from utilities.customLogger import LoggerFactory
+from utilities.dataSeeder import DataSeeder
+from utilities.httpAuthenticator import HttpAuthenticator
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class StateResetService:
+    """Resets customer account state over HTTP, optionally in the background."""
+
+    PARTS = ("cart", "wishlist", "compare", "addresses")
+    SERVER_PARTS = ("cart", "wishlist", "addresses")
+    COMPARE_COOKIE = ".Nop.ComparedProducts"
+
+    def __init__(self, base_url=None, max_workers=4, keep_addresses=1):
+        """Initialize StateResetService.
+
+        Args:
+            base_url (str): Application URL (default: configured base URL)
+            max_workers (int): Concurrent HTTP calls per reset (default: 4)
+            keep_addresses (int): Saved addresses left in place (default: 1)
+        """
+        self.seeder = DataSeeder(base_url)
+        self.base_url = self.seeder.base_url
+        self.authenticator = HttpAuthenticator(self.base_url)
+        self.keep_addresses = keep_addresses
+        self._parts_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reset-part")
+        self._background = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reset")
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.stats = {"resets": 0, "failures": 0, "total_time": 0.0, "parts": {part: 0.0 for part in self.PARTS}}
+
+    def _client(self, cookies):
+        """A StoreClient on its own session carrying the given cookies.
+
+        Cookies are set without a domain: the session only talks to base_url,
+        and cookiejar would not match host-only 'localhost' cookies otherwise.
+        """
+        client = self.seeder.new_client()
+        for cookie in cookies:
+            client.session.cookies.set(cookie["name"], cookie["value"], path=cookie.get("path", "/"))
+        return client
+
+    def _run_part(self, part, cookies, driver):
+        started = time.perf_counter()
+        if part == "compare":
+            driver.delete_cookie(self.COMPARE_COOKIE)
+            removed = None
+        else:
+            client = self._client(cookies)
+            if part == "cart":
+                removed = client.clear_cart()
+            elif part == "wishlist":
+                removed = client.clear_wishlist()
+            else:
+                removed = client.delete_addresses(keep=self.keep_addresses)
+        return removed, time.perf_counter() - started
+
+    def reset(self, email, password=None, cookies=None, driver=None, parts=PARTS):
+        """Reset a customer's state now, running the parts concurrently.
+
+        Args:
+            email (str): Customer email (used for logging and the vault lookup)
+            password (str): Password, used to log in over HTTP when no cookies are given
+            cookies (list): WebDriver cookie dicts of an authenticated session
+            driver: WebDriver whose compare-list cookie should be cleared
+                (without one, 'compare' is skipped)
+            parts (tuple): Subset of PARTS to reset
+
+        Returns:
+            dict: {'email', 'removed': {part: count}, 'elapsed', 'errors': {part: message}}
+        """
+        started = time.perf_counter()
+        if driver is None:
+            parts = [part for part in parts if part in self.SERVER_PARTS]
+        if cookies is None and driver is not None:
+            cookies = driver.get_cookies()
+        if not cookies or not any(c["name"] == HttpAuthenticator.AUTH_COOKIE for c in cookies):
+            cookies = self.authenticator.get_auth_cookies(email, password) if password else None
+        if not cookies:
+            logger.warning(f"No authenticated session for {email} - state reset skipped")
+            return {"email": email, "removed": {}, "elapsed": 0.0, "errors": {"session": "not authenticated"}}
+
+        futures = {
+            part: self._parts_executor.submit(self._run_part, part, cookies, driver)
+            for part in parts
+        }
+        removed, errors = {}, {}
+        for part, future in futures.items():
+            try:
+                removed[part], part_elapsed = future.result()
+                with self._lock:
+                    self.stats["parts"][part] += part_elapsed
+            except Exception as e:
+                errors[part] = str(e)
+                logger.warning(f"Resetting {part} for {email} failed: {str(e)}")
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.stats["resets"] += 1
+            self.stats["failures"] += 1 if errors else 0
+            self.stats["total_time"] += elapsed
+        logger.info(f"Reset state for {email} in {elapsed:.2f}s: {removed}")
+        return {"email": email, "removed": removed, "elapsed": elapsed, "errors": errors}
+
+    def schedule(self, email, password=None, cookies=None, parts=SERVER_PARTS):
+        """Reset a customer's server-side state in the background and return immediately.
+
+        Pass cookies captured from the driver BEFORE it quits; the driver
+        itself is not used in the background (its compare-list cookie dies with it).
+        Every later user of the customer must call wait(email) first.
+
+        Returns:
+            Future: Resolves to the reset() result
+        """
+        future = self._background.submit(self.reset, email, password, cookies, None, parts)
+        with self._lock:
+            self._pending.setdefault(email, []).append(future)
+        return future
+
+    def wait(self, email, timeout=60):
+        """Block until the scheduled resets for the customer have finished.
+
+        Returns:
+            dict: The latest reset() result, or None if nothing was pending
+
+        Raises:
+            TimeoutError: If a reset is still running after timeout seconds
+                (it stays pending, so a later wait() sees it again)
+        """
+        with self._lock:
+            futures = list(self._pending.get(email, []))
+        if not futures:
+            return None
+        started = time.perf_counter()
+        _, not_done = wait(futures, timeout=timeout)
+        waited = time.perf_counter() - started
+        with self._lock:
+            remaining = [future for future in self._pending.get(email, []) if not future.done()]
+            if remaining:
+                self._pending[email] = remaining
+            else:
+                self._pending.pop(email, None)
+        if not_done:
+            logger.error(f"Background reset of {email} still running after {timeout}s")
+            raise TimeoutError(f"Background reset of {email} did not finish within {timeout}s")
+        if waited > 0.05:
+            logger.info(f"Waited {waited:.2f}s for the background reset of {email}")
+        return futures[-1].result()
+
+    def report(self):
+        """Summary of reset times.
+
+        Returns:
+            dict: {'resets', 'failures', 'total_time', 'mean_time', 'parts': {part: seconds}}
+        """
+        with self._lock:
+            resets = self.stats["resets"]
+            return dict(self.stats, parts=dict(self.stats["parts"]),
+                        mean_time=self.stats["total_time"] / resets if resets else 0.0)
+
+    def shutdown(self):
+        """Finish pending resets and stop the worker threads."""
+        self._background.shutdown(wait=True)
+        self._parts_executor.shutdown(wait=True)
@@ -0,0 +1,204 @@
+"""Sequential focus (tab) order of the current page, computed browser-side.
+
+Responsibility:
+- Compute the page's full TAB order in one script: focusable elements,
+  positive tabindex first (ascending, then document order), then
+  tabindex 0 / natively focusable elements in document order; skipping
+  disabled, inert, hidden, zero-size and tabindex="-1" elements and all
+  but one radio button per group
+- Verify a sample of that order with real TAB presses, sent as one
+  batched action sequence while a focus listener records where focus
+  actually went
+
+A whole keyboard-accessibility check costs three round-trips (analyze,
+press, read trace) however many fields the page has, instead of one
+round-trip per TAB press and per document.activeElement read.
+
+This utility does NOT:
+- Follow focus into iframes or shadow roots
+- Perform assertions
+"""
+
+from utilities.actionSequence import ActionSequence
+from utilities.customLogger import LoggerFactory
+
+
+logger = LoggerFactory.get_logger(__name__)
+
+
+class TabOrderAnalyzer:
+    """Computes and spot-checks the sequential focus navigation order."""
+
+    ANALYZE_SCRIPT = """
+        var prepare = arguments[0];
+        var candidates = document.querySelectorAll(
+            'a[href], area[href], button, input, select, textarea, iframe, summary, ' +
+            '[tabindex], [contenteditable=""], [contenteditable="true"]');
+
+        function isHidden(el) {
+            if (el.closest('[inert]')) { return true; }
+            if (!el.getClientRects().length) { return true; }
+            var style = window.getComputedStyle(el);
+            return style.visibility === 'hidden' || style.visibility === 'collapse';
+        }
+
+        function isDisabled(el) {
+            if (el.disabled) { return true; }
+            var fieldset = el.closest('fieldset[disabled]');
+            if (!fieldset) { return false; }
+            var legend = fieldset.querySelector(':scope > legend');
+            return !(legend && legend.contains(el));
+        }
+
+        function label(el) {
+            var text = el.getAttribute('aria-label') || el.getAttribute('placeholder') || '';
+            if (!text && el.labels && el.labels.length) { text = el.labels[0].textContent; }
+            if (!text && el.tagName === 'INPUT' && /^(submit|button|reset)$/.test(el.type)) { text = el.value; }
+            if (!text) { text = el.textContent; }
+            return (text || '').replace(/\\s+/g, ' ').trim().slice(0, 60);
+        }
+
+        var radioSeen = {}, positive = [], natural = [];
+        Array.prototype.forEach.call(candidates, function (el, domIndex) {
+            if (el.tagName === 'INPUT' && el.type === 'hidden') { return; }
+            if (el.tabIndex < 0 || isDisabled(el) || isHidden(el)) { return; }
+            if (el.tagName === 'INPUT' && el.type === 'radio' && el.name) {
+                var group = (el.form ? 'f' : 'd') + ':' + el.name;
+                var checked = el.form
+                    ? el.form.querySelector('input[type=radio][name="' + el.name + '"]:checked')
+                    : document.querySelector('input[type=radio][name="' + el.name + '"]:checked');
+                if (checked ? checked !== el : radioSeen[group]) { return; }
+                radioSeen[group] = true;
+            }
+            (el.tabIndex > 0 ? positive : natural).push({el: el, dom: domIndex});
+        });
+        positive.sort(function (a, b) { return a.el.tabIndex - b.el.tabIndex || a.dom - b.dom; });
+        var ordered = positive.concat(natural).map(function (entry) { return entry.el; });
+
+        window.__tabOrder = ordered;
+        window.__tabOrderTrace = [];
+        if (prepare && ordered.length) {
+            if (!window.__tabOrderListener) {
+                window.__tabOrderListener = function (event) {
+                    window.__tabOrderTrace.push((window.__tabOrder || []).indexOf(event.target));
+                };
+                document.addEventListener('focusin', window.__tabOrderListener, true);
+            }
+            ordered[0].focus();
+            window.__tabOrderTrace = [];
+        }
+
+        return ordered.map(function (el, index) {
+            return {index: index, tag: el.tagName.toLowerCase(), id: el.id || null,
+                    name: el.getAttribute('name'), type: el.getAttribute('type'),
+                    tabindex: el.tabIndex, label: label(el)};
+        });
+    """
+
+    READ_TRACE_SCRIPT = "return window.__tabOrderTrace || [];"
+
+    def __init__(self, driver):
+        """Initialize TabOrderAnalyzer.
+
+        Args:
+            driver: Selenium WebDriver on the page to analyze
+        """
+        self.driver = driver
+
+    def analyze(self, prepare=False):
+        """Compute the page's tab order.
+
+        Args:
+            prepare (bool): Also focus the first element and start recording focus moves
+
+        Returns:
+            list: Descriptors {'index', 'tag', 'id', 'name', 'type', 'tabindex', 'label'}
+        """
+        order = self.driver.execute_script(self.ANALYZE_SCRIPT, prepare)
+        logger.info(f"Computed tab order: {len(order)} focusable elements")
+        return order
+
+    def verify(self, sample_size=5):
+        """Compute the order, then press TAB sample_size times and compare.
+
+        The focus trace is reduced to the distinct positions it visited:
+        focus events on elements outside the computed order (index -1, e.g.
+        a focusable child the browser reaches first) and repeated events on
+        the same element are reported as warnings, not mismatches.
+
+        Args:
+            sample_size (int): TAB presses to verify (capped at the order length - 1)
+
+        Returns:
+            dict: {'success': bool, 'order': [...], 'count': int,
+                   'expected': [indexes], 'observed': [indexes],
+                   'mismatches': [{'step', 'expected', 'observed'}],
+                   'warnings': [str], 'round_trips': int, 'error': str|None}
+        """
+        try:
+            order = self.analyze(prepare=True)
+        except Exception as e:
+            logger.error(f"Tab order analysis failed: {str(e)}")
+            return self._result(False, [], [], [], 1, str(e))
+
+        presses = max(0, min(sample_size, len(order) - 1))
+        expected = list(range(1, presses + 1))
+        if not presses:
+            return self._result(False, order, expected, [], 1, "Fewer than two focusable elements")
+
+        sequence = ActionSequence(self.driver).tab(presses).perform()
+        if not sequence["success"]:
+            return self._result(False, order, expected, [], 1 + sequence["round_trips"], sequence["error"])
+
+        observed, warnings = self._positions(self.driver.execute_script(self.READ_TRACE_SCRIPT))
+        if len(observed) > presses:
+            warnings.append(f"{len(observed) - presses} focus moves beyond the {presses} TAB presses")
+        round_trips = 2 + sequence["round_trips"]
+        return self._result(
+            observed[:presses] == expected, order, expected, observed[:presses], round_trips, None, warnings
+        )
+
+    @staticmethod
+    def _positions(trace):
+        """Distinct tab-order positions in a focus trace, plus warnings for the rest."""
+        positions, warnings = [], []
+        for step, index in enumerate(trace, 1):
+            if index < 0:
+                warnings.append(f"Focus event {step} on an element outside the computed order")
+            elif positions and positions[-1] == index:
+                warnings.append(f"Focus event {step} repeated position {index}")
+            else:
+                positions.append(index)
+        return positions, warnings
+
+    def _result(self, success, order, expected, observed, round_trips, error, warnings=()):
+        mismatches = [
+            {
+                "step": step + 1,
+                "expected": order[want] if want < len(order) else None,
+                "observed": order[got] if 0 <= got < len(order) else None,
+            }
+            for step, (want, got) in enumerate(zip(expected, observed))
+            if want != got
+        ]
+        if len(observed) < len(expected):
+            mismatches.append({"step": len(observed) + 1, "expected": order[expected[len(observed)]], "observed": None})
+
+        if error:
+            logger.error(f"Tab order verification failed: {error}")
+        else:
+            logger.info(
+                f"Tab order verified {len(observed)}/{len(expected)} steps in {round_trips} round-trips "
+                f"({len(mismatches)} mismatches, {len(warnings)} warnings)"
+            )
+        return {
+            "success": success and not mismatches,
+            "order": order,
+            "count": len(order),
+            "expected": expected,
+            "observed": observed,
+            "mismatches": mismatches,
+            "warnings": list(warnings),
+            "round_trips": round_trips,
+            "error": error,
+        }